@@ -9,8 +9,13 @@ from alembic import context
 from config.config import settings
 from app.infrastructure.database.models.base import BaseModel
 from app.infrastructure.database.models import (  # noqa: F401
+    delivery_log,
+    event_publish_stages,
     event_registrations,
     events,
+    notification_outbox,
+    private_chat_pool,
+    telethon_entities,
     users,
 )
 
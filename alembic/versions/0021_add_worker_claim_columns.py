@@ -0,0 +1,51 @@
+"""add worker claim columns for reminders and private chat cleanup
+
+Revision ID: 0021_worker_claims
+Revises: 0020_event_reg_reminder
+Create Date: 2026-03-20 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0021_worker_claims"
+down_revision: Union[str, None] = "0020_event_reg_reminder"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "event_registrations",
+        sa.Column("reminder_claimed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "event_registrations",
+        sa.Column("reminder_claimed_by", sa.String(length=64), nullable=True),
+    )
+    op.add_column(
+        "events",
+        sa.Column(
+            "private_chat_cleanup_claimed_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "events",
+        sa.Column(
+            "private_chat_cleanup_claimed_by",
+            sa.String(length=64),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("events", "private_chat_cleanup_claimed_by")
+    op.drop_column("events", "private_chat_cleanup_claimed_at")
+    op.drop_column("event_registrations", "reminder_claimed_by")
+    op.drop_column("event_registrations", "reminder_claimed_at")
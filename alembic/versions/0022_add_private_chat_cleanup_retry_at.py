@@ -0,0 +1,32 @@
+"""add private chat cleanup retry at
+
+Revision ID: 0022_chat_cleanup_retry_at
+Revises: 0021_worker_claims
+Create Date: 2026-03-21 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0022_chat_cleanup_retry_at"
+down_revision: Union[str, None] = "0021_worker_claims"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "events",
+        sa.Column(
+            "private_chat_cleanup_retry_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("events", "private_chat_cleanup_retry_at")
@@ -0,0 +1,44 @@
+"""add telethon entities cache
+
+Revision ID: 0023_telethon_entities
+Revises: 0022_chat_cleanup_retry_at
+Create Date: 2026-03-22 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0023_telethon_entities"
+down_revision: Union[str, None] = "0022_chat_cleanup_retry_at"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "telethon_entities",
+        sa.Column("key", sa.String(length=128), nullable=False),
+        sa.Column("peer_type", sa.String(length=16), nullable=False),
+        sa.Column("entity_id", sa.BigInteger(), nullable=False),
+        sa.Column("access_hash", sa.BigInteger(), nullable=True),
+        sa.Column(
+            "updated",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    op.create_index(
+        "ix_telethon_entities_peer",
+        "telethon_entities",
+        ["peer_type", "entity_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_telethon_entities_peer", table_name="telethon_entities")
+    op.drop_table("telethon_entities")
@@ -0,0 +1,38 @@
+"""add private chat pool
+
+Revision ID: 0024_private_chat_pool
+Revises: 0023_telethon_entities
+Create Date: 2026-03-23 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0024_private_chat_pool"
+down_revision: Union[str, None] = "0023_telethon_entities"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "private_chat_pool",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("chat_id", sa.BigInteger(), nullable=False),
+        sa.Column("invite_link", sa.String(length=255), nullable=False),
+        sa.Column(
+            "created",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("chat_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("private_chat_pool")
@@ -0,0 +1,68 @@
+"""add delivery log
+
+Revision ID: 0027_delivery_log
+Revises: 0026_notification_outbox
+Create Date: 2026-03-26 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0027_delivery_log"
+down_revision: Union[str, None] = "0026_notification_outbox"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "delivery_log",
+        sa.Column("id", sa.BigInteger(), nullable=False),
+        sa.Column("event_id", sa.Integer(), nullable=True),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "kind",
+            sa.Enum(
+                "announcement",
+                "reminder",
+                name="deliverykind",
+                native_enum=False,
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "status",
+            sa.Enum(
+                "delivered",
+                "failed",
+                "rate_limited",
+                name="deliverystatus",
+                native_enum=False,
+            ),
+            nullable=False,
+        ),
+        sa.Column("latency_ms", sa.Integer(), nullable=True),
+        sa.Column("error_class", sa.String(length=128), nullable=True),
+        sa.Column(
+            "created",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_delivery_log_event_kind_user",
+        "delivery_log",
+        ["event_id", "kind", "user_id"],
+    )
+    op.create_index("ix_delivery_log_created", "delivery_log", ["created"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_delivery_log_created", table_name="delivery_log")
+    op.drop_index("ix_delivery_log_event_kind_user", table_name="delivery_log")
+    op.drop_table("delivery_log")
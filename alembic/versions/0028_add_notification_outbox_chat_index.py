@@ -0,0 +1,33 @@
+"""add notification outbox chat index
+
+Revision ID: 0028_notification_outbox_chat
+Revises: 0027_delivery_log
+Create Date: 2026-03-27 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0028_notification_outbox_chat"
+down_revision: Union[str, None] = "0027_delivery_log"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_notification_outbox_chat_pending",
+        "notification_outbox",
+        ["chat_id", "id"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_notification_outbox_chat_pending",
+        table_name="notification_outbox",
+    )
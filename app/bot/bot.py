@@ -5,8 +5,9 @@ from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
 from aiogram.filters import ExceptionTypeFilter
+from aiogram.fsm.storage.base import BaseStorage
 from aiogram.fsm.storage.memory import MemoryStorage
-from aiogram_dialog import setup_dialogs
+from aiogram_dialog import BgManagerFactory, setup_dialogs
 from aiogram_dialog.api.exceptions import UnknownIntent, UnknownState
 from fluentogram import TranslatorHub
 
@@ -17,43 +18,160 @@ from app.bot.handlers.event_chats import event_chats_router
 from app.bot.handlers.errors import on_unknown_intent, on_unknown_state
 from app.bot.i18n.translator_hub import create_translator_hub
 from app.bot.middlewares.database import DataBaseMiddleware
+from app.bot.middlewares.fsm_prefetch import FsmPrefetchMiddleware
 from app.bot.middlewares.i18n import TranslatorRunnerMiddleware
+from app.bot.middlewares.metrics import UpdateMetricsMiddleware, register_handler_metrics
 from app.infrastructure.cache.connect_to_redis import get_redis_pool
 from app.infrastructure.database.connect_to_pg import get_pg_pool
+from app.infrastructure.database.instrumentation import instrument_engine
+from app.infrastructure.metrics.loop_monitor import (
+    LoopMonitorConfig,
+    run_loop_monitor_loop,
+)
+from app.infrastructure.metrics.server import start_metrics_server
 from app.infrastructure.storage.storage.nats_storage import NatsStorage
 from app.infrastructure.storage.storage.nats_key_builder import NatsKeyBuilder
+from app.infrastructure.storage.storage.redis_storage import RedisStorage
 from app.infrastructure.storage.nats_connect import connect_to_nats
+from app.services.telegram.bot_api_metrics import BotApiMetricsMiddleware
+from app.services.telegram.entity_cache import TelethonEntityCache
 from app.services.telegram.event_chat_cleanup import run_event_chat_cleanup_loop
+from app.services.telegram.event_publishing import run_event_publishing_loop
 from app.services.telegram.event_reminders import run_event_reminders_loop
+from app.services.telegram.notification_outbox import run_notification_outbox_loop
+from app.services.telegram.private_chat_pool import run_private_chat_pool_loop
 from app.services.telegram.private_event_chats import EventPrivateChatService
-from config.config import settings
+from app.services.telegram.send_scheduler import (
+    SendScheduler,
+    register_send_scheduler_metrics,
+)
+from config.config import load_settings, settings
 
 logger = logging.getLogger(__name__)
 
 
+def _load_loop_monitor_config() -> LoopMonitorConfig:
+    # Called from a worker thread. A fresh settings instance picks up edits to
+    # the settings files without replacing the process-wide settings.
+    loop_monitor = load_settings().loop_monitor
+    return LoopMonitorConfig(
+        enabled=loop_monitor.enabled,
+        interval_seconds=loop_monitor.interval_seconds,
+        slow_callback_ms=loop_monitor.slow_callback_ms,
+    )
+
+
+def build_dispatcher(
+    *,
+    storage: BaseStorage,
+    metrics_enabled: bool = False,
+) -> tuple[Dispatcher, BgManagerFactory]:
+    # The routers are module-level, so this can only be called once per process.
+    dp = Dispatcher(storage=storage)
+
+    logger.info("Registering error handlers")
+    dp.errors.register(
+        on_unknown_intent,
+        ExceptionTypeFilter(UnknownIntent),
+    )
+    dp.errors.register(
+        on_unknown_state,
+        ExceptionTypeFilter(UnknownState),
+    )
+
+    logger.info("Including routers")
+    dp.include_routers(
+        commands_router,
+        event_chats_router,
+        start_dialog,
+        events_dialog,
+    )
+
+    logger.info("Including middlewares")
+    if isinstance(storage, RedisStorage) and storage.prefetch_data:
+        dp.update.outer_middleware(FsmPrefetchMiddleware())
+    dp.update.middleware(DataBaseMiddleware())
+    dp.update.middleware(TranslatorRunnerMiddleware())
+    dp.errors.middleware(DataBaseMiddleware())
+    dp.errors.middleware(TranslatorRunnerMiddleware())
+    if metrics_enabled:
+        dp.update.outer_middleware(UpdateMetricsMiddleware())
+        register_handler_metrics(commands_router, name="commands_router")
+        register_handler_metrics(event_chats_router, name="event_chats_router")
+        register_handler_metrics(start_dialog, name="start_dialog")
+        register_handler_metrics(events_dialog, name="events_dialog")
+
+    logger.info("Setting up dialogs")
+    bg_factory = setup_dialogs(dp)
+    return dp, bg_factory
+
+
 async def main():
     logger.info("Starting bot")
 
     nc = None
-    try:
-        nc, js = await connect_to_nats(servers=settings.nats.servers)
-        storage = await NatsStorage(
-            nc=nc,
-            js=js,
-            key_builder=NatsKeyBuilder(with_destiny=True, separator="_")
-        ).create_storage()
-        logger.info("Connected to NATS, using NATS FSM storage")
-    except Exception:
-        logger.exception(
-            "Failed to connect to NATS, falling back to in-memory FSM storage"
-        )
+    storage: BaseStorage
+    if settings.fsm.storage == "redis":
+        try:
+            storage = RedisStorage(
+                redis=await get_redis_pool(
+                    db=settings.redis.database,
+                    host=settings.redis.host,
+                    port=settings.redis.port,
+                    username=settings.redis_username,
+                    password=settings.redis_password,
+                ),
+                key_builder=NatsKeyBuilder(with_destiny=True, separator="_"),
+                state_ttl_seconds=settings.fsm.state_ttl_seconds,
+                data_ttl_seconds=settings.fsm.data_ttl_seconds,
+                prefetch_data=settings.fsm.prefetch_data,
+            )
+            logger.info("Connected to Redis, using Redis FSM storage")
+        except Exception:
+            logger.exception(
+                "Failed to connect to Redis, falling back to in-memory FSM storage"
+            )
+            storage = MemoryStorage()
+    elif settings.fsm.storage == "nats":
+        try:
+            nc, js = await connect_to_nats(servers=settings.nats.servers)
+            storage = await NatsStorage(
+                nc=nc,
+                js=js,
+                key_builder=NatsKeyBuilder(with_destiny=True, separator="_")
+            ).create_storage()
+            logger.info("Connected to NATS, using NATS FSM storage")
+        except Exception:
+            logger.exception(
+                "Failed to connect to NATS, falling back to in-memory FSM storage"
+            )
+            storage = MemoryStorage()
+    else:
+        logger.info("Using in-memory FSM storage")
         storage = MemoryStorage()
 
     bot = Bot(
         token=settings.bot_token,
         default=DefaultBotProperties(parse_mode=ParseMode(settings.bot.parse_mode))
     )
-    dp = Dispatcher(storage=storage)
+    send_scheduler = SendScheduler(
+        messages_per_second=settings.send_scheduler.messages_per_second,
+        private_chat_interval_seconds=(
+            settings.send_scheduler.private_chat_interval_seconds
+        ),
+        group_chat_interval_seconds=(
+            settings.send_scheduler.group_chat_interval_seconds
+        ),
+        max_retries=settings.send_scheduler.max_retries,
+    )
+    bot.session.middleware(send_scheduler)
+    if settings.metrics.enabled:
+        bot.session.middleware(BotApiMetricsMiddleware())
+        register_send_scheduler_metrics(send_scheduler)
+    dp, bg_factory = build_dispatcher(
+        storage=storage,
+        metrics_enabled=settings.metrics.enabled,
+    )
 
     cache_pool = None
     if settings.cache.use_cache:
@@ -77,7 +195,19 @@ async def main():
         port=settings.postgres.port,
         user=settings.postgres_user,
         password=settings.postgres_password,
+        pool_size=settings.postgres.pool_size,
+        max_overflow=settings.postgres.max_overflow,
+        prepare_threshold=settings.postgres.prepare_threshold,
+        prepared_max=settings.postgres.prepared_max,
+        pgbouncer=settings.postgres.pgbouncer,
     )
+    if settings.metrics.enabled:
+        instrument_engine(
+            db_engine,
+            slow_query_ms=settings.metrics.slow_query_ms,
+            explain_slow_queries=settings.metrics.explain_slow_queries,
+            slow_query_log_file=settings.metrics.slow_query_log_file or None,
+        )
     telethon_api_id_raw = settings.get("telethon_api_id")
     try:
         telethon_api_id = int(telethon_api_id_raw or 0)
@@ -87,6 +217,9 @@ async def main():
         api_id=telethon_api_id,
         api_hash=str(settings.get("telethon_api_hash") or ""),
         session=str(settings.get("telethon_session") or ""),
+        entity_cache=TelethonEntityCache(session_maker=db_session_maker),
+        session_maker=db_session_maker,
+        pool_size=settings.private_chat_pool.size,
     )
     private_chat_service_connected = await event_private_chat_service.connect()
     if not private_chat_service_connected:
@@ -94,38 +227,29 @@ async def main():
 
     translator_hub: TranslatorHub = create_translator_hub()
 
-    logger.info("Registering error handlers")
-    dp.errors.register(
-        on_unknown_intent,
-        ExceptionTypeFilter(UnknownIntent),
-    )
-    dp.errors.register(
-        on_unknown_state,
-        ExceptionTypeFilter(UnknownState),
-    )
-
-    logger.info("Including routers")
-    dp.include_routers(
-        commands_router,
-        event_chats_router,
-        start_dialog,
-        events_dialog,
-    )
-
-    logger.info("Including middlewares")
-    dp.update.middleware(DataBaseMiddleware())
-    dp.update.middleware(TranslatorRunnerMiddleware())
-    dp.errors.middleware(DataBaseMiddleware())
-    dp.errors.middleware(TranslatorRunnerMiddleware())
-
-    logger.info("Setting up dialogs")
-    bg_factory = setup_dialogs(dp)
-
     cleanup_task: asyncio.Task | None = None
+    chat_pool_task: asyncio.Task | None = None
     reminder_task: asyncio.Task | None = None
+    publishing_task: asyncio.Task | None = None
+    outbox_task: asyncio.Task | None = None
+    loop_monitor_task: asyncio.Task | None = None
+    metrics_runner = None
 
     # Launch polling
     try:
+        if settings.metrics.enabled:
+            metrics_runner = await start_metrics_server(
+                host=settings.metrics.host,
+                port=settings.metrics.port,
+            )
+            loop_monitor_task = asyncio.create_task(
+                run_loop_monitor_loop(
+                    load_config=_load_loop_monitor_config,
+                    config_refresh_seconds=(
+                        settings.loop_monitor.config_refresh_seconds
+                    ),
+                )
+            )
         reminder_task = asyncio.create_task(
             run_event_reminders_loop(
                 bot=bot,
@@ -133,13 +257,49 @@ async def main():
                 translator_hub=translator_hub,
             )
         )
+        outbox_task = asyncio.create_task(
+            run_notification_outbox_loop(
+                bot=bot,
+                session_maker=db_session_maker,
+                interval_seconds=settings.notification_outbox.interval_seconds,
+                batch_size=settings.notification_outbox.batch_size,
+                concurrency=settings.notification_outbox.concurrency,
+                max_attempts=settings.notification_outbox.max_attempts,
+            )
+        )
+        publishing_task = asyncio.create_task(
+            run_event_publishing_loop(
+                bot=bot,
+                session_maker=db_session_maker,
+                translator_hub=translator_hub,
+                event_private_chat_service=event_private_chat_service,
+                interval_seconds=settings.event_publishing.interval_seconds,
+                batch_size=settings.event_publishing.batch_size,
+                max_attempts=settings.event_publishing.max_attempts,
+                digest_enabled=settings.announcement_digest.enabled,
+                digest_max_events=settings.announcement_digest.max_events,
+            )
+        )
         if private_chat_service_connected:
             cleanup_task = asyncio.create_task(
                 run_event_chat_cleanup_loop(
                     session_maker=db_session_maker,
                     event_private_chat_service=event_private_chat_service,
+                    interval_seconds=settings.event_chat_cleanup.interval_seconds,
+                    batch_size=settings.event_chat_cleanup.batch_size,
+                    concurrency=settings.event_chat_cleanup.concurrency,
+                    delete_timeout_seconds=(
+                        settings.event_chat_cleanup.delete_timeout_seconds
+                    ),
                 )
             )
+            if event_private_chat_service.pool_enabled:
+                chat_pool_task = asyncio.create_task(
+                    run_private_chat_pool_loop(
+                        event_private_chat_service=event_private_chat_service,
+                        interval_seconds=settings.private_chat_pool.refill_interval_seconds,
+                    )
+                )
         await dp.start_polling(
             bot,
             bg_factory=bg_factory,
@@ -157,15 +317,44 @@ async def main():
                 await reminder_task
             except asyncio.CancelledError:
                 pass
+        if outbox_task is not None:
+            outbox_task.cancel()
+            try:
+                await outbox_task
+            except asyncio.CancelledError:
+                pass
+        if publishing_task is not None:
+            publishing_task.cancel()
+            try:
+                await publishing_task
+            except asyncio.CancelledError:
+                pass
         if cleanup_task is not None:
             cleanup_task.cancel()
             try:
                 await cleanup_task
             except asyncio.CancelledError:
                 pass
+        if chat_pool_task is not None:
+            chat_pool_task.cancel()
+            try:
+                await chat_pool_task
+            except asyncio.CancelledError:
+                pass
+        if loop_monitor_task is not None:
+            loop_monitor_task.cancel()
+            try:
+                await loop_monitor_task
+            except asyncio.CancelledError:
+                pass
+        if metrics_runner is not None:
+            await metrics_runner.cleanup()
         if nc is not None:
             await nc.close()
             logger.info('Connection to NATS closed')
+        if isinstance(storage, RedisStorage):
+            await storage.close()
+            logger.info('Connection to Redis FSM storage closed')
         await db_engine.dispose()
         logger.info('Connection to Postgres closed')
         await event_private_chat_service.disconnect()
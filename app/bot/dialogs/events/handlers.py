@@ -1,6 +1,6 @@
 import hashlib
 import logging
-from datetime import timezone
+from datetime import datetime, timedelta, timezone
 
 from aiogram.types import (
     CallbackQuery,
@@ -20,17 +20,20 @@ from app.bot.dialogs.events.constants import (
     EVENT_PUBLISH_TARGET_CHANNEL,
     EVENT_PUBLISH_TARGETS,
 )
+from app.bot.enums.event_publish_stages import EventPublishStage
 from app.bot.enums.roles import UserRole
-from app.bot.handlers.event_chats import ensure_event_private_chat
 from app.bot.states.events import EventsSG
 from app.infrastructure.database.database.db import DB
 from config.config import settings
 from app.bot.dialogs.events.utils import build_event_text
-from app.services.telegram.delivery_status import apply_delivery_error_status
-from app.utils.datetime import coerce_event_datetime, now_moscow, parse_event_datetime_input
+from app.utils.datetime import (
+    coerce_event_datetime,
+    now_moscow,
+    now_utc,
+    parse_event_datetime_input,
+)
 
 logger = logging.getLogger(__name__)
-EVENT_JOIN_CHAT_CALLBACK = "event_join_chat"
 EVENT_CHAT_START_PREFIX = "event_chat_"
 
 
@@ -38,6 +41,13 @@ def _get_events_channel() -> str | None:
     return settings.get("events_channel")
 
 
+def _get_broadcast_run_at() -> datetime | None:
+    # In digest mode the broadcast waits so later events join the same message.
+    if not settings.announcement_digest.enabled:
+        return None
+    return now_utc() + timedelta(seconds=settings.announcement_digest.window_seconds)
+
+
 def _is_edit_mode(dialog_manager: DialogManager) -> bool:
     return bool(dialog_manager.dialog_data.get("edit_mode"))
 
@@ -555,20 +565,6 @@ def _build_channel_post_link(chat, message_id: int) -> str | None:
     return None
 
 
-def _build_channel_post_link_by_id(
-    channel_id: int | None,
-    message_id: int | None,
-) -> str | None:
-    if not channel_id or not message_id:
-        return None
-    chat_id_str = str(channel_id)
-    if chat_id_str.startswith("-100"):
-        channel_id_str = chat_id_str[4:]
-    else:
-        channel_id_str = str(abs(channel_id))
-    return f"https://t.me/c/{channel_id_str}/{message_id}"
-
-
 async def _build_event_join_start_link(
     *,
     bot,
@@ -587,117 +583,6 @@ async def _build_event_join_start_link(
     return f"https://t.me/{username}?start={EVENT_CHAT_START_PREFIX}{event_id}"
 
 
-async def _send_event_announcement_to_user(
-    *,
-    bot,
-    i18n: TranslatorRunner,
-    user_id: int,
-    event_payload: dict[str, object],
-) -> None:
-    event_text = build_event_text(
-        {
-            "name": event_payload.get("name"),
-            "datetime": event_payload.get("event_datetime"),
-            "address": event_payload.get("address"),
-            "description": event_payload.get("description"),
-            "price": event_payload.get("price"),
-            "age_group": event_payload.get("age_group"),
-        },
-        i18n,
-    )
-    post_url = _build_channel_post_link_by_id(
-        event_payload.get("channel_id"),
-        event_payload.get("channel_message_id"),
-    )
-    event_id = event_payload.get("id")
-    keyboard_rows = []
-    if isinstance(event_id, int):
-        keyboard_rows.append(
-            [
-                InlineKeyboardButton(
-                    text=i18n.partner.event.join.chat.button(),
-                    callback_data=f"{EVENT_JOIN_CHAT_CALLBACK}:{event_id}",
-                )
-            ]
-        )
-    if post_url:
-        keyboard_rows.append(
-            [
-                InlineKeyboardButton(
-                    text=i18n.partner.event.view.post.button(),
-                    url=post_url,
-                )
-            ]
-        )
-    keyboard = (
-        InlineKeyboardMarkup(inline_keyboard=keyboard_rows)
-        if keyboard_rows
-        else None
-    )
-    photo_id = event_payload.get("photo_file_id")
-    if photo_id:
-        await bot.send_photo(
-            user_id,
-            photo=photo_id,
-            caption=event_text,
-            reply_markup=keyboard,
-        )
-    else:
-        await bot.send_message(
-            user_id,
-            text=event_text,
-            reply_markup=keyboard,
-        )
-
-
-async def _broadcast_event_announcement(
-    *,
-    bot,
-    i18n: TranslatorRunner,
-    db: DB,
-    event_payload: dict[str, object],
-) -> None:
-    user_ids = await db.users.get_active_user_ids_by_role(role=UserRole.USER)
-    for user_id in user_ids:
-        try:
-            await _send_event_announcement_to_user(
-                bot=bot,
-                i18n=i18n,
-                user_id=user_id,
-                event_payload=event_payload,
-            )
-        except Exception as exc:
-            await apply_delivery_error_status(
-                db=db,
-                user_id=user_id,
-                error=exc,
-            )
-            logger.warning(
-                "Failed to send event announcement to user_id=%s: %s",
-                user_id,
-                exc,
-            )
-
-
-def _build_event_payload(
-    *,
-    event_id: int,
-    data: dict[str, object],
-) -> dict[str, object]:
-    return {
-        "id": event_id,
-        "name": data.get("name") or "",
-        "event_datetime": data.get("datetime"),
-        "address": data.get("address") or "",
-        "description": data.get("description") or "",
-        "price": data.get("price"),
-        "age_group": data.get("age_group"),
-        "photo_file_id": data.get("photo_file_id"),
-        "channel_id": None,
-        "channel_message_id": None,
-    }
-
-
 async def _create_event_record(
     *,
     db: DB,
@@ -825,7 +710,6 @@ async def publish_event(
         )
         return
 
-    event_payload = _build_event_payload(event_id=event_id, data=data)
     channel_message = None
     try:
         if should_publish_to_channel and channel:
@@ -842,36 +726,26 @@ async def publish_event(
         await callback.answer(i18n.partner.event.publish.failed(), show_alert=True)
         return
 
-    if channel_message is not None:
-        event_payload["channel_id"] = channel_message.chat.id
-        event_payload["channel_message_id"] = channel_message.message_id
-
     await db.events.mark_event_published(
         event_id=event_id,
-        channel_id=event_payload.get("channel_id"),
-        channel_message_id=event_payload.get("channel_message_id"),
+        channel_id=channel_message.chat.id if channel_message is not None else None,
+        channel_message_id=(
+            channel_message.message_id if channel_message is not None else None
+        ),
     )
 
-    if event_private_chat_service is not None:
-        try:
-            await ensure_event_private_chat(
-                db=db,
-                event_id=event_id,
-                event_private_chat_service=event_private_chat_service,
-            )
-        except Exception as exc:
-            logger.warning(
-                "Failed to ensure private event chat on publish. event_id=%s, error=%s",
-                event_id,
-                exc,
-            )
-
+    # Chat provisioning and the broadcast run in the publishing worker once
+    # this transaction is committed, so the organizer gets an answer right away.
+    if event_private_chat_service is not None and event_private_chat_service.enabled:
+        await db.event_publish_stages.enqueue(
+            event_id=event_id,
+            stages=[EventPublishStage.PRIVATE_CHAT],
+        )
     if should_publish_to_bot:
-        await _broadcast_event_announcement(
-            bot=callback.bot,
-            i18n=i18n,
-            db=db,
-            event_payload=event_payload,
+        await db.event_publish_stages.enqueue(
+            event_id=event_id,
+            stages=[EventPublishStage.BROADCAST],
+            run_at=_get_broadcast_run_at(),
         )
 
     post_link = (
@@ -7,8 +7,7 @@ from fluentogram import TranslatorRunner
 
 from app.bot.enums.event_registrations import EventRegistrationStatus
 from app.infrastructure.database.database.db import DB
-from app.infrastructure.database.models.events import EventsModel
-from app.infrastructure.database.models.users import UsersModel
+from app.infrastructure.database.rows import EventSummary, UserSummary
 from app.utils.datetime import is_event_past
 
 EVENT_DIALOG_OPEN_CALLBACK = "event_dialog_open"
@@ -28,10 +27,10 @@ ORGANIZER_ALLOWED_STATUSES = {
 
 @dataclass(frozen=True)
 class EventDialogContext:
-    event: EventsModel
+    event: EventSummary
     participant_user_id: int
-    participant_record: UsersModel | None
-    organizer_record: UsersModel | None
+    participant_record: UserSummary | None
+    organizer_record: UserSummary | None
     registration_status: EventRegistrationStatus
 
     @property
@@ -129,7 +128,7 @@ async def has_participant_dialog_access(
     participant_user_id: int,
     event_id: int,
 ) -> bool:
-    event = await db.events.get_event_by_id(event_id=event_id)
+    event = await db.events.get_event_summary(event_id=event_id)
     if event is None or is_event_past(event.event_datetime):
         return False
 
@@ -150,7 +149,7 @@ async def has_organizer_dialog_access(
     event_id: int,
     participant_user_id: int,
 ) -> bool:
-    event = await db.events.get_event_by_id(event_id=event_id)
+    event = await db.events.get_event_summary(event_id=event_id)
     if event is None or event.organizer_user_id != organizer_user_id:
         return False
 
@@ -170,7 +169,7 @@ async def get_participant_dialog_context(
     participant_user_id: int,
     event_id: int,
 ) -> EventDialogContext | None:
-    event = await db.events.get_event_by_id(event_id=event_id)
+    event = await db.events.get_event_summary(event_id=event_id)
     if event is None or is_event_past(event.event_datetime):
         return None
 
@@ -181,8 +180,8 @@ async def get_participant_dialog_context(
     if registration is None or registration.status not in PARTICIPANT_ALLOWED_STATUSES:
         return None
 
-    participant_record = await db.users.get_user_record(user_id=participant_user_id)
-    organizer_record = await db.users.get_user_record(user_id=event.organizer_user_id)
+    participant_record = await db.users.get_user_summary(user_id=participant_user_id)
+    organizer_record = await db.users.get_user_summary(user_id=event.organizer_user_id)
     return EventDialogContext(
         event=event,
         participant_user_id=participant_user_id,
@@ -199,7 +198,7 @@ async def get_organizer_dialog_context(
     event_id: int,
     participant_user_id: int,
 ) -> EventDialogContext | None:
-    event = await db.events.get_event_by_id(event_id=event_id)
+    event = await db.events.get_event_summary(event_id=event_id)
     if event is None or event.organizer_user_id != organizer_user_id:
         return None
 
@@ -210,8 +209,8 @@ async def get_organizer_dialog_context(
     if registration is None or registration.status not in ORGANIZER_ALLOWED_STATUSES:
         return None
 
-    participant_record = await db.users.get_user_record(user_id=participant_user_id)
-    organizer_record = await db.users.get_user_record(user_id=organizer_user_id)
+    participant_record = await db.users.get_user_summary(user_id=participant_user_id)
+    organizer_record = await db.users.get_user_summary(user_id=organizer_user_id)
     return EventDialogContext(
         event=event,
         participant_user_id=participant_user_id,
@@ -67,7 +67,7 @@ async def get_hello(
     **kwargs,
 ) -> dict[str, str | bool]:
     username = event_from_user.full_name or event_from_user.username or i18n.stranger()
-    user_record = await db.users.get_user_record(user_id=event_from_user.id)
+    user_record = await db.users.get_user_summary(user_id=event_from_user.id)
 
     is_admin = bool(user_record and user_record.role == UserRole.ADMIN)
     is_user = bool(user_record and user_record.role == UserRole.USER)
@@ -146,7 +146,7 @@ async def get_admin_events(
     db: DB,
     **kwargs,
 ) -> dict[str, object]:
-    admin_record = await db.users.get_user_record(user_id=event_from_user.id)
+    admin_record = await db.users.get_user_summary(user_id=event_from_user.id)
     if not admin_record or admin_record.role != UserRole.ADMIN:
         return {
             "title": i18n.start.admin.events.title(),
@@ -156,7 +156,7 @@ async def get_admin_events(
             "back_button": i18n.back.button(),
         }
 
-    events = await db.events.list_by_organizer_upcoming(
+    events = await db.events.list_summaries_by_organizer_upcoming(
         organizer_user_id=event_from_user.id,
     )
     items: list[tuple[str, str]] = []
@@ -280,7 +280,7 @@ async def get_admin_event_details(
     db: DB,
     **kwargs,
 ) -> dict[str, object]:
-    admin_record = await db.users.get_user_record(user_id=event_from_user.id)
+    admin_record = await db.users.get_user_summary(user_id=event_from_user.id)
     if not admin_record or admin_record.role != UserRole.ADMIN:
         return {
             "event_details_text": i18n.partner.event.text.template(
@@ -386,7 +386,7 @@ async def get_admin_event_registrations(
     db: DB,
     **kwargs,
 ) -> dict[str, object]:
-    admin_record = await db.users.get_user_record(user_id=event_from_user.id)
+    admin_record = await db.users.get_user_summary(user_id=event_from_user.id)
     if not admin_record or admin_record.role != UserRole.ADMIN:
         return {
             "title": i18n.start.admin.registrations.pending.title(),
@@ -440,7 +440,7 @@ async def get_admin_confirmed_event_registrations(
     db: DB,
     **kwargs,
 ) -> dict[str, object]:
-    admin_record = await db.users.get_user_record(user_id=event_from_user.id)
+    admin_record = await db.users.get_user_summary(user_id=event_from_user.id)
     if not admin_record or admin_record.role != UserRole.ADMIN:
         return {
             "title": i18n.partner.event.registrations.confirmed.title(),
@@ -495,7 +495,7 @@ async def get_admin_registration_confirmed_details(
     db: DB,
     **kwargs,
 ) -> dict[str, object]:
-    admin_record = await db.users.get_user_record(user_id=event_from_user.id)
+    admin_record = await db.users.get_user_summary(user_id=event_from_user.id)
     is_admin = bool(admin_record and admin_record.role == UserRole.ADMIN)
     if not is_admin:
         return {
@@ -555,7 +555,7 @@ async def get_admin_registration_confirmed_details(
             "back_button": i18n.back.button(),
         }
 
-    user = await db.users.get_user_record(user_id=user_id)
+    user = await db.users.get_user_summary(user_id=user_id)
     username = _format_user_label(user_id, user.username if user else None)
     amount = reg.amount if reg.amount is not None else "-"
     status_text = _format_registration_status(
@@ -596,7 +596,7 @@ async def get_admin_registration_pending_details(
     db: DB,
     **kwargs,
 ) -> dict[str, object]:
-    admin_record = await db.users.get_user_record(user_id=event_from_user.id)
+    admin_record = await db.users.get_user_summary(user_id=event_from_user.id)
     is_admin = bool(admin_record and admin_record.role == UserRole.ADMIN)
     if not is_admin:
         return {
@@ -641,8 +641,8 @@ async def get_admin_registration_pending_details(
             "has_dialog_button": False,
         }
 
-    user = await db.users.get_user_record(user_id=user_id)
-    owner = await db.users.get_user_record(user_id=event.organizer_user_id)
+    user = await db.users.get_user_summary(user_id=user_id)
+    owner = await db.users.get_user_summary(user_id=event.organizer_user_id)
     username = f"@{user.username}" if user and user.username else f"id:{user_id}"
     owner_username = (
         f"@{owner.username}" if owner and owner.username else f"id:{event.organizer_user_id}"
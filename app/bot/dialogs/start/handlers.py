@@ -19,7 +19,7 @@ from app.bot.enums.event_registrations import EventRegistrationStatus
 from app.bot.handlers.event_chats import approve_event_registration_payment
 from app.bot.states.start import StartSG
 from app.infrastructure.database.database.db import DB
-from app.services.telegram.delivery_status import apply_delivery_error_status
+from app.services.telegram.notification_outbox import enqueue_message
 from app.services.telegram.private_event_chats import EventPrivateChatService
 
 
@@ -373,7 +373,6 @@ async def approve_pending_registration(
 ) -> None:
     db: DB = dialog_manager.middleware_data.get("db")
     i18n: TranslatorRunner = dialog_manager.middleware_data.get("i18n")
-    bot = callback.bot
     event_private_chat_service: EventPrivateChatService | None = (
         dialog_manager.middleware_data.get("event_private_chat_service")
     )
@@ -405,7 +404,6 @@ async def approve_pending_registration(
     approved = await approve_event_registration_payment(
         db=db,
         i18n=i18n,
-        bot=bot,
         event_id=event_id,
         user_id=user_id,
         event_private_chat_service=event_private_chat_service,
@@ -425,7 +423,6 @@ async def decline_pending_registration(
 ) -> None:
     db: DB = dialog_manager.middleware_data.get("db")
     i18n: TranslatorRunner = dialog_manager.middleware_data.get("i18n")
-    bot = callback.bot
 
     event_id = dialog_manager.dialog_data.get("selected_pending_event_id")
     user_id = dialog_manager.dialog_data.get("selected_registration_user_id")
@@ -450,15 +447,12 @@ async def decline_pending_registration(
         await callback.answer(i18n.partner.event.prepay.already.processed())
         return
 
-    if bot:
-        try:
-            await bot.send_message(user_id, i18n.partner.event.prepay.declined())
-        except Exception as exc:
-            await apply_delivery_error_status(
-                db=db,
-                user_id=user_id,
-                error=exc,
-            )
+    await enqueue_message(
+        db=db,
+        chat_id=user_id,
+        kind="prepay_declined",
+        text=i18n.partner.event.prepay.declined(),
+    )
 
     await callback.answer(i18n.partner.event.prepay.declined.partner())
     await dialog_manager.switch_to(StartSG.admin_event_registrations_list)
@@ -518,7 +512,9 @@ async def _send_event_dialog_message(
     )
     if not sent:
         return
-    await message.answer(i18n.partner.event.dialog.sent())
+    # Only queued: the outbox delivers it later, a chat already known to be
+    # unreachable is refused by relay_event_dialog_message.
+    await message.answer(i18n.partner.event.dialog.queued())
 
 
 async def relay_event_dialog_message(
@@ -557,6 +553,12 @@ async def relay_event_dialog_message(
     sender_record = (
         context.organizer_record if sender_is_organizer else context.participant_record
     )
+    recipient_record = (
+        context.participant_record if sender_is_organizer else context.organizer_record
+    )
+    if recipient_record is not None and not recipient_record.is_alive:
+        await message.answer(i18n.partner.event.dialog.send.failed())
+        return False
     sender_label = format_user_label(
         user_id=user.id,
         username=sender_record.username if sender_record else user.username,
@@ -573,18 +575,11 @@ async def relay_event_dialog_message(
         event_id=event_id,
         participant_user_id=participant_user_id,
     )
-    try:
-        await message.bot.send_message(
-            chat_id=recipient_user_id,
-            text=notification_text,
-            reply_markup=reply_markup,
-        )
-    except Exception as exc:
-        await apply_delivery_error_status(
-            db=db,
-            user_id=recipient_user_id,
-            error=exc,
-        )
-        await message.answer(i18n.partner.event.dialog.send.failed())
-        return False
+    await enqueue_message(
+        db=db,
+        chat_id=recipient_user_id,
+        kind="event_dialog_message",
+        text=notification_text,
+        reply_markup=reply_markup,
+    )
     return True
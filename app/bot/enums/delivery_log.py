@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class DeliveryKind(Enum):
+    ANNOUNCEMENT = "announcement"
+    REMINDER = "reminder"
+
+
+class DeliveryStatus(Enum):
+    DELIVERED = "delivered"
+    FAILED = "failed"
+    RATE_LIMITED = "rate_limited"
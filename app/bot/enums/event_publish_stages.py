@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class EventPublishStage(Enum):
+    PRIVATE_CHAT = "private_chat"
+    BROADCAST = "broadcast"
+
+
+class EventPublishStageStatus(Enum):
+    PENDING = "pending"
+    DONE = "done"
+    FAILED = "failed"
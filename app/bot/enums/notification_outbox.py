@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class NotificationOutboxStatus(Enum):
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"
@@ -1,8 +1,10 @@
+import asyncio
 import logging
+from pathlib import Path
 
-from aiogram import Router
-from aiogram.filters import Command, CommandStart
-from aiogram.types import CallbackQuery, Message
+from aiogram import Bot, Router
+from aiogram.filters import Command, CommandObject, CommandStart
+from aiogram.types import CallbackQuery, FSInputFile, Message
 from aiogram_dialog import DialogManager, StartMode
 from fluentogram import TranslatorRunner
 
@@ -18,12 +20,23 @@ from app.bot.handlers.event_chats import (
 from app.bot.states.start import StartSG
 from app.infrastructure.database.database.db import DB
 from app.infrastructure.database.models.users import UsersModel
+from app.infrastructure.metrics.profiling import (
+    DEFAULT_PROFILE_OUTPUT_DIR,
+    ProfileBusyError,
+    ProfileKind,
+    is_profile_running,
+    run_profile,
+)
 from app.services.telegram.private_event_chats import EventPrivateChatService
+from config.config import settings
 
 logger = logging.getLogger(__name__)
 
 commands_router = Router()
 
+# Keeps running profile tasks referenced until they finish.
+_profile_tasks: set[asyncio.Task] = set()
+
 
 @commands_router.message(CommandStart())
 async def process_start_command(
@@ -78,6 +91,112 @@ async def process_help_command(
     )
 
 
+def _parse_profile_args(args: str | None) -> tuple[ProfileKind, int] | None:
+    parts = (args or "").split()
+    if not parts or len(parts) > 2:
+        return None
+    try:
+        kind = ProfileKind(parts[0].lower())
+        duration_seconds = (
+            int(parts[1]) if len(parts) == 2 else settings.profiling.default_seconds
+        )
+    except ValueError:
+        return None
+    if not 1 <= duration_seconds <= settings.profiling.max_seconds:
+        return None
+    return kind, duration_seconds
+
+
+async def _send_profile(
+    *,
+    bot: Bot,
+    chat_id: int,
+    i18n: TranslatorRunner,
+    kind: ProfileKind,
+    duration_seconds: int,
+) -> None:
+    try:
+        artifact = await run_profile(
+            kind=kind,
+            duration_seconds=duration_seconds,
+            output_dir=(
+                Path(settings.profiling.output_dir)
+                if settings.profiling.output_dir
+                else DEFAULT_PROFILE_OUTPUT_DIR
+            ),
+            sample_interval_ms=settings.profiling.sample_interval_ms,
+        )
+    except ProfileBusyError:
+        await _send_profile_reply(bot=bot, chat_id=chat_id, text=i18n.profile.busy())
+        return
+    except Exception:
+        logger.exception("Failed to take %s profile", kind.value)
+        await _send_profile_reply(
+            bot=bot, chat_id=chat_id, text=i18n.profile.failed()
+        )
+        return
+
+    # Runs as a detached task, so nothing else would log a failed send.
+    try:
+        await bot.send_document(
+            chat_id=chat_id,
+            document=FSInputFile(artifact.path),
+            caption=i18n.profile.done(kind=kind.value),
+        )
+    except Exception:
+        logger.exception("Failed to send %s profile %s", kind.value, artifact.path)
+
+
+async def _send_profile_reply(*, bot: Bot, chat_id: int, text: str) -> None:
+    try:
+        await bot.send_message(chat_id=chat_id, text=text)
+    except Exception:
+        logger.exception("Failed to send profile reply to chat %d", chat_id)
+
+
+@commands_router.message(Command("profile"))
+async def process_profile_command(
+    message: Message,
+    command: CommandObject,
+    i18n: TranslatorRunner,
+    db: DB,
+) -> None:
+    if not message.from_user:
+        return
+
+    user = await db.users.get_user_summary(user_id=message.from_user.id)
+    if user is None or user.role != UserRole.ADMIN:
+        return
+
+    parsed = _parse_profile_args(command.args)
+    if parsed is None:
+        await message.answer(
+            i18n.profile.usage(max_seconds=settings.profiling.max_seconds)
+        )
+        return
+    if is_profile_running():
+        await message.answer(i18n.profile.busy())
+        return
+
+    kind, duration_seconds = parsed
+    # The profile outlives the update, so the handler does not hold its
+    # database session for the whole run.
+    task = asyncio.create_task(
+        _send_profile(
+            bot=message.bot,
+            chat_id=message.chat.id,
+            i18n=i18n,
+            kind=kind,
+            duration_seconds=duration_seconds,
+        )
+    )
+    _profile_tasks.add(task)
+    task.add_done_callback(_profile_tasks.discard)
+    await message.answer(
+        i18n.profile.started(kind=kind.value, seconds=duration_seconds)
+    )
+
+
 @commands_router.callback_query(
     lambda callback: callback.data
     and callback.data.startswith(f"{EVENT_DIALOG_OPEN_CALLBACK}:")
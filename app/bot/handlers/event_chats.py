@@ -13,7 +13,12 @@ from app.bot.enums.event_registrations import EventRegistrationStatus
 from app.bot.enums.roles import UserRole
 from app.infrastructure.database.database.db import DB
 from app.bot.states.admin_contact import AdminContactSG
-from app.services.telegram.delivery_status import apply_delivery_error_status
+from app.services.telegram.notification_outbox import (
+    ON_FAILURE_REVERT_PAYMENT_PROOF,
+    enqueue_document,
+    enqueue_message,
+    enqueue_photo,
+)
 from app.services.telegram.private_event_chats import EventPrivateChatService
 from app.utils.datetime import now_utc
 from config.config import settings
@@ -159,11 +164,10 @@ def _build_chat_link_keyboard(
     return InlineKeyboardMarkup(inline_keyboard=rows)
 
 
-async def _send_chat_link_notification(
+async def _enqueue_chat_link_notification(
     *,
-    bot,
     i18n: TranslatorRunner,
-    db: DB | None,
+    db: DB,
     user_id: int,
     topic_link: str,
     event_name: str | None,
@@ -178,23 +182,19 @@ async def _send_chat_link_notification(
             i18n.partner.event.join.chat.hint(),
         ]
     )
-    try:
-        await bot.send_message(user_id, text, reply_markup=keyboard)
-    except Exception as exc:
-        if db is not None:
-            await apply_delivery_error_status(
-                db=db,
-                user_id=user_id,
-                error=exc,
-            )
-        raise
+    await enqueue_message(
+        db=db,
+        chat_id=user_id,
+        kind="event_chat_link",
+        text=text,
+        reply_markup=keyboard,
+    )
 
 
-async def send_event_topic_link_to_user(
+async def enqueue_event_topic_link_to_user(
     *,
-    bot,
     i18n: TranslatorRunner,
-    db: DB | None = None,
+    db: DB,
     event,
     user_id: int,
     event_private_chat_service: EventPrivateChatService | None = None,
@@ -203,7 +203,6 @@ async def send_event_topic_link_to_user(
     topic_link = _get_event_topic_link(current_event)
     if (
         not topic_link
-        and db is not None
         and current_event is not None
         and event_private_chat_service is not None
     ):
@@ -215,8 +214,7 @@ async def send_event_topic_link_to_user(
         topic_link = _get_event_topic_link(current_event) if current_event else None
     if not topic_link:
         return
-    await _send_chat_link_notification(
-        bot=bot,
+    await _enqueue_chat_link_notification(
         i18n=i18n,
         db=db,
         user_id=user_id,
@@ -268,19 +266,17 @@ async def ensure_event_private_chat(
         )
         return event
 
-    await db.events.mark_event_private_chat(
+    return await db.events.mark_event_private_chat(
         event_id=event.id,
         chat_id=private_chat.chat_id,
         invite_link=private_chat.invite_link,
     )
-    return await db.events.get_event_by_id(event_id=event.id)
 
 
 async def approve_event_registration_payment(
     *,
     db: DB,
     i18n: TranslatorRunner,
-    bot,
     event_id: int,
     user_id: int,
     event_private_chat_service: EventPrivateChatService | None = None,
@@ -328,42 +324,19 @@ async def approve_event_registration_payment(
                 exc,
             )
 
-    if not bot:
-        return True
-
-    try:
-        await bot.send_message(
-            user_id,
-            i18n.partner.event.prepay.approved(),
-        )
-    except Exception as exc:
-        await apply_delivery_error_status(
-            db=db,
-            user_id=user_id,
-            error=exc,
-        )
-        logger.warning(
-            "Failed to notify user %s about approved prepay for event %s: %s",
-            user_id,
-            event_id,
-            exc,
-        )
-    try:
-        await send_event_topic_link_to_user(
-            bot=bot,
-            i18n=i18n,
-            db=db,
-            event=event_with_chat,
-            user_id=user_id,
-            event_private_chat_service=event_private_chat_service,
-        )
-    except Exception as exc:
-        logger.warning(
-            "Failed to send event topic link to user %s for event %s: %s",
-            user_id,
-            event_id,
-            exc,
-        )
+    await enqueue_message(
+        db=db,
+        chat_id=user_id,
+        kind="prepay_approved",
+        text=i18n.partner.event.prepay.approved(),
+    )
+    await enqueue_event_topic_link_to_user(
+        i18n=i18n,
+        db=db,
+        event=event_with_chat,
+        user_id=user_id,
+        event_private_chat_service=event_private_chat_service,
+    )
 
     return True
 
@@ -507,9 +480,7 @@ async def _send_prepay_message(
 
 async def _save_payment_proof_to_vault_channel(
     *,
-    message: Message,
-    event_id: int,
-    user_id: int,
+    db: DB,
     payment_proof_file_id: str,
     payment_proof_type: str,
     caption: str,
@@ -518,31 +489,30 @@ async def _save_payment_proof_to_vault_channel(
     if vault_channel is None:
         return
 
-    try:
-        if payment_proof_type == PAYMENT_PROOF_TYPE_PHOTO:
-            await message.bot.send_photo(
-                chat_id=vault_channel,
-                photo=payment_proof_file_id,
-                caption=caption,
-            )
-            return
-        if payment_proof_type == PAYMENT_PROOF_TYPE_DOCUMENT:
-            await message.bot.send_document(
-                chat_id=vault_channel,
-                document=payment_proof_file_id,
-                caption=caption,
-            )
-            return
-        await message.bot.send_message(chat_id=vault_channel, text=caption)
-    except Exception as exc:
-        logger.warning(
-            "Failed to save payment proof to vault channel. event_id=%s, user_id=%s, "
-            "channel=%s, error=%s",
-            event_id,
-            user_id,
-            vault_channel,
-            exc,
+    if payment_proof_type == PAYMENT_PROOF_TYPE_PHOTO:
+        await enqueue_photo(
+            db=db,
+            chat_id=vault_channel,
+            kind="payment_proof_vault",
+            photo=payment_proof_file_id,
+            caption=caption,
         )
+        return
+    if payment_proof_type == PAYMENT_PROOF_TYPE_DOCUMENT:
+        await enqueue_document(
+            db=db,
+            chat_id=vault_channel,
+            kind="payment_proof_vault",
+            document=payment_proof_file_id,
+            caption=caption,
+        )
+        return
+    await enqueue_message(
+        db=db,
+        chat_id=vault_channel,
+        kind="payment_proof_vault",
+        text=caption,
+    )
 
 
 async def _maybe_start_registration(
@@ -563,6 +533,18 @@ async def _maybe_start_registration(
         await message.answer(i18n.partner.event.join.chat.self.forbidden())
         return
 
+    # Insert first: a new registration is the common case here, and an existing
+    # one is only looked up when the insert hits the conflict.
+    registration = await db.event_registrations.create(
+        event_id=event.id,
+        user_id=user_id,
+        status=EventRegistrationStatus.PENDING_PAYMENT,
+        amount=_calc_prepay_amount(event),
+    )
+    if registration is not None:
+        await _send_prepay_message(message=message, i18n=i18n, event=event)
+        return
+
     registration = await db.event_registrations.get_by_user_event(
         event_id=event.id,
         user_id=user_id,
@@ -598,14 +580,6 @@ async def _maybe_start_registration(
         await message.answer(i18n.partner.event.prepay.waiting())
         return
 
-    amount = _calc_prepay_amount(event)
-    if registration is None:
-        await db.event_registrations.create(
-            event_id=event.id,
-            user_id=user_id,
-            status=EventRegistrationStatus.PENDING_PAYMENT,
-            amount=amount,
-        )
     await _send_prepay_message(message=message, i18n=i18n, event=event)
 
 
@@ -886,7 +860,15 @@ async def process_event_payment_proof(
         return
     payment_proof_file_id, payment_proof_type = payment_proof
 
-    moved_to_pending = (
+    # The organizer notice goes through the outbox, so an organizer already known
+    # to be unreachable is reported now instead of after a failed delivery.
+    organizer_record = await db.users.get_user_record(user_id=event.organizer_user_id)
+    if organizer_record is not None and not organizer_record.is_alive:
+        await state.clear()
+        await message.answer(i18n.partner.event.prepay.admin.missing())
+        return
+
+    moved_to_pending, current_status = (
         await db.event_registrations.attach_payment_proof_and_move_to_pending_if_current(
             event_id=event_id,
             user_id=user.id,
@@ -895,15 +877,8 @@ async def process_event_payment_proof(
         )
     )
     if not moved_to_pending:
-        current_registration = await db.event_registrations.get_by_user_event(
-            event_id=event_id,
-            user_id=user.id,
-        )
         await state.clear()
-        if (
-            current_registration
-            and current_registration.status == EventRegistrationStatus.PAID_CONFIRM_PENDING
-        ):
+        if current_status == EventRegistrationStatus.PAID_CONFIRM_PENDING:
             await message.answer(i18n.partner.event.prepay.waiting())
             return
         await message.answer(i18n.partner.event.prepay.already.processed())
@@ -914,7 +889,6 @@ async def process_event_payment_proof(
         fallback_name=user.full_name,
         user_id=user.id,
     )
-    organizer_record = await db.users.get_user_record(user_id=event.organizer_user_id)
     organizer_username = _format_username(
         username=organizer_record.username if organizer_record else None,
         user_id=event.organizer_user_id,
@@ -946,63 +920,50 @@ async def process_event_payment_proof(
     )
 
     await _save_payment_proof_to_vault_channel(
-        message=message,
-        event_id=event_id,
-        user_id=user.id,
+        db=db,
         payment_proof_file_id=payment_proof_file_id,
         payment_proof_type=payment_proof_type,
         caption=notify_text,
     )
 
     organizer_user_id = event.organizer_user_id
-    try:
-        if payment_proof_type == PAYMENT_PROOF_TYPE_PHOTO:
-            await message.bot.send_photo(
-                organizer_user_id,
-                photo=payment_proof_file_id,
-                caption=notify_text,
-                reply_markup=keyboard,
-            )
-        elif payment_proof_type == PAYMENT_PROOF_TYPE_DOCUMENT:
-            await message.bot.send_document(
-                organizer_user_id,
-                document=payment_proof_file_id,
-                caption=notify_text,
-                reply_markup=keyboard,
-            )
-        else:
-            await message.bot.send_message(
-                organizer_user_id,
-                notify_text,
-                reply_markup=keyboard,
-            )
-    except Exception as exc:
-        await apply_delivery_error_status(
+    # If the organizer can not be reached the dispatcher moves the registration
+    # back to pending payment and tells the payer.
+    on_failure = {
+        "action": ON_FAILURE_REVERT_PAYMENT_PROOF,
+        "event_id": event_id,
+        "user_id": user.id,
+        "notify_text": i18n.partner.event.prepay.admin.missing(),
+    }
+    if payment_proof_type == PAYMENT_PROOF_TYPE_PHOTO:
+        await enqueue_photo(
             db=db,
-            user_id=organizer_user_id,
-            error=exc,
+            chat_id=organizer_user_id,
+            kind="prepay_organizer_notify",
+            photo=payment_proof_file_id,
+            caption=notify_text,
+            reply_markup=keyboard,
+            on_failure=on_failure,
         )
-        logger.warning(
-            "Failed to notify organizer %s about payment confirmation for event %s: %s",
-            organizer_user_id,
-            event_id,
-            exc,
+    elif payment_proof_type == PAYMENT_PROOF_TYPE_DOCUMENT:
+        await enqueue_document(
+            db=db,
+            chat_id=organizer_user_id,
+            kind="prepay_organizer_notify",
+            document=payment_proof_file_id,
+            caption=notify_text,
+            reply_markup=keyboard,
+            on_failure=on_failure,
         )
-        reverted = await db.event_registrations.update_status_if_current(
-            event_id=event_id,
-            user_id=user.id,
-            current_status=EventRegistrationStatus.PAID_CONFIRM_PENDING,
-            new_status=EventRegistrationStatus.PENDING_PAYMENT,
+    else:
+        await enqueue_message(
+            db=db,
+            chat_id=organizer_user_id,
+            kind="prepay_organizer_notify",
+            text=notify_text,
+            reply_markup=keyboard,
+            on_failure=on_failure,
         )
-        if not reverted:
-            logger.warning(
-                "Failed to revert prepay status after notification errors for event %s and user %s",
-                event_id,
-                user.id,
-            )
-        await state.clear()
-        await message.answer(i18n.partner.event.prepay.admin.missing())
-        return
 
     status_keyboard = InlineKeyboardMarkup(
         inline_keyboard=[
@@ -1072,7 +1033,6 @@ async def process_event_prepay_confirm(
         approved = await approve_event_registration_payment(
             db=db,
             i18n=i18n,
-            bot=callback.bot,
             event_id=event_id,
             user_id=user_id,
             event_private_chat_service=event_private_chat_service,
@@ -1092,16 +1052,10 @@ async def process_event_prepay_confirm(
     if not declined:
         await callback.answer(i18n.partner.event.prepay.already.processed())
         return
-    if callback.bot:
-        try:
-            await callback.bot.send_message(
-                user_id,
-                i18n.partner.event.prepay.declined(),
-            )
-        except Exception as exc:
-            await apply_delivery_error_status(
-                db=db,
-                user_id=user_id,
-                error=exc,
-            )
+    await enqueue_message(
+        db=db,
+        chat_id=user_id,
+        kind="prepay_declined",
+        text=i18n.partner.event.prepay.declined(),
+    )
     await callback.answer(i18n.partner.event.prepay.declined.partner())
@@ -0,0 +1,23 @@
+from typing import Any, Awaitable, Callable, Dict
+
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+
+from app.infrastructure.storage.storage.redis_storage import RedisStorage
+
+
+class FsmPrefetchMiddleware(BaseMiddleware):
+    # Runs inside aiogram's FSM middleware. Data the Redis storage prefetched with
+    # the state is dropped when the update ends, so it is never served later.
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        try:
+            return await handler(event, data)
+        finally:
+            storage = data.get("fsm_storage")
+            if isinstance(storage, RedisStorage):
+                storage.clear_prefetched()
@@ -0,0 +1,96 @@
+import time
+from typing import Any, Awaitable, Callable, Dict
+
+from aiogram import BaseMiddleware, Router
+from aiogram.types import TelegramObject, Update
+from aiogram_dialog.api.internal import CONTEXT_KEY
+
+from app.infrastructure.database.instrumentation import count_queries, current_query_count
+from app.infrastructure.metrics.metrics import (
+    HANDLER_DB_QUERIES,
+    HANDLER_DURATION,
+    HANDLER_ERRORS,
+    UPDATE_DB_QUERIES,
+    UPDATE_DURATION,
+    UPDATE_ERRORS,
+    UPDATES_IN_FLIGHT,
+)
+
+NO_STATE_LABEL = "-"
+
+
+def _get_state_label(data: Dict[str, Any]) -> str:
+    context = data.get(CONTEXT_KEY)
+    state = getattr(context, "state", None)
+    if state is not None:
+        return state.state
+    return data.get("raw_state") or NO_STATE_LABEL
+
+
+class UpdateMetricsMiddleware(BaseMiddleware):
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: Update,
+        data: Dict[str, Any]
+    ) -> Any:
+        update_type = event.event_type
+        in_flight = UPDATES_IN_FLIGHT.labels(update_type)
+        in_flight.inc()
+        started_at = time.perf_counter()
+        with count_queries() as queries:
+            try:
+                return await handler(event, data)
+            except Exception as exc:
+                UPDATE_ERRORS.labels(update_type, type(exc).__name__).inc()
+                raise
+            finally:
+                UPDATE_DURATION.labels(update_type).observe(
+                    time.perf_counter() - started_at
+                )
+                UPDATE_DB_QUERIES.labels(update_type).observe(queries.queries)
+                in_flight.dec()
+
+
+class HandlerMetricsMiddleware(BaseMiddleware):
+    def __init__(self, *, router_name: str, event_type: str) -> None:
+        self.router_name = router_name
+        self.event_type = event_type
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        state = _get_state_label(data)
+        queries_before = current_query_count()
+        started_at = time.perf_counter()
+        try:
+            return await handler(event, data)
+        except Exception as exc:
+            HANDLER_ERRORS.labels(
+                self.router_name,
+                self.event_type,
+                state,
+                type(exc).__name__,
+            ).inc()
+            raise
+        finally:
+            HANDLER_DURATION.labels(self.router_name, self.event_type, state).observe(
+                time.perf_counter() - started_at
+            )
+            HANDLER_DB_QUERIES.labels(self.router_name, self.event_type, state).observe(
+                current_query_count() - queries_before
+            )
+
+
+def register_handler_metrics(router: Router, *, name: str) -> None:
+    # Inner middlewares run only for the handler that matched, so the router
+    # label points at the code that actually handled the update.
+    for event_type, observer in router.observers.items():
+        if event_type == "error":
+            continue
+        observer.middleware(
+            HandlerMetricsMiddleware(router_name=name, event_type=event_type)
+        )
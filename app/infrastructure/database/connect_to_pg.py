@@ -1,6 +1,6 @@
 import logging
 
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 
 logger = logging.getLogger(__name__)
@@ -12,23 +12,45 @@ async def get_pg_pool(
     port: int,
     user: str,
     password: str,
+    pool_size: int = 1,
+    max_overflow: int = 2,
+    prepare_threshold: int | None = 5,
+    prepared_max: int = 100,
+    pgbouncer: bool = False,
 ) -> tuple[AsyncEngine, async_sessionmaker]:
 
     try:
         database_url = f'postgresql+psycopg://{user}:{password}@{host}:{port}/{db_name}'
+        if pgbouncer:
+            # Transaction pooling hands every transaction to a random server
+            # connection, so statements prepared on one are missing on another.
+            prepare_threshold = None
         engine = create_async_engine(
             database_url,
-            pool_size=1,
-            max_overflow=2,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
             pool_pre_ping=True,
+            connect_args={"prepare_threshold": prepare_threshold},
         )
 
+        @event.listens_for(engine.sync_engine, "connect")
+        def _set_prepared_max(dbapi_connection, connection_record) -> None:
+            dbapi_connection.driver_connection.prepared_max = prepared_max
+
         async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
 
         async with engine.connect() as connection:
             result = await connection.execute(text("SELECT version();"))
             db_version = result.scalar_one()
             logger.info("Connected to %s", db_version)
+            logger.info(
+                "Postgres pool: pool_size=%d, max_overflow=%d, prepare_threshold=%s, "
+                "pgbouncer=%s",
+                pool_size,
+                max_overflow,
+                prepare_threshold,
+                pgbouncer,
+            )
 
         return engine, async_session_maker
     except Exception as e:
@@ -1,7 +1,12 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.infrastructure.database.database.delivery_log import _DeliveryLogDB
+from app.infrastructure.database.database.event_publish_stages import _EventPublishStagesDB
 from app.infrastructure.database.database.event_registrations import _EventRegistrationsDB
 from app.infrastructure.database.database.events import _EventsDB
+from app.infrastructure.database.database.notification_outbox import _NotificationOutboxDB
+from app.infrastructure.database.database.private_chat_pool import _PrivateChatPoolDB
+from app.infrastructure.database.database.telethon_entities import _TelethonEntitiesDB
 from app.infrastructure.database.database.users import _UsersDB
 
 
@@ -10,3 +15,8 @@ class DB:
         self.users = _UsersDB(session=session)
         self.events = _EventsDB(session=session)
         self.event_registrations = _EventRegistrationsDB(session=session)
+        self.telethon_entities = _TelethonEntitiesDB(session=session)
+        self.private_chat_pool = _PrivateChatPoolDB(session=session)
+        self.event_publish_stages = _EventPublishStagesDB(session=session)
+        self.notification_outbox = _NotificationOutboxDB(session=session)
+        self.delivery_log = _DeliveryLogDB(session=session)
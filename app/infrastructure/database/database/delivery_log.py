@@ -0,0 +1,40 @@
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.database.instrumentation import instrument_repository
+
+logger = logging.getLogger(__name__)
+
+_COPY_COLUMNS = ("event_id", "user_id", "kind", "status", "latency_ms", "error_class")
+
+
+@instrument_repository
+class _DeliveryLogDB:
+    __tablename__ = "delivery_log"
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def copy_records(
+        self,
+        *,
+        records: list[tuple[int | None, int, str, str, int | None, str | None]],
+    ) -> None:
+        if not records:
+            return
+        # COPY goes straight to psycopg, the ORM has no bulk path that fast.
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        async with driver_connection.cursor() as cursor:
+            async with cursor.copy(
+                f"COPY {self.__tablename__} ({', '.join(_COPY_COLUMNS)}) FROM STDIN"
+            ) as copy:
+                for record in records:
+                    await copy.write_row(record)
+        logger.debug(
+            "Delivery log records copied. db='%s', count=%d",
+            self.__tablename__,
+            len(records),
+        )
@@ -0,0 +1,218 @@
+import logging
+from datetime import datetime, timezone
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.bot.enums.event_publish_stages import EventPublishStage, EventPublishStageStatus
+from app.infrastructure.database.instrumentation import instrument_repository
+from app.infrastructure.database.models.event_publish_stages import EventPublishStagesModel
+
+logger = logging.getLogger(__name__)
+
+
+@instrument_repository
+class _EventPublishStagesDB:
+    __tablename__ = "event_publish_stages"
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def enqueue(
+        self,
+        *,
+        event_id: int,
+        stages: list[EventPublishStage],
+        run_at: datetime | None = None,
+    ) -> None:
+        if not stages:
+            return
+        values = []
+        for stage in stages:
+            row: dict[str, object] = {
+                "event_id": event_id,
+                "stage": stage,
+                "status": EventPublishStageStatus.PENDING,
+            }
+            if run_at is not None:
+                row["next_attempt_at"] = run_at
+            values.append(row)
+        stmt = (
+            insert(EventPublishStagesModel)
+            .values(values)
+            .on_conflict_do_nothing(index_elements=["event_id", "stage"])
+        )
+        await self.session.execute(stmt)
+        logger.info(
+            "Event publish stages enqueued. db='%s', event_id=%d, stages=%s",
+            self.__tablename__,
+            event_id,
+            [stage.value for stage in stages],
+        )
+
+    async def claim_due(
+        self,
+        *,
+        now: datetime,
+        worker_id: str,
+        claim_expired_before: datetime,
+        limit: int = 10,
+    ) -> list[EventPublishStagesModel]:
+        due_ids = (
+            select(EventPublishStagesModel.id)
+            .where(EventPublishStagesModel.status == EventPublishStageStatus.PENDING)
+            .where(EventPublishStagesModel.next_attempt_at <= now)
+            .where(
+                or_(
+                    EventPublishStagesModel.claimed_at.is_(None),
+                    EventPublishStagesModel.claimed_at < claim_expired_before,
+                )
+            )
+            .order_by(
+                EventPublishStagesModel.next_attempt_at.asc(),
+                EventPublishStagesModel.id.asc(),
+            )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(EventPublishStagesModel)
+            .where(EventPublishStagesModel.id.in_(due_ids))
+            .values(
+                claimed_at=datetime.now(timezone.utc),
+                claimed_by=worker_id,
+                attempts=EventPublishStagesModel.attempts + 1,
+            )
+            .returning(EventPublishStagesModel)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        jobs = sorted(
+            result.scalars().all(),
+            key=lambda job: (job.next_attempt_at, job.id),
+        )
+        if jobs:
+            logger.info(
+                "Event publish stages claimed. db='%s', worker_id='%s', count=%d",
+                self.__tablename__,
+                worker_id,
+                len(jobs),
+            )
+        return jobs
+
+    async def claim_pending_stage(
+        self,
+        *,
+        stage: EventPublishStage,
+        worker_id: str,
+        claim_expired_before: datetime,
+        limit: int = 20,
+    ) -> list[EventPublishStagesModel]:
+        # Picks up fresh stages that are not due yet, used to batch digests.
+        pending_ids = (
+            select(EventPublishStagesModel.id)
+            .where(EventPublishStagesModel.stage == stage)
+            .where(EventPublishStagesModel.status == EventPublishStageStatus.PENDING)
+            .where(EventPublishStagesModel.attempts == 0)
+            .where(
+                or_(
+                    EventPublishStagesModel.claimed_at.is_(None),
+                    EventPublishStagesModel.claimed_at < claim_expired_before,
+                )
+            )
+            .order_by(EventPublishStagesModel.id.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(EventPublishStagesModel)
+            .where(EventPublishStagesModel.id.in_(pending_ids))
+            .values(
+                claimed_at=datetime.now(timezone.utc),
+                claimed_by=worker_id,
+                attempts=EventPublishStagesModel.attempts + 1,
+            )
+            .returning(EventPublishStagesModel)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return sorted(result.scalars().all(), key=lambda job: job.id)
+
+    async def extend_claim(self, *, job_ids: list[int], worker_id: str) -> int:
+        stmt = (
+            update(EventPublishStagesModel)
+            .where(EventPublishStagesModel.id.in_(job_ids))
+            .where(EventPublishStagesModel.claimed_by == worker_id)
+            .values(claimed_at=datetime.now(timezone.utc))
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount
+
+    async def mark_done(self, *, job_id: int, worker_id: str) -> None:
+        stmt = (
+            update(EventPublishStagesModel)
+            .where(EventPublishStagesModel.id == job_id)
+            .where(EventPublishStagesModel.claimed_by == worker_id)
+            .values(
+                status=EventPublishStageStatus.DONE,
+                claimed_at=None,
+                claimed_by=None,
+                last_error=None,
+                finished_at=datetime.now(timezone.utc),
+            )
+        )
+        await self.session.execute(stmt)
+        logger.info(
+            "Event publish stage done. db='%s', job_id=%d",
+            self.__tablename__,
+            job_id,
+        )
+
+    async def reschedule(
+        self,
+        *,
+        job_id: int,
+        worker_id: str,
+        next_attempt_at: datetime,
+        error: str,
+    ) -> None:
+        stmt = (
+            update(EventPublishStagesModel)
+            .where(EventPublishStagesModel.id == job_id)
+            .where(EventPublishStagesModel.claimed_by == worker_id)
+            .values(
+                claimed_at=None,
+                claimed_by=None,
+                next_attempt_at=next_attempt_at,
+                last_error=error,
+            )
+        )
+        await self.session.execute(stmt)
+        logger.info(
+            "Event publish stage rescheduled. db='%s', job_id=%d, next_attempt_at='%s'",
+            self.__tablename__,
+            job_id,
+            next_attempt_at,
+        )
+
+    async def mark_failed(self, *, job_id: int, worker_id: str, error: str) -> None:
+        stmt = (
+            update(EventPublishStagesModel)
+            .where(EventPublishStagesModel.id == job_id)
+            .where(EventPublishStagesModel.claimed_by == worker_id)
+            .values(
+                status=EventPublishStageStatus.FAILED,
+                claimed_at=None,
+                claimed_by=None,
+                last_error=error,
+                finished_at=datetime.now(timezone.utc),
+            )
+        )
+        await self.session.execute(stmt)
+        logger.warning(
+            "Event publish stage failed. db='%s', job_id=%d, error=%s",
+            self.__tablename__,
+            job_id,
+            error,
+        )
@@ -1,18 +1,49 @@
 import logging
 from datetime import datetime, timezone
 
-from sqlalchemy import select, update
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import bindparam, exists, func, or_, select, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.bot.enums.event_registrations import EventRegistrationStatus
+from app.infrastructure.database.instrumentation import instrument_repository
 from app.infrastructure.database.models.users import UsersModel
 from app.infrastructure.database.models.events import EventsModel
 from app.infrastructure.database.models.event_registrations import EventRegistrationsModel
+from app.infrastructure.database.rows import DueReminderEvent
 
 logger = logging.getLogger(__name__)
 
+_GET_BY_USER_EVENT = (
+    select(EventRegistrationsModel)
+    .where(EventRegistrationsModel.event_id == bindparam("event_id"))
+    .where(EventRegistrationsModel.user_id == bindparam("user_id"))
+)
+_RELEASE_REMINDER_CLAIM = (
+    update(EventRegistrationsModel)
+    .where(EventRegistrationsModel.event_id == bindparam("target_event_id"))
+    .where(EventRegistrationsModel.user_id == bindparam("target_user_id"))
+    .where(EventRegistrationsModel.reminder_claimed_by == bindparam("worker_id"))
+    .values(
+        reminder_claimed_at=None,
+        reminder_claimed_by=None,
+    )
+)
+_MARK_REMINDER_SENT_IF_PENDING = (
+    update(EventRegistrationsModel)
+    .where(EventRegistrationsModel.event_id == bindparam("target_event_id"))
+    .where(EventRegistrationsModel.user_id == bindparam("target_user_id"))
+    .where(EventRegistrationsModel.status == EventRegistrationStatus.CONFIRMED)
+    .where(EventRegistrationsModel.reminder_sent_at.is_(None))
+    .values(
+        reminder_sent_at=bindparam("sent_at"),
+        reminder_claimed_at=None,
+        reminder_claimed_by=None,
+    )
+)
 
+
+@instrument_repository
 class _EventRegistrationsDB:
     __tablename__ = "event_registrations"
 
@@ -25,12 +56,10 @@ class _EventRegistrationsDB:
         event_id: int,
         user_id: int,
     ) -> EventRegistrationsModel | None:
-        stmt = (
-            select(EventRegistrationsModel)
-            .where(EventRegistrationsModel.event_id == event_id)
-            .where(EventRegistrationsModel.user_id == user_id)
+        result = await self.session.execute(
+            _GET_BY_USER_EVENT,
+            {"event_id": event_id, "user_id": user_id},
         )
-        result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
     async def create(
@@ -40,7 +69,7 @@ class _EventRegistrationsDB:
         user_id: int,
         status: EventRegistrationStatus,
         amount: int | None = None,
-    ) -> None:
+    ) -> EventRegistrationsModel | None:
         stmt = (
             insert(EventRegistrationsModel)
             .values(
@@ -52,15 +81,19 @@ class _EventRegistrationsDB:
             .on_conflict_do_nothing(
                 index_elements=["event_id", "user_id"]
             )
+            .returning(EventRegistrationsModel)
         )
-        await self.session.execute(stmt)
-        logger.info(
-            "Event registration created. db='%s', event_id=%d, user_id=%d, status=%s",
-            self.__tablename__,
-            event_id,
-            user_id,
-            status.value,
-        )
+        result = await self.session.execute(stmt)
+        registration = result.scalar_one_or_none()
+        if registration is not None:
+            logger.info(
+                "Event registration created. db='%s', event_id=%d, user_id=%d, status=%s",
+                self.__tablename__,
+                event_id,
+                user_id,
+                status.value,
+            )
+        return registration
 
     async def update_status(
         self,
@@ -91,17 +124,19 @@ class _EventRegistrationsDB:
         user_id: int,
         current_status: EventRegistrationStatus,
         new_status: EventRegistrationStatus,
-    ) -> bool:
+    ) -> EventRegistrationsModel | None:
         stmt = (
             update(EventRegistrationsModel)
             .where(EventRegistrationsModel.event_id == event_id)
             .where(EventRegistrationsModel.user_id == user_id)
             .where(EventRegistrationsModel.status == current_status)
             .values(status=new_status)
+            .returning(EventRegistrationsModel)
+            .execution_options(populate_existing=True)
         )
         result = await self.session.execute(stmt)
-        updated = bool(result.rowcount)
-        if updated:
+        updated = result.scalar_one_or_none()
+        if updated is not None:
             logger.info(
                 "Event registration updated conditionally. db='%s', event_id=%d, "
                 "user_id=%d, from_status=%s, to_status=%s",
@@ -120,8 +155,8 @@ class _EventRegistrationsDB:
         user_id: int,
         payment_proof_file_id: str,
         payment_proof_type: str,
-    ) -> bool:
-        stmt = (
+    ) -> tuple[bool, EventRegistrationStatus | None]:
+        moved = (
             update(EventRegistrationsModel)
             .where(EventRegistrationsModel.event_id == event_id)
             .where(EventRegistrationsModel.user_id == user_id)
@@ -135,9 +170,26 @@ class _EventRegistrationsDB:
                 payment_proof_type=payment_proof_type,
                 payment_proof_uploaded_at=datetime.now(timezone.utc),
             )
+            .returning(EventRegistrationsModel.status)
+            .cte("moved_registration")
+        )
+        # The status seen by the caller when the move did not happen, read in
+        # the same round trip instead of a follow-up lookup.
+        current_status = (
+            select(EventRegistrationsModel.status)
+            .where(EventRegistrationsModel.event_id == event_id)
+            .where(EventRegistrationsModel.user_id == user_id)
+            .scalar_subquery()
+        )
+        stmt = select(
+            exists(select(moved.c.status)).label("moved"),
+            func.coalesce(
+                select(moved.c.status).scalar_subquery(),
+                current_status,
+            ).label("status"),
         )
         result = await self.session.execute(stmt)
-        updated = bool(result.rowcount)
+        updated, status = result.one()
         if updated:
             logger.info(
                 "Event registration payment proof stored. db='%s', event_id=%d, "
@@ -147,7 +199,7 @@ class _EventRegistrationsDB:
                 user_id,
                 payment_proof_type,
             )
-        return updated
+        return updated, status
 
     async def mark_paid_confirmed(
         self,
@@ -181,7 +233,7 @@ class _EventRegistrationsDB:
         user_id: int,
         current_status: EventRegistrationStatus,
         admin_commission_amount: int | None = None,
-    ) -> bool:
+    ) -> EventRegistrationsModel | None:
         stmt = (
             update(EventRegistrationsModel)
             .where(EventRegistrationsModel.event_id == event_id)
@@ -192,10 +244,12 @@ class _EventRegistrationsDB:
                 admin_commission_amount=admin_commission_amount,
                 paid_confirmed_at=datetime.now(timezone.utc),
             )
+            .returning(EventRegistrationsModel)
+            .execution_options(populate_existing=True)
         )
         result = await self.session.execute(stmt)
-        updated = bool(result.rowcount)
-        if updated:
+        updated = result.scalar_one_or_none()
+        if updated is not None:
             logger.info(
                 "Event registration payment confirmed conditionally. db='%s', "
                 "event_id=%d, user_id=%d, from_status=%s",
@@ -303,22 +357,27 @@ class _EventRegistrationsDB:
             for row in result.all()
         ]
 
-    async def list_due_for_reminder(
+    async def claim_due_for_reminder(
         self,
         *,
         now: datetime,
         remind_before: datetime,
         limit: int,
-    ) -> list[tuple[int, EventsModel]]:
-        stmt = (
-            select(
-                EventRegistrationsModel.user_id,
-                EventsModel,
-            )
+        worker_id: str,
+        claim_expired_before: datetime,
+    ) -> list[DueReminderEvent]:
+        due_registration_ids = (
+            select(EventRegistrationsModel.id)
             .join(EventsModel, EventsModel.id == EventRegistrationsModel.event_id)
             .join(UsersModel, UsersModel.user_id == EventRegistrationsModel.user_id)
             .where(EventRegistrationsModel.status == EventRegistrationStatus.CONFIRMED)
             .where(EventRegistrationsModel.reminder_sent_at.is_(None))
+            .where(
+                or_(
+                    EventRegistrationsModel.reminder_claimed_at.is_(None),
+                    EventRegistrationsModel.reminder_claimed_at < claim_expired_before,
+                )
+            )
             .where(EventsModel.event_datetime > now)
             .where(EventsModel.event_datetime <= remind_before)
             .where(UsersModel.is_alive.is_(True))
@@ -328,12 +387,70 @@ class _EventRegistrationsDB:
                 EventRegistrationsModel.created.asc(),
             )
             .limit(limit)
+            .with_for_update(of=EventRegistrationsModel, skip_locked=True)
+        )
+        claimed = (
+            update(EventRegistrationsModel)
+            .where(EventRegistrationsModel.id.in_(due_registration_ids))
+            .values(
+                reminder_claimed_at=now,
+                reminder_claimed_by=worker_id,
+            )
+            .returning(
+                EventRegistrationsModel.event_id,
+                EventRegistrationsModel.user_id,
+                EventRegistrationsModel.created,
+            )
+            .cte("claimed_reminders")
+        )
+        # One row per event with its recipients, the description is never loaded.
+        stmt = (
+            select(
+                EventsModel.id,
+                EventsModel.name,
+                EventsModel.event_datetime,
+                EventsModel.address,
+                EventsModel.channel_id,
+                EventsModel.channel_message_id,
+                EventsModel.private_chat_invite_link,
+                EventsModel.private_chat_delete_at,
+                EventsModel.private_chat_deleted_at,
+                func.array_agg(
+                    aggregate_order_by(claimed.c.user_id, claimed.c.created.asc())
+                ).label("user_ids"),
+            )
+            .join(EventsModel, EventsModel.id == claimed.c.event_id)
+            .group_by(EventsModel.id)
+            .order_by(EventsModel.event_datetime.asc(), EventsModel.id.asc())
         )
         result = await self.session.execute(stmt)
-        return [
-            (row[0], row[1])
-            for row in result.all()
-        ]
+        events = [DueReminderEvent(*row) for row in result.all()]
+        if events:
+            logger.info(
+                "Event registration reminders claimed. db='%s', worker_id='%s', "
+                "events=%d, count=%d",
+                self.__tablename__,
+                worker_id,
+                len(events),
+                sum(len(event.user_ids) for event in events),
+            )
+        return events
+
+    async def release_reminder_claim(
+        self,
+        *,
+        event_id: int,
+        user_id: int,
+        worker_id: str,
+    ) -> None:
+        await self.session.execute(
+            _RELEASE_REMINDER_CLAIM,
+            {
+                "target_event_id": event_id,
+                "target_user_id": user_id,
+                "worker_id": worker_id,
+            },
+        )
 
     async def mark_reminder_sent_if_pending(
         self,
@@ -341,15 +458,14 @@ class _EventRegistrationsDB:
         event_id: int,
         user_id: int,
     ) -> bool:
-        stmt = (
-            update(EventRegistrationsModel)
-            .where(EventRegistrationsModel.event_id == event_id)
-            .where(EventRegistrationsModel.user_id == user_id)
-            .where(EventRegistrationsModel.status == EventRegistrationStatus.CONFIRMED)
-            .where(EventRegistrationsModel.reminder_sent_at.is_(None))
-            .values(reminder_sent_at=datetime.now(timezone.utc))
+        result = await self.session.execute(
+            _MARK_REMINDER_SENT_IF_PENDING,
+            {
+                "target_event_id": event_id,
+                "target_user_id": user_id,
+                "sent_at": datetime.now(timezone.utc),
+            },
         )
-        result = await self.session.execute(stmt)
         updated = bool(result.rowcount)
         if updated:
             logger.info(
@@ -1,16 +1,28 @@
 import logging
 from datetime import datetime, timezone
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import bindparam, delete, or_, select, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.infrastructure.database.instrumentation import instrument_repository
 from app.infrastructure.database.models.events import EventsModel
+from app.infrastructure.database.rows import EventSummary
 from app.utils.datetime import compute_private_chat_delete_at, now_utc
 
 logger = logging.getLogger(__name__)
 
+_GET_EVENT_BY_ID = select(EventsModel).where(EventsModel.id == bindparam("event_id"))
+_GET_EVENT_BY_ID_FOR_UPDATE = _GET_EVENT_BY_ID.with_for_update()
+_GET_EVENT_SUMMARY = select(
+    EventsModel.id,
+    EventsModel.organizer_user_id,
+    EventsModel.name,
+    EventsModel.event_datetime,
+).where(EventsModel.id == bindparam("event_id"))
 
+
+@instrument_repository
 class _EventsDB:
     __tablename__ = "events"
 
@@ -68,7 +80,7 @@ class _EventsDB:
         event_id: int,
         channel_id: int | None = None,
         channel_message_id: int | None = None,
-    ) -> None:
+    ) -> EventsModel | None:
         values: dict[str, object] = {
             "published_at": datetime.now(timezone.utc),
         }
@@ -80,8 +92,10 @@ class _EventsDB:
             update(EventsModel)
             .where(EventsModel.id == event_id)
             .values(**values)
+            .returning(EventsModel)
+            .execution_options(populate_existing=True)
         )
-        await self.session.execute(stmt)
+        result = await self.session.execute(stmt)
         logger.info(
             "Event published. db='%s', event_id=%d, channel_id=%s, message_id=%s",
             self.__tablename__,
@@ -89,6 +103,7 @@ class _EventsDB:
             channel_id,
             channel_message_id,
         )
+        return result.scalar_one_or_none()
 
     async def mark_event_private_chat(
         self,
@@ -96,7 +111,7 @@ class _EventsDB:
         event_id: int,
         chat_id: int,
         invite_link: str,
-    ) -> None:
+    ) -> EventsModel | None:
         stmt = (
             update(EventsModel)
             .where(EventsModel.id == event_id)
@@ -112,13 +127,16 @@ class _EventsDB:
                 private_chat_invite_link=invite_link,
                 private_chat_deleted_at=None,
             )
+            .returning(EventsModel)
+            .execution_options(populate_existing=True)
         )
-        await self.session.execute(stmt)
+        result = await self.session.execute(stmt)
         logger.info(
             "Event private chat saved. db='%s', event_id=%d",
             self.__tablename__,
             event_id,
         )
+        return result.scalar_one_or_none()
 
     async def delete_event(self, *, event_id: int) -> None:
         stmt = delete(EventsModel).where(EventsModel.id == event_id)
@@ -135,12 +153,15 @@ class _EventsDB:
         event_id: int,
         for_update: bool = False,
     ) -> EventsModel | None:
-        stmt = select(EventsModel).where(EventsModel.id == event_id)
-        if for_update:
-            stmt = stmt.with_for_update()
-        result = await self.session.execute(stmt)
+        stmt = _GET_EVENT_BY_ID_FOR_UPDATE if for_update else _GET_EVENT_BY_ID
+        result = await self.session.execute(stmt, {"event_id": event_id})
         return result.scalar_one_or_none()
 
+    async def get_event_summary(self, *, event_id: int) -> EventSummary | None:
+        result = await self.session.execute(_GET_EVENT_SUMMARY, {"event_id": event_id})
+        row = result.one_or_none()
+        return EventSummary(*row) if row is not None else None
+
     async def get_event_by_channel_message(
         self,
         *,
@@ -174,14 +195,40 @@ class _EventsDB:
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
-    async def list_private_chats_due_for_deletion(
+    async def list_summaries_by_organizer_upcoming(
+        self,
+        *,
+        organizer_user_id: int,
+        limit: int = 10,
+        offset: int = 0,
+    ) -> list[EventSummary]:
+        now = now_utc()
+        stmt = (
+            select(
+                EventsModel.id,
+                EventsModel.organizer_user_id,
+                EventsModel.name,
+                EventsModel.event_datetime,
+            )
+            .where(EventsModel.organizer_user_id == organizer_user_id)
+            .where(EventsModel.event_datetime >= now)
+            .order_by(EventsModel.event_datetime.asc())
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await self.session.execute(stmt)
+        return [EventSummary(*row) for row in result.all()]
+
+    async def claim_private_chats_due_for_deletion(
         self,
         *,
         delete_before: datetime,
+        worker_id: str,
+        claim_expired_before: datetime,
         limit: int = 20,
     ) -> list[EventsModel]:
-        stmt = (
-            select(EventsModel)
+        due_event_ids = (
+            select(EventsModel.id)
             .where(EventsModel.private_chat_delete_at.is_not(None))
             .where(EventsModel.private_chat_delete_at <= delete_before)
             .where(EventsModel.private_chat_deleted_at.is_(None))
@@ -190,11 +237,88 @@ class _EventsDB:
                 | (EventsModel.female_chat_id.is_not(None))
                 | (EventsModel.private_chat_invite_link.is_not(None))
             )
+            .where(
+                or_(
+                    EventsModel.private_chat_cleanup_claimed_at.is_(None),
+                    EventsModel.private_chat_cleanup_claimed_at < claim_expired_before,
+                )
+            )
+            .where(
+                or_(
+                    EventsModel.private_chat_cleanup_retry_at.is_(None),
+                    EventsModel.private_chat_cleanup_retry_at <= delete_before,
+                )
+            )
             .order_by(EventsModel.private_chat_delete_at.asc(), EventsModel.id.asc())
             .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(EventsModel)
+            .where(EventsModel.id.in_(due_event_ids))
+            .values(
+                private_chat_cleanup_claimed_at=datetime.now(timezone.utc),
+                private_chat_cleanup_claimed_by=worker_id,
+            )
+            .returning(EventsModel)
+            .execution_options(populate_existing=True)
         )
         result = await self.session.execute(stmt)
-        return result.scalars().all()
+        events = sorted(
+            result.scalars().all(),
+            key=lambda event: (event.private_chat_delete_at, event.id),
+        )
+        if events:
+            logger.info(
+                "Event private chats claimed for deletion. db='%s', worker_id='%s', "
+                "count=%d",
+                self.__tablename__,
+                worker_id,
+                len(events),
+            )
+        return events
+
+    async def release_private_chat_cleanup_claim(
+        self,
+        *,
+        event_id: int,
+        worker_id: str,
+    ) -> None:
+        stmt = (
+            update(EventsModel)
+            .where(EventsModel.id == event_id)
+            .where(EventsModel.private_chat_cleanup_claimed_by == worker_id)
+            .values(
+                private_chat_cleanup_claimed_at=None,
+                private_chat_cleanup_claimed_by=None,
+            )
+        )
+        await self.session.execute(stmt)
+
+    async def reschedule_private_chat_cleanup(
+        self,
+        *,
+        event_id: int,
+        worker_id: str,
+        retry_at: datetime,
+    ) -> None:
+        stmt = (
+            update(EventsModel)
+            .where(EventsModel.id == event_id)
+            .where(EventsModel.private_chat_cleanup_claimed_by == worker_id)
+            .values(
+                private_chat_cleanup_claimed_at=None,
+                private_chat_cleanup_claimed_by=None,
+                private_chat_cleanup_retry_at=retry_at,
+            )
+        )
+        await self.session.execute(stmt)
+        logger.info(
+            "Event private chat cleanup rescheduled. db='%s', event_id=%d, retry_at='%s'",
+            self.__tablename__,
+            event_id,
+            retry_at,
+        )
 
     async def mark_private_chat_deleted(
         self,
@@ -216,6 +340,9 @@ class _EventsDB:
                 female_chat_username=None,
                 private_chat_invite_link=None,
                 private_chat_deleted_at=deleted_at or datetime.now(timezone.utc),
+                private_chat_cleanup_claimed_at=None,
+                private_chat_cleanup_claimed_by=None,
+                private_chat_cleanup_retry_at=None,
             )
         )
         await self.session.execute(stmt)
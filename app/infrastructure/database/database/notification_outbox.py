@@ -0,0 +1,178 @@
+import logging
+from datetime import datetime, timezone
+
+from sqlalchemy import and_, exists, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.bot.enums.notification_outbox import NotificationOutboxStatus
+from app.infrastructure.database.instrumentation import instrument_repository
+from app.infrastructure.database.models.notification_outbox import NotificationOutboxModel
+
+logger = logging.getLogger(__name__)
+
+
+@instrument_repository
+class _NotificationOutboxDB:
+    __tablename__ = "notification_outbox"
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def enqueue(
+        self,
+        *,
+        chat_id: int | str,
+        kind: str,
+        payload: dict,
+    ) -> None:
+        stmt = insert(NotificationOutboxModel).values(
+            chat_id=str(chat_id),
+            kind=kind,
+            payload=payload,
+            status=NotificationOutboxStatus.PENDING,
+        )
+        await self.session.execute(stmt)
+        logger.info(
+            "Notification enqueued. db='%s', chat_id=%s, kind=%s",
+            self.__tablename__,
+            chat_id,
+            kind,
+        )
+
+    async def claim_due(
+        self,
+        *,
+        now: datetime,
+        worker_id: str,
+        claim_expired_before: datetime,
+        limit: int = 100,
+    ) -> list[NotificationOutboxModel]:
+        # A message waits while an earlier one to the same chat is backing off
+        # or still being sent, so a chat never sees them out of order.
+        earlier = aliased(NotificationOutboxModel)
+        earlier_blocking = (
+            select(earlier.id)
+            .where(earlier.chat_id == NotificationOutboxModel.chat_id)
+            .where(earlier.id < NotificationOutboxModel.id)
+            .where(earlier.status == NotificationOutboxStatus.PENDING)
+            .where(
+                or_(
+                    earlier.next_attempt_at > now,
+                    and_(
+                        earlier.claimed_at.is_not(None),
+                        earlier.claimed_at >= claim_expired_before,
+                    ),
+                )
+            )
+        )
+        due_ids = (
+            select(NotificationOutboxModel.id)
+            .where(NotificationOutboxModel.status == NotificationOutboxStatus.PENDING)
+            .where(NotificationOutboxModel.next_attempt_at <= now)
+            .where(
+                or_(
+                    NotificationOutboxModel.claimed_at.is_(None),
+                    NotificationOutboxModel.claimed_at < claim_expired_before,
+                )
+            )
+            .where(~exists(earlier_blocking))
+            .order_by(NotificationOutboxModel.id.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(NotificationOutboxModel)
+            .where(NotificationOutboxModel.id.in_(due_ids))
+            .values(
+                claimed_at=datetime.now(timezone.utc),
+                claimed_by=worker_id,
+                attempts=NotificationOutboxModel.attempts + 1,
+            )
+            .returning(NotificationOutboxModel)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        # Keep enqueue order so messages to one chat go out in sequence.
+        return sorted(result.scalars().all(), key=lambda notification: notification.id)
+
+    async def mark_sent(self, *, notification_ids: list[int], worker_id: str) -> None:
+        if not notification_ids:
+            return
+        stmt = (
+            update(NotificationOutboxModel)
+            .where(NotificationOutboxModel.id.in_(notification_ids))
+            .where(NotificationOutboxModel.claimed_by == worker_id)
+            .values(
+                status=NotificationOutboxStatus.SENT,
+                claimed_at=None,
+                claimed_by=None,
+                last_error=None,
+                sent_at=datetime.now(timezone.utc),
+            )
+        )
+        await self.session.execute(stmt)
+
+    async def release(self, *, notification_ids: list[int], worker_id: str) -> None:
+        # Claimed but not attempted: give the claim and the attempt back.
+        if not notification_ids:
+            return
+        stmt = (
+            update(NotificationOutboxModel)
+            .where(NotificationOutboxModel.id.in_(notification_ids))
+            .where(NotificationOutboxModel.claimed_by == worker_id)
+            .values(
+                claimed_at=None,
+                claimed_by=None,
+                attempts=NotificationOutboxModel.attempts - 1,
+            )
+        )
+        await self.session.execute(stmt)
+
+    async def reschedule(
+        self,
+        *,
+        notification_id: int,
+        worker_id: str,
+        next_attempt_at: datetime,
+        error: str,
+    ) -> None:
+        stmt = (
+            update(NotificationOutboxModel)
+            .where(NotificationOutboxModel.id == notification_id)
+            .where(NotificationOutboxModel.claimed_by == worker_id)
+            .values(
+                claimed_at=None,
+                claimed_by=None,
+                next_attempt_at=next_attempt_at,
+                last_error=error,
+            )
+        )
+        await self.session.execute(stmt)
+
+    async def mark_failed(
+        self,
+        *,
+        notification_id: int,
+        worker_id: str,
+        error: str,
+    ) -> None:
+        stmt = (
+            update(NotificationOutboxModel)
+            .where(NotificationOutboxModel.id == notification_id)
+            .where(NotificationOutboxModel.claimed_by == worker_id)
+            .values(
+                status=NotificationOutboxStatus.FAILED,
+                claimed_at=None,
+                claimed_by=None,
+                last_error=error,
+            )
+        )
+        await self.session.execute(stmt)
+        logger.warning(
+            "Notification failed. db='%s', notification_id=%d, error=%s",
+            self.__tablename__,
+            notification_id,
+            error,
+        )
@@ -0,0 +1,72 @@
+import logging
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.database.instrumentation import instrument_repository
+from app.infrastructure.database.models.private_chat_pool import PrivateChatPoolModel
+
+logger = logging.getLogger(__name__)
+
+# Key of the session-level advisory lock that lets one refiller run at a time.
+_REFILL_LOCK_KEY = 7_310_452_001
+
+
+@instrument_repository
+class _PrivateChatPoolDB:
+    __tablename__ = "private_chat_pool"
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def try_lock_refill(self) -> bool:
+        # Held by the connection until unlock_refill, commits do not release it.
+        stmt = select(func.pg_try_advisory_lock(_REFILL_LOCK_KEY))
+        result = await self.session.execute(stmt)
+        return bool(result.scalar_one())
+
+    async def unlock_refill(self) -> None:
+        stmt = select(func.pg_advisory_unlock(_REFILL_LOCK_KEY))
+        await self.session.execute(stmt)
+
+    async def count_available(self) -> int:
+        stmt = select(func.count()).select_from(PrivateChatPoolModel)
+        result = await self.session.execute(stmt)
+        return int(result.scalar_one())
+
+    async def add(self, *, chat_id: int, invite_link: str) -> None:
+        stmt = (
+            insert(PrivateChatPoolModel)
+            .values(chat_id=chat_id, invite_link=invite_link)
+            .on_conflict_do_nothing(index_elements=["chat_id"])
+        )
+        await self.session.execute(stmt)
+        logger.info(
+            "Private chat added to pool. db='%s', chat_id=%d",
+            self.__tablename__,
+            chat_id,
+        )
+
+    async def take_available(self) -> PrivateChatPoolModel | None:
+        oldest_id = (
+            select(PrivateChatPoolModel.id)
+            .order_by(PrivateChatPoolModel.created.asc(), PrivateChatPoolModel.id.asc())
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        stmt = (
+            delete(PrivateChatPoolModel)
+            .where(PrivateChatPoolModel.id == oldest_id)
+            .returning(PrivateChatPoolModel)
+        )
+        result = await self.session.execute(stmt)
+        pooled = result.scalar_one_or_none()
+        if pooled is not None:
+            logger.info(
+                "Private chat taken from pool. db='%s', chat_id=%d",
+                self.__tablename__,
+                pooled.chat_id,
+            )
+        return pooled
@@ -0,0 +1,70 @@
+import logging
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.database.instrumentation import instrument_repository
+from app.infrastructure.database.models.telethon_entities import TelethonEntitiesModel
+
+logger = logging.getLogger(__name__)
+
+
+@instrument_repository
+class _TelethonEntitiesDB:
+    __tablename__ = "telethon_entities"
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get(self, *, key: str) -> TelethonEntitiesModel | None:
+        stmt = select(TelethonEntitiesModel).where(TelethonEntitiesModel.key == key)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def upsert(
+        self,
+        *,
+        keys: list[str],
+        peer_type: str,
+        entity_id: int,
+        access_hash: int | None,
+    ) -> None:
+        if not keys:
+            return
+        stmt = insert(TelethonEntitiesModel).values(
+            [
+                {
+                    "key": key,
+                    "peer_type": peer_type,
+                    "entity_id": entity_id,
+                    "access_hash": access_hash,
+                }
+                for key in keys
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["key"],
+            set_={
+                "peer_type": stmt.excluded.peer_type,
+                "entity_id": stmt.excluded.entity_id,
+                "access_hash": stmt.excluded.access_hash,
+                "updated": func.now(),
+            },
+        )
+        await self.session.execute(stmt)
+        logger.debug(
+            "Telethon entity cached. db='%s', peer_type=%s, entity_id=%d, keys=%s",
+            self.__tablename__,
+            peer_type,
+            entity_id,
+            keys,
+        )
+
+    async def delete_by_entity(self, *, peer_type: str, entity_id: int) -> None:
+        stmt = (
+            delete(TelethonEntitiesModel)
+            .where(TelethonEntitiesModel.peer_type == peer_type)
+            .where(TelethonEntitiesModel.entity_id == entity_id)
+        )
+        await self.session.execute(stmt)
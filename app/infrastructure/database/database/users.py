@@ -1,16 +1,59 @@
 import logging
 from datetime import datetime, timezone
 
-from sqlalchemy import delete, or_, select, update
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    and_,
+    bindparam,
+    column,
+    delete,
+    exists,
+    func,
+    or_,
+    select,
+    update,
+    values,
+)
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.bot.enums.delivery_log import DeliveryKind, DeliveryStatus
 from app.bot.enums.roles import UserRole
+from app.infrastructure.database.instrumentation import instrument_repository
+from app.infrastructure.database.models.delivery_log import DeliveryLogModel
 from app.infrastructure.database.models.users import UsersModel
+from app.infrastructure.database.rows import UserSummary
 
 logger = logging.getLogger(__name__)
 
+# Hot statements are built once, SQLAlchemy then reuses their compiled form
+# and psycopg prepares them on the server after prepare_threshold runs.
+_GET_USER_RECORD = select(UsersModel).where(UsersModel.user_id == bindparam("user_id"))
+_GET_USER_SUMMARY = select(
+    UsersModel.user_id,
+    UsersModel.username,
+    UsersModel.role,
+    UsersModel.is_alive,
+    UsersModel.is_blocked,
+).where(UsersModel.user_id == bindparam("user_id"))
+_MARK_REACHABLE_ON_INCOMING = (
+    update(UsersModel)
+    .where(UsersModel.user_id == bindparam("target_user_id"))
+    .where(
+        or_(
+            UsersModel.is_alive.is_(False),
+            UsersModel.is_blocked.is_(True),
+        )
+    )
+    .values(
+        is_alive=True,
+        is_blocked=False,
+    )
+)
+
 
+@instrument_repository
 class _UsersDB:
     __tablename__ = 'users'
 
@@ -59,10 +102,14 @@ class _UsersDB:
         )
 
     async def get_user_record(self, *, user_id: int) -> UsersModel | None:
-        stmt = select(UsersModel).where(UsersModel.user_id == user_id)
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(_GET_USER_RECORD, {"user_id": user_id})
         return result.scalar_one_or_none()
 
+    async def get_user_summary(self, *, user_id: int) -> UserSummary | None:
+        result = await self.session.execute(_GET_USER_SUMMARY, {"user_id": user_id})
+        row = result.one_or_none()
+        return UserSummary(*row) if row is not None else None
+
     async def update_alive_status(self, *, user_id: int, is_alive: bool = True) -> None:
         stmt = (
             update(UsersModel)
@@ -119,22 +166,47 @@ class _UsersDB:
                 self.__tablename__, user_id, is_blocked
             )
 
-    async def mark_reachable_on_incoming(self, *, user_id: int) -> None:
+    async def mark_unreachable_many(
+        self,
+        *,
+        statuses: list[tuple[int, bool]],
+    ) -> int:
+        if not statuses:
+            return 0
+        failed_users = values(
+            column("user_id", BigInteger),
+            column("is_blocked", Boolean),
+            name="failed_users",
+        ).data(statuses)
         stmt = (
             update(UsersModel)
-            .where(UsersModel.user_id == user_id)
+            .where(UsersModel.user_id == failed_users.c.user_id)
             .where(
                 or_(
-                    UsersModel.is_alive.is_(False),
-                    UsersModel.is_blocked.is_(True),
+                    UsersModel.is_alive.is_(True),
+                    UsersModel.is_blocked.is_distinct_from(failed_users.c.is_blocked),
                 )
             )
             .values(
-                is_alive=True,
-                is_blocked=False,
+                is_alive=False,
+                is_blocked=failed_users.c.is_blocked,
             )
         )
         result = await self.session.execute(stmt)
+        updated = int(result.rowcount or 0)
+        logger.info(
+            "Users marked unreachable. db='%s', requested=%d, updated=%d",
+            self.__tablename__,
+            len(statuses),
+            updated,
+        )
+        return updated
+
+    async def mark_reachable_on_incoming(self, *, user_id: int) -> None:
+        result = await self.session.execute(
+            _MARK_REACHABLE_ON_INCOMING,
+            {"target_user_id": user_id},
+        )
         if int(result.rowcount or 0) > 0:
             logger.info(
                 "User restored on incoming update. db='%s', user_id=%d",
@@ -191,16 +263,45 @@ class _UsersDB:
         result = await self.session.execute(stmt)
         return [row[0] for row in result.all()]
 
-    async def get_active_user_ids_by_role(
+    async def get_max_id(self) -> int:
+        result = await self.session.execute(select(func.max(UsersModel.id)))
+        return int(result.scalar_one() or 0)
+
+    async def get_active_user_ids_page(
         self,
         *,
         role: UserRole,
+        max_id: int,
+        after_user_id: int | None = None,
+        limit: int = 1000,
+        exclude_delivered_event_ids: list[int] | None = None,
     ) -> list[int]:
+        # Keyset pages, so a long broadcast does not hold a cursor or a
+        # transaction open between them. Rows above max_id are ignored so
+        # signups during a broadcast do not shift the snapshot.
         stmt = (
             select(UsersModel.user_id)
+            .where(UsersModel.id <= max_id)
             .where(UsersModel.is_alive.is_(True))
             .where(UsersModel.is_blocked.is_(False))
             .where(UsersModel.role == role)
+            .order_by(UsersModel.user_id.asc())
+            .limit(limit)
         )
+        if after_user_id is not None:
+            stmt = stmt.where(UsersModel.user_id > after_user_id)
+        if exclude_delivered_event_ids:
+            stmt = stmt.where(
+                ~and_(
+                    *(
+                        exists()
+                        .where(DeliveryLogModel.user_id == UsersModel.user_id)
+                        .where(DeliveryLogModel.event_id == event_id)
+                        .where(DeliveryLogModel.kind == DeliveryKind.ANNOUNCEMENT)
+                        .where(DeliveryLogModel.status == DeliveryStatus.DELIVERED)
+                        for event_id in exclude_delivered_event_ids
+                    )
+                )
+            )
         result = await self.session.execute(stmt)
         return [row[0] for row in result.all()]
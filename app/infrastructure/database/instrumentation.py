@@ -0,0 +1,177 @@
+import functools
+import inspect
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.metrics.metrics import DB_QUERY_DURATION, DB_QUERY_ROWS
+
+logger = logging.getLogger(__name__)
+slow_query_logger = logging.getLogger("app.sql.slow")
+
+UNATTRIBUTED_METHOD = "-"
+_EXPLAINABLE_PREFIXES = ("SELECT", "WITH", "UPDATE", "DELETE", "INSERT")
+_EXPLAIN_SAVEPOINT = "slow_query_explain"
+
+_current_method: ContextVar[str] = ContextVar(
+    "repository_method",
+    default=UNATTRIBUTED_METHOD,
+)
+
+
+@dataclass
+class QueryCounter:
+    queries: int = 0
+
+
+_current_counter: ContextVar[QueryCounter | None] = ContextVar(
+    "query_counter",
+    default=None,
+)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    counter = QueryCounter()
+    token = _current_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _current_counter.reset(token)
+
+
+def current_query_count() -> int:
+    counter = _current_counter.get()
+    return counter.queries if counter is not None else 0
+
+
+def _wrap_coroutine(method, label: str):
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        token = _current_method.set(label)
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            _current_method.reset(token)
+
+    return wrapper
+
+
+def _wrap_async_generator(method, label: str):
+    # The label is only set while the generator runs, the caller's code
+    # between chunks keeps its own attribution.
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        iterator = method(*args, **kwargs)
+        try:
+            while True:
+                token = _current_method.set(label)
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    return
+                finally:
+                    _current_method.reset(token)
+                yield item
+        finally:
+            await iterator.aclose()
+
+    return wrapper
+
+
+def instrument_repository(cls):
+    for name, method in list(vars(cls).items()):
+        if name.startswith("_"):
+            continue
+        label = f"{cls.__tablename__}.{name}"
+        if inspect.iscoroutinefunction(method):
+            setattr(cls, name, _wrap_coroutine(method, label))
+        elif inspect.isasyncgenfunction(method):
+            setattr(cls, name, _wrap_async_generator(method, label))
+    return cls
+
+
+def _explain(connection, statement: str, parameters) -> str | None:
+    if not statement.lstrip().upper().startswith(_EXPLAINABLE_PREFIXES):
+        return None
+    try:
+        # A raw cursor, so the EXPLAIN itself does not go through the hooks.
+        # It runs in the caller's transaction, the savepoint keeps a failed
+        # EXPLAIN from aborting it.
+        cursor = connection.connection.dbapi_connection.cursor()
+        try:
+            cursor.execute(f"SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+            try:
+                cursor.execute(f"EXPLAIN {statement}", parameters)
+                rows = cursor.fetchall()
+            except Exception:
+                cursor.execute(f"ROLLBACK TO SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+                raise
+            finally:
+                cursor.execute(f"RELEASE SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+        finally:
+            cursor.close()
+    except Exception as exc:
+        logger.debug("Failed to EXPLAIN slow query: %s", exc)
+        return None
+    return "\n".join(str(row[0]) for row in rows)
+
+
+def instrument_engine(
+    engine: AsyncEngine,
+    *,
+    slow_query_ms: float,
+    explain_slow_queries: bool = False,
+    slow_query_log_file: str | None = None,
+) -> None:
+    if slow_query_log_file:
+        handler = logging.FileHandler(slow_query_log_file)
+        handler.setFormatter(logging.Formatter("[%(asctime)s] %(message)s"))
+        slow_query_logger.addHandler(handler)
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(
+        connection, cursor, statement, parameters, context, executemany
+    ) -> None:
+        connection.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(
+        connection, cursor, statement, parameters, context, executemany
+    ) -> None:
+        elapsed = time.perf_counter() - connection.info["query_started_at"].pop()
+        method = _current_method.get()
+        DB_QUERY_DURATION.labels(method).observe(elapsed)
+        rows = cursor.rowcount
+        if rows is not None and rows >= 0:
+            DB_QUERY_ROWS.labels(method).observe(rows)
+        counter = _current_counter.get()
+        if counter is not None:
+            counter.queries += 1
+
+        if elapsed * 1000 < slow_query_ms:
+            return
+        plan = None
+        if explain_slow_queries and not executemany:
+            plan = _explain(connection, statement, parameters)
+        slow_query_logger.warning(
+            "Slow query. method=%s, duration_ms=%.1f, rows=%s\n%s\nparameters=%r%s",
+            method,
+            elapsed * 1000,
+            rows,
+            statement,
+            parameters,
+            f"\n{plan}" if plan else "",
+        )
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def _handle_error(exception_context) -> None:
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("query_started_at"):
+            connection.info["query_started_at"].pop()
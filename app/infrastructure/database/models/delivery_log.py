@@ -0,0 +1,44 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Enum, Index, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.bot.enums.delivery_log import DeliveryKind, DeliveryStatus
+from app.infrastructure.database.models.base import BaseModel
+
+
+class DeliveryLogModel(BaseModel):
+    __tablename__ = "delivery_log"
+    __table_args__ = (
+        Index("ix_delivery_log_event_kind_user", "event_id", "kind", "user_id"),
+        Index("ix_delivery_log_created", "created"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    event_id: Mapped[int | None] = mapped_column(Integer)
+    user_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    kind: Mapped[DeliveryKind] = mapped_column(
+        Enum(
+            DeliveryKind,
+            values_callable=lambda enum: [item.value for item in enum],
+            name="deliverykind",
+            native_enum=False,
+        ),
+        nullable=False,
+    )
+    status: Mapped[DeliveryStatus] = mapped_column(
+        Enum(
+            DeliveryStatus,
+            values_callable=lambda enum: [item.value for item in enum],
+            name="deliverystatus",
+            native_enum=False,
+        ),
+        nullable=False,
+    )
+    latency_ms: Mapped[int | None] = mapped_column(Integer)
+    error_class: Mapped[str | None] = mapped_column(String(length=128))
+    created: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
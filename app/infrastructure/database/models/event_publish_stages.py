@@ -0,0 +1,51 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Enum, Index, Integer, String, Text, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.bot.enums.event_publish_stages import EventPublishStage, EventPublishStageStatus
+from app.infrastructure.database.models.base import BaseModel
+
+
+class EventPublishStagesModel(BaseModel):
+    __tablename__ = "event_publish_stages"
+    __table_args__ = (
+        UniqueConstraint("event_id", "stage"),
+        Index("ix_event_publish_stages_status_next_attempt", "status", "next_attempt_at"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    event_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    stage: Mapped[EventPublishStage] = mapped_column(
+        Enum(
+            EventPublishStage,
+            values_callable=lambda enum: [item.value for item in enum],
+            name="eventpublishstage",
+            native_enum=False,
+        ),
+        nullable=False,
+    )
+    status: Mapped[EventPublishStageStatus] = mapped_column(
+        Enum(
+            EventPublishStageStatus,
+            values_callable=lambda enum: [item.value for item in enum],
+            name="eventpublishstagestatus",
+            native_enum=False,
+        ),
+        nullable=False,
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    claimed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    claimed_by: Mapped[str | None] = mapped_column(String(length=64))
+    last_error: Mapped[str | None] = mapped_column(Text)
+    created: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
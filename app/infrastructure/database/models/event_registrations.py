@@ -35,3 +35,5 @@ class EventRegistrationsModel(BaseModel):
     paid_confirmed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     attended_confirmed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     reminder_sent_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    reminder_claimed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    reminder_claimed_by: Mapped[str | None] = mapped_column(String(length=64))
@@ -42,6 +42,13 @@ class EventsModel(BaseModel):
     private_chat_invite_link: Mapped[str | None] = mapped_column(String(255))
     private_chat_delete_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     private_chat_deleted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    private_chat_cleanup_claimed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True)
+    )
+    private_chat_cleanup_claimed_by: Mapped[str | None] = mapped_column(String(64))
+    private_chat_cleanup_retry_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True)
+    )
     created: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Index, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.database.models.base import BaseModel
+
+
+class TelethonEntitiesModel(BaseModel):
+    __tablename__ = "telethon_entities"
+    __table_args__ = (
+        Index("ix_telethon_entities_peer", "peer_type", "entity_id"),
+    )
+
+    key: Mapped[str] = mapped_column(String(128), primary_key=True)
+    peer_type: Mapped[str] = mapped_column(String(16), nullable=False)
+    entity_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    access_hash: Mapped[int | None] = mapped_column(BigInteger)
+    updated: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
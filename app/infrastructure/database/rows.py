@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.bot.enums.roles import UserRole
+
+# Read-only rows built from column selections. They bypass the ORM identity
+# map, so they are cheap to build and never flushed back.
+
+
+@dataclass(frozen=True, slots=True)
+class UserSummary:
+    user_id: int
+    username: str | None
+    role: UserRole
+    is_alive: bool
+    is_blocked: bool
+
+
+@dataclass(frozen=True, slots=True)
+class EventSummary:
+    id: int
+    organizer_user_id: int
+    name: str
+    event_datetime: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class DueReminderEvent:
+    id: int
+    name: str
+    event_datetime: datetime
+    address: str
+    channel_id: int | None
+    channel_message_id: int | None
+    private_chat_invite_link: str | None
+    private_chat_delete_at: datetime | None
+    private_chat_deleted_at: datetime | None
+    user_ids: list[int]
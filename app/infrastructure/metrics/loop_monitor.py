@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from app.infrastructure.metrics.metrics import EVENT_LOOP_LAG, EVENT_LOOP_STALLS
+
+logger = logging.getLogger(__name__)
+DEFAULT_LOOP_MONITOR_INTERVAL_SECONDS = 0.25
+DEFAULT_LOOP_MONITOR_SLOW_CALLBACK_MS = 100
+DEFAULT_LOOP_MONITOR_CONFIG_REFRESH_SECONDS = 30
+
+
+@dataclass(frozen=True)
+class LoopMonitorConfig:
+    enabled: bool
+    interval_seconds: float = DEFAULT_LOOP_MONITOR_INTERVAL_SECONDS
+    slow_callback_ms: float = DEFAULT_LOOP_MONITOR_SLOW_CALLBACK_MS
+
+
+class _StallWatchdog:
+    def __init__(self, *, loop_thread_id: int, slow_callback_ms: float) -> None:
+        self._loop_thread_id = loop_thread_id
+        self._threshold = slow_callback_ms / 1000
+        self._wake_at: float | None = None
+        self._reported_wake_at: float | None = None
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="loop-stall-watchdog",
+            daemon=True,
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        # Not joined, the loop must not wait on it. The thread sees the event
+        # within one check interval and exits.
+        self._stopped.set()
+
+    def expect_wake_at(self, wake_at: float | None) -> None:
+        self._wake_at = wake_at
+
+    def _run(self) -> None:
+        check_interval = max(0.01, self._threshold / 2)
+        while not self._stopped.wait(check_interval):
+            wake_at = self._wake_at
+            if wake_at is None or wake_at == self._reported_wake_at:
+                continue
+            blocked_for = time.monotonic() - wake_at
+            if blocked_for < self._threshold:
+                continue
+
+            # The probe is overdue, so whatever the loop thread runs right now
+            # is the callback that holds it.
+            self._reported_wake_at = wake_at
+            EVENT_LOOP_STALLS.inc()
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame else ""
+            logger.warning(
+                "Event loop blocked for at least %.0f ms, loop thread stack:\n%s",
+                blocked_for * 1000,
+                stack,
+            )
+
+
+async def _probe(
+    *,
+    config: LoopMonitorConfig,
+    watchdog: _StallWatchdog,
+    until: float,
+) -> None:
+    while time.monotonic() < until:
+        wake_at = time.monotonic() + config.interval_seconds
+        watchdog.expect_wake_at(wake_at)
+        await asyncio.sleep(config.interval_seconds)
+        watchdog.expect_wake_at(None)
+        EVENT_LOOP_LAG.observe(max(0.0, time.monotonic() - wake_at))
+
+
+async def run_loop_monitor_loop(
+    *,
+    load_config: Callable[[], LoopMonitorConfig],
+    config_refresh_seconds: float = DEFAULT_LOOP_MONITOR_CONFIG_REFRESH_SECONDS,
+) -> None:
+    # load_config runs in a worker thread every config_refresh_seconds, so the
+    # monitor can be switched on and off without a restart.
+    loop_thread_id = threading.get_ident()
+    config: LoopMonitorConfig | None = None
+    watchdog: _StallWatchdog | None = None
+    try:
+        while True:
+            try:
+                loaded = await asyncio.to_thread(load_config)
+            except Exception:
+                logger.exception("Failed to load loop monitor config")
+                loaded = config or LoopMonitorConfig(enabled=False)
+
+            if loaded != config:
+                if watchdog is not None:
+                    watchdog.stop()
+                    watchdog = None
+                if loaded.enabled:
+                    watchdog = _StallWatchdog(
+                        loop_thread_id=loop_thread_id,
+                        slow_callback_ms=loaded.slow_callback_ms,
+                    )
+                    watchdog.start()
+                logger.info(
+                    "Loop monitor enabled=%s interval=%ss slow_callback_ms=%s",
+                    loaded.enabled,
+                    loaded.interval_seconds,
+                    loaded.slow_callback_ms,
+                )
+                config = loaded
+
+            if watchdog is None:
+                await asyncio.sleep(config_refresh_seconds)
+            else:
+                await _probe(
+                    config=config,
+                    watchdog=watchdog,
+                    until=time.monotonic() + config_refresh_seconds,
+                )
+    finally:
+        if watchdog is not None:
+            watchdog.stop()
@@ -0,0 +1,108 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+UPDATES_IN_FLIGHT = Gauge(
+    "bot_updates_in_flight",
+    "Updates being processed right now",
+    ["update_type"],
+)
+UPDATE_DURATION = Histogram(
+    "bot_update_duration_seconds",
+    "Time spent on an update, including middlewares and handlers",
+    ["update_type"],
+)
+UPDATE_ERRORS = Counter(
+    "bot_update_errors_total",
+    "Updates that raised out of the dispatcher",
+    ["update_type", "error"],
+)
+HANDLER_DURATION = Histogram(
+    "bot_handler_duration_seconds",
+    "Time spent in a router handler",
+    ["router", "event_type", "state"],
+)
+HANDLER_ERRORS = Counter(
+    "bot_handler_errors_total",
+    "Router handlers that raised",
+    ["router", "event_type", "state", "error"],
+)
+
+_QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55)
+
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Statement execution time by the repository method that issued it",
+    ["method"],
+)
+DB_QUERY_ROWS = Histogram(
+    "db_query_rows",
+    "Rows returned or affected by a statement",
+    ["method"],
+    buckets=(0, 1, 5, 10, 50, 100, 500, 1000, 5000),
+)
+UPDATE_DB_QUERIES = Histogram(
+    "bot_update_db_queries",
+    "Statements executed while processing an update",
+    ["update_type"],
+    buckets=_QUERY_COUNT_BUCKETS,
+)
+HANDLER_DB_QUERIES = Histogram(
+    "bot_handler_db_queries",
+    "Statements executed by a router handler, including dialog getters",
+    ["router", "event_type", "state"],
+    buckets=_QUERY_COUNT_BUCKETS,
+)
+
+BOT_API_DURATION = Histogram(
+    "bot_api_request_duration_seconds",
+    "Bot API request time per attempt, without send scheduler queueing",
+    ["method", "caller"],
+)
+BOT_API_ERRORS = Counter(
+    "bot_api_errors_total",
+    "Bot API requests that failed",
+    ["method", "caller", "error"],
+)
+BOT_API_RETRY_AFTER = Counter(
+    "bot_api_retry_after_total",
+    "RetryAfter responses from the Bot API",
+    ["method", "caller"],
+)
+BOT_API_RETRY_AFTER_SECONDS = Counter(
+    "bot_api_retry_after_seconds_total",
+    "Seconds the Bot API asked to wait in RetryAfter responses",
+    ["method", "caller"],
+)
+
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "How late the loop probe woke up after its sleep",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+EVENT_LOOP_STALLS = Counter(
+    "event_loop_stalls_total",
+    "Times the loop was blocked longer than the slow callback threshold",
+)
+
+SEND_SCHEDULER_WAITING = Gauge(
+    "send_scheduler_waiting",
+    "Sends waiting for a rate limit token",
+    ["priority"],
+)
+SEND_SCHEDULER_ACTIVE_CHATS = Gauge(
+    "send_scheduler_active_chats",
+    "Chats with at least one send queued or in flight",
+)
+SEND_SCHEDULER_MAX_CHAT_QUEUE_DEPTH = Gauge(
+    "send_scheduler_max_chat_queue_depth",
+    "Sends queued or in flight for the busiest chat",
+)
+SEND_SCHEDULER_SENT = Counter(
+    "send_scheduler_sent_total",
+    "Sends the scheduler got a response for",
+    ["priority"],
+)
+SEND_SCHEDULER_RETRY_AFTER = Counter(
+    "send_scheduler_retry_after_total",
+    "RetryAfter responses seen by the scheduler, retried or not",
+    ["priority"],
+)
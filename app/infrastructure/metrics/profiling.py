@@ -0,0 +1,206 @@
+import asyncio
+import logging
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+DEFAULT_PROFILE_SAMPLE_INTERVAL_MS = 5
+DEFAULT_PROFILE_TOP_ENTRIES = 40
+DEFAULT_TRACEMALLOC_FRAMES = 10
+# Outside the working tree, so reports never end up in the repository.
+DEFAULT_PROFILE_OUTPUT_DIR = Path(tempfile.gettempdir()) / "hol_club_profiles"
+
+_profile_lock = asyncio.Lock()
+
+
+class ProfileKind(Enum):
+    CPU = "cpu"
+    MEMORY = "memory"
+
+
+class ProfileBusyError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class ProfileArtifact:
+    kind: ProfileKind
+    path: Path
+
+
+def _frame_label(code) -> str:
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+def _sample_stacks(
+    *,
+    thread_id: int,
+    duration_seconds: float,
+    sample_interval_seconds: float,
+) -> tuple[Counter, int]:
+    # Runs in its own thread and samples the loop thread's stack, so the
+    # profiled code is not slowed down by a tracing hook.
+    stacks: Counter = Counter()
+    samples = 0
+    deadline = time.monotonic() + duration_seconds
+    while time.monotonic() < deadline:
+        frame = sys._current_frames().get(thread_id)
+        if frame is not None:
+            labels = []
+            while frame is not None:
+                labels.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            stacks[";".join(reversed(labels))] += 1
+            samples += 1
+        time.sleep(sample_interval_seconds)
+    return stacks, samples
+
+
+def _render_cpu_report(
+    *,
+    stacks: Counter,
+    samples: int,
+    duration_seconds: float,
+    top_entries: int,
+) -> str:
+    own: Counter = Counter()
+    total: Counter = Counter()
+    for stack, count in stacks.items():
+        labels = stack.split(";")
+        own[labels[-1]] += count
+        for label in set(labels):
+            total[label] += count
+
+    def table(counter: Counter) -> list[str]:
+        return [
+            f"{count * 100 / samples:6.1f}%  {count:>7}  {label}"
+            for label, count in counter.most_common(top_entries)
+        ]
+
+    lines = [
+        f"CPU profile of the event loop thread, {duration_seconds:.0f}s, "
+        f"{samples} samples",
+        "",
+        "Own time (leaf frame):",
+        *table(own),
+        "",
+        "Total time (frame anywhere on the stack):",
+        *table(total),
+        "",
+        "Folded stacks (flamegraph.pl / speedscope input):",
+        *(f"{stack} {count}" for stack, count in stacks.most_common()),
+    ]
+    return "\n".join(lines)
+
+
+async def _profile_cpu(
+    *,
+    duration_seconds: float,
+    sample_interval_ms: float,
+    top_entries: int,
+) -> str:
+    stacks, samples = await asyncio.to_thread(
+        _sample_stacks,
+        thread_id=threading.get_ident(),
+        duration_seconds=duration_seconds,
+        sample_interval_seconds=sample_interval_ms / 1000,
+    )
+    if not samples:
+        return "No samples were taken"
+    return _render_cpu_report(
+        stacks=stacks,
+        samples=samples,
+        duration_seconds=duration_seconds,
+        top_entries=top_entries,
+    )
+
+
+async def _profile_memory(
+    *,
+    duration_seconds: float,
+    top_entries: int,
+) -> str:
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start(DEFAULT_TRACEMALLOC_FRAMES)
+    try:
+        before = tracemalloc.take_snapshot()
+        await asyncio.sleep(duration_seconds)
+        after = tracemalloc.take_snapshot()
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+    snapshot_filters = (
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<unknown>"),
+        tracemalloc.Filter(False, tracemalloc.__file__),
+    )
+    before = before.filter_traces(snapshot_filters)
+    after = after.filter_traces(snapshot_filters)
+    by_line = after.compare_to(before, "lineno")
+    by_traceback = after.compare_to(before, "traceback")
+    size_diff = sum(stat.size_diff for stat in by_line)
+
+    lines = [
+        f"tracemalloc diff over {duration_seconds:.0f}s, "
+        f"net {size_diff / 1024:+.1f} KiB",
+        "",
+        "Top lines by growth:",
+        *(str(stat) for stat in by_line[:top_entries]),
+        "",
+        "Top allocation tracebacks by growth:",
+    ]
+    for stat in by_traceback[:10]:
+        lines.append(str(stat))
+        lines.extend(f"    {line}" for line in stat.traceback.format())
+    return "\n".join(lines)
+
+
+def _write_report(*, path: Path, report: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(report, encoding="utf-8")
+
+
+def is_profile_running() -> bool:
+    return _profile_lock.locked()
+
+
+async def run_profile(
+    *,
+    kind: ProfileKind,
+    duration_seconds: float,
+    output_dir: Path = DEFAULT_PROFILE_OUTPUT_DIR,
+    sample_interval_ms: float = DEFAULT_PROFILE_SAMPLE_INTERVAL_MS,
+    top_entries: int = DEFAULT_PROFILE_TOP_ENTRIES,
+) -> ProfileArtifact:
+    if is_profile_running():
+        raise ProfileBusyError("Another profile is already running")
+
+    async with _profile_lock:
+        logger.info("Starting %s profile for %ss", kind.value, duration_seconds)
+        if kind is ProfileKind.CPU:
+            report = await _profile_cpu(
+                duration_seconds=duration_seconds,
+                sample_interval_ms=sample_interval_ms,
+                top_entries=top_entries,
+            )
+        else:
+            report = await _profile_memory(
+                duration_seconds=duration_seconds,
+                top_entries=top_entries,
+            )
+
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    path = output_dir / f"{kind.value}-{stamp}.txt"
+    await asyncio.to_thread(_write_report, path=path, report=report)
+    logger.info("Saved %s profile to %s", kind.value, path)
+    return ProfileArtifact(kind=kind, path=path)
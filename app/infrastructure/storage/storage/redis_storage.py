@@ -0,0 +1,97 @@
+from contextvars import ContextVar
+from typing import Any, Optional
+
+import ormsgpack
+from aiogram.filters.state import StateType
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import (
+    BaseStorage,
+    DefaultKeyBuilder,
+    KeyBuilder,
+    StorageKey,
+)
+from redis.asyncio import Redis
+
+
+class RedisStorage(BaseStorage):
+    def __init__(
+        self,
+        redis: Redis,
+        key_builder: Optional[KeyBuilder] = None,
+        state_ttl_seconds: Optional[int] = None,
+        data_ttl_seconds: Optional[int] = None,
+        prefetch_data: bool = True,
+    ) -> None:
+        if key_builder is None:
+            key_builder = DefaultKeyBuilder()
+        self.redis = redis
+        self.state_ttl_seconds = state_ttl_seconds or None
+        self.data_ttl_seconds = data_ttl_seconds or None
+        self.prefetch_data = prefetch_data
+        self._key_builder = key_builder
+        # Data fetched in the same round trip as the state, until get_data takes
+        # it or clear_prefetched runs at the end of the update. aiogram reads the
+        # state in its FSM middleware and the handler reads the data later in the
+        # same update, so both calls share the update's context. One variable per
+        # instance, so storages with the same key scheme do not share values.
+        self._prefetched_data: ContextVar[
+            Optional[tuple[str, Optional[bytes]]]
+        ] = ContextVar(f"redis_storage_prefetched_data_{id(self)}", default=None)
+
+    async def set_state(self, key: StorageKey, state: StateType = None) -> None:
+        state = state.state if isinstance(state, State) else state
+        redis_key = self._key_builder.build(key, "state")
+        if not state:
+            await self.redis.delete(redis_key)
+            return
+        await self.redis.set(
+            redis_key, ormsgpack.packb(state), ex=self.state_ttl_seconds
+        )
+
+    async def get_state(self, key: StorageKey) -> Optional[str]:
+        state_key = self._key_builder.build(key, "state")
+        if not self.prefetch_data:
+            value = await self.redis.get(state_key)
+        else:
+            data_key = self._key_builder.build(key, "data")
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.get(state_key)
+                pipe.get(data_key)
+                value, data = await pipe.execute()
+            self._prefetched_data.set((data_key, data))
+        if value is None:
+            return None
+        return ormsgpack.unpackb(value)
+
+    async def set_data(self, key: StorageKey, data: dict[str, Any]) -> None:
+        redis_key = self._key_builder.build(key, "data")
+        self._drop_prefetched(redis_key)
+        if not data:
+            await self.redis.delete(redis_key)
+            return
+        await self.redis.set(
+            redis_key, ormsgpack.packb(data), ex=self.data_ttl_seconds
+        )
+
+    async def get_data(self, key: StorageKey) -> dict[str, Any]:
+        redis_key = self._key_builder.build(key, "data")
+        prefetched = self._prefetched_data.get()
+        if prefetched is not None and prefetched[0] == redis_key:
+            self._prefetched_data.set(None)
+            value = prefetched[1]
+        else:
+            value = await self.redis.get(redis_key)
+        if value is None:
+            return {}
+        return ormsgpack.unpackb(value)
+
+    def clear_prefetched(self) -> None:
+        self._prefetched_data.set(None)
+
+    def _drop_prefetched(self, redis_key: str) -> None:
+        prefetched = self._prefetched_data.get()
+        if prefetched is not None and prefetched[0] == redis_key:
+            self._prefetched_data.set(None)
+
+    async def close(self) -> None:
+        await self.redis.aclose()
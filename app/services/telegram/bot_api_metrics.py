@@ -0,0 +1,71 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+
+from app.infrastructure.metrics.metrics import (
+    BOT_API_DURATION,
+    BOT_API_ERRORS,
+    BOT_API_RETRY_AFTER,
+    BOT_API_RETRY_AFTER_SECONDS,
+)
+
+
+class ApiCaller(Enum):
+    HANDLER = "handler"
+    BROADCAST = "broadcast"
+    REMINDER = "reminder"
+    RELAY = "relay"
+    APPROVAL = "approval"
+    NOTIFICATION = "notification"
+
+
+_current_caller: ContextVar[ApiCaller] = ContextVar(
+    "api_caller",
+    default=ApiCaller.HANDLER,
+)
+
+
+@contextmanager
+def api_caller(caller: ApiCaller):
+    token = _current_caller.set(caller)
+    try:
+        yield
+    finally:
+        _current_caller.reset(token)
+
+
+class BotApiMetricsMiddleware(BaseRequestMiddleware):
+    # Registered after the send scheduler, so every attempt it makes is
+    # measured on its own and queueing time is left out.
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        method_name = type(method).__name__
+        caller = _current_caller.get().value
+        started_at = time.perf_counter()
+        try:
+            return await make_request(bot, method)
+        except TelegramRetryAfter as exc:
+            BOT_API_RETRY_AFTER.labels(method_name, caller).inc()
+            BOT_API_RETRY_AFTER_SECONDS.labels(method_name, caller).inc(exc.retry_after)
+            raise
+        except Exception as exc:
+            BOT_API_ERRORS.labels(method_name, caller, type(exc).__name__).inc()
+            raise
+        finally:
+            BOT_API_DURATION.labels(method_name, caller).observe(
+                time.perf_counter() - started_at
+            )
@@ -0,0 +1,94 @@
+import asyncio
+import logging
+
+from aiogram.exceptions import TelegramRetryAfter
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.bot.enums.delivery_log import DeliveryKind, DeliveryStatus
+from app.infrastructure.database.database.db import DB
+
+logger = logging.getLogger(__name__)
+DEFAULT_DELIVERY_LOG_FLUSH_SIZE = 500
+DEFAULT_DELIVERY_LOG_FLUSH_INTERVAL_SECONDS = 2.0
+
+
+def delivery_status_for_error(error: Exception) -> DeliveryStatus:
+    if isinstance(error, TelegramRetryAfter):
+        return DeliveryStatus.RATE_LIMITED
+    return DeliveryStatus.FAILED
+
+
+class DeliveryLogWriter:
+    def __init__(
+        self,
+        *,
+        session_maker: async_sessionmaker,
+        flush_size: int = DEFAULT_DELIVERY_LOG_FLUSH_SIZE,
+        flush_interval_seconds: float = DEFAULT_DELIVERY_LOG_FLUSH_INTERVAL_SECONDS,
+    ) -> None:
+        self._session_maker = session_maker
+        self._flush_size = max(1, flush_size)
+        self._flush_interval = flush_interval_seconds
+        self._buffer: list[tuple[int | None, int, str, str, int | None, str | None]] = []
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task | None = None
+
+    async def __aenter__(self) -> "DeliveryLogWriter":
+        self._flush_task = asyncio.create_task(self._flush_periodically())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+
+    async def add(
+        self,
+        *,
+        event_id: int | None,
+        user_id: int,
+        kind: DeliveryKind,
+        status: DeliveryStatus,
+        latency_ms: int | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        self._buffer.append(
+            (
+                event_id,
+                user_id,
+                kind.value,
+                status.value,
+                latency_ms,
+                type(error).__name__ if error is not None else None,
+            )
+        )
+        if len(self._buffer) >= self._flush_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            if not self._buffer:
+                return
+            records = self._buffer
+            self._buffer = []
+            try:
+                async with self._session_maker() as session:
+                    await DB(session).delivery_log.copy_records(records=records)
+                    await session.commit()
+            except Exception as exc:
+                # The log is diagnostic, losing a batch must not break delivery.
+                logger.warning(
+                    "Failed to write %d delivery log records: %s",
+                    len(records),
+                    exc,
+                )
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            await self.flush()
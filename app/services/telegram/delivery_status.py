@@ -6,6 +6,8 @@ from aiogram.exceptions import (
 
 from app.infrastructure.database.database.db import DB
 
+DEFAULT_DELIVERY_FAILURE_FLUSH_SIZE = 200
+
 _BLOCKED_MARKERS = (
     "bot was blocked by the user",
     "forbidden: bot was blocked by the user",
@@ -20,31 +22,61 @@ _UNREACHABLE_MARKERS = (
 )
 
 
-async def apply_delivery_error_status(
-    *,
-    db: DB,
-    user_id: int,
-    error: Exception,
-) -> bool:
+def classify_delivery_error(error: Exception) -> bool | None:
+    # Returns is_blocked for unreachable users, None for transient errors.
     if isinstance(error, TelegramForbiddenError):
         error_text = str(error).lower()
-        if any(marker in error_text for marker in _BLOCKED_MARKERS):
-            await db.users.mark_unreachable(user_id=user_id, is_blocked=True)
-        else:
-            await db.users.mark_unreachable(user_id=user_id, is_blocked=False)
-        return True
+        return any(marker in error_text for marker in _BLOCKED_MARKERS)
 
     if isinstance(error, TelegramNotFound):
-        await db.users.mark_unreachable(user_id=user_id, is_blocked=False)
-        return True
+        return False
 
     if isinstance(error, TelegramBadRequest):
         error_text = str(error).lower()
         if any(marker in error_text for marker in _BLOCKED_MARKERS):
-            await db.users.mark_unreachable(user_id=user_id, is_blocked=True)
             return True
         if any(marker in error_text for marker in _UNREACHABLE_MARKERS):
-            await db.users.mark_unreachable(user_id=user_id, is_blocked=False)
-            return True
+            return False
+
+    return None
+
+
+class DeliveryFailureCollector:
+    # Batches unreachable users into mark_unreachable_many on the caller's
+    # session: a flush every flush_size failures and one on a clean exit. There
+    # is no timed flush, a broadcast collects the failures of each page.
+    def __init__(
+        self,
+        *,
+        db: DB,
+        flush_size: int = DEFAULT_DELIVERY_FAILURE_FLUSH_SIZE,
+    ) -> None:
+        self._db = db
+        self._flush_size = max(1, flush_size)
+        self._pending: dict[int, bool] = {}
+
+    async def __aenter__(self) -> "DeliveryFailureCollector":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        # The caller's transaction is rolled back after an error, nothing to write.
+        if exc_type is None:
+            await self.flush()
+
+    async def add(self, *, user_id: int, error: Exception) -> bool:
+        is_blocked = classify_delivery_error(error)
+        if is_blocked is None:
+            return False
+        self._pending[user_id] = is_blocked
+        if len(self._pending) >= self._flush_size:
+            await self.flush()
+        return True
 
-    return False
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+        pending = self._pending
+        self._pending = {}
+        await self._db.users.mark_unreachable_many(
+            statuses=list(pending.items()),
+        )
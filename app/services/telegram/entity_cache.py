@@ -0,0 +1,131 @@
+import logging
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from telethon.tl.types import InputPeerChannel, InputPeerChat, InputPeerUser
+
+from app.infrastructure.database.database.db import DB
+
+logger = logging.getLogger(__name__)
+
+PEER_TYPE_USER = "user"
+PEER_TYPE_CHANNEL = "channel"
+PEER_TYPE_CHAT = "chat"
+
+InputPeer = InputPeerUser | InputPeerChannel | InputPeerChat
+
+
+def user_key(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def username_key(username: str) -> str:
+    return f"username:{username.lstrip('@').lower()}"
+
+
+def channel_key(channel_id: int) -> str:
+    return f"channel:{channel_id}"
+
+
+def _describe_peer(peer: InputPeer) -> tuple[str, int, int | None] | None:
+    if isinstance(peer, InputPeerUser):
+        return PEER_TYPE_USER, peer.user_id, peer.access_hash
+    if isinstance(peer, InputPeerChannel):
+        return PEER_TYPE_CHANNEL, peer.channel_id, peer.access_hash
+    if isinstance(peer, InputPeerChat):
+        return PEER_TYPE_CHAT, peer.chat_id, None
+    return None
+
+
+def _build_peer(
+    *,
+    peer_type: str,
+    entity_id: int,
+    access_hash: int | None,
+) -> InputPeer | None:
+    if peer_type == PEER_TYPE_USER and access_hash is not None:
+        return InputPeerUser(user_id=entity_id, access_hash=access_hash)
+    if peer_type == PEER_TYPE_CHANNEL and access_hash is not None:
+        return InputPeerChannel(channel_id=entity_id, access_hash=access_hash)
+    if peer_type == PEER_TYPE_CHAT:
+        return InputPeerChat(chat_id=entity_id)
+    return None
+
+
+class TelethonEntityCache:
+    def __init__(self, *, session_maker: async_sessionmaker | None = None) -> None:
+        self._session_maker = session_maker
+        self._peers: dict[str, InputPeer] = {}
+
+    async def get(self, key: str) -> InputPeer | None:
+        # Storage errors degrade to a cache miss, callers resolve via Telethon.
+        peer = self._peers.get(key)
+        if peer is not None or self._session_maker is None:
+            return peer
+
+        try:
+            async with self._session_maker() as session:
+                record = await DB(session).telethon_entities.get(key=key)
+        except Exception as exc:
+            logger.warning("Failed to read Telethon entity %s from cache: %s", key, exc)
+            return None
+        if record is None:
+            return None
+
+        peer = _build_peer(
+            peer_type=record.peer_type,
+            entity_id=record.entity_id,
+            access_hash=record.access_hash,
+        )
+        if peer is not None:
+            self._peers[key] = peer
+        return peer
+
+    async def put(self, keys: list[str], peer) -> None:
+        described = _describe_peer(peer)
+        if described is None or not keys:
+            return
+        peer_type, entity_id, access_hash = described
+        for key in keys:
+            self._peers[key] = peer
+        if self._session_maker is None:
+            return
+
+        try:
+            async with self._session_maker() as session:
+                await DB(session).telethon_entities.upsert(
+                    keys=keys,
+                    peer_type=peer_type,
+                    entity_id=entity_id,
+                    access_hash=access_hash,
+                )
+                await session.commit()
+        except Exception as exc:
+            logger.warning("Failed to store Telethon entity %s in cache: %s", keys, exc)
+
+    async def forget(self, peer) -> None:
+        described = _describe_peer(peer)
+        if described is None:
+            return
+        peer_type, entity_id, _ = described
+        self._peers = {
+            key: cached
+            for key, cached in self._peers.items()
+            if _describe_peer(cached)[:2] != (peer_type, entity_id)
+        }
+        if self._session_maker is None:
+            return
+
+        try:
+            async with self._session_maker() as session:
+                await DB(session).telethon_entities.delete_by_entity(
+                    peer_type=peer_type,
+                    entity_id=entity_id,
+                )
+                await session.commit()
+        except Exception as exc:
+            logger.warning(
+                "Failed to drop Telethon entity %s:%s from cache: %s",
+                peer_type,
+                entity_id,
+                exc,
+            )
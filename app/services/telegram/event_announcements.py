@@ -0,0 +1,272 @@
+import html
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+from fluentogram import TranslatorRunner
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.bot.dialogs.events.utils import build_event_text
+from app.bot.enums.delivery_log import DeliveryKind, DeliveryStatus
+from app.bot.enums.roles import UserRole
+from app.bot.handlers.event_chats import EVENT_JOIN_CHAT_CALLBACK
+from app.infrastructure.database.database.db import DB
+from app.services.telegram.delivery_log import DeliveryLogWriter, delivery_status_for_error
+from app.services.telegram.delivery_status import DeliveryFailureCollector
+from app.utils.datetime import format_event_datetime
+
+logger = logging.getLogger(__name__)
+RECIPIENT_CHUNK_SIZE = 1000
+
+
+def build_event_announcement_payload(event) -> dict[str, object]:
+    return {
+        "id": event.id,
+        "name": event.name or "",
+        "event_datetime": event.event_datetime,
+        "address": event.address or "",
+        "description": event.description or "",
+        "price": event.price,
+        "age_group": event.age_group,
+        "photo_file_id": event.photo_file_id,
+        "channel_id": event.channel_id,
+        "channel_message_id": event.channel_message_id,
+    }
+
+
+def _build_channel_post_link_by_id(
+    channel_id: int | None,
+    message_id: int | None,
+) -> str | None:
+    if not channel_id or not message_id:
+        return None
+    chat_id_str = str(channel_id)
+    if chat_id_str.startswith("-100"):
+        channel_id_str = chat_id_str[4:]
+    else:
+        channel_id_str = str(abs(channel_id))
+    return f"https://t.me/c/{channel_id_str}/{message_id}"
+
+
+async def send_event_announcement_to_user(
+    *,
+    bot,
+    i18n: TranslatorRunner,
+    user_id: int,
+    event_payload: dict[str, object],
+) -> None:
+    event_text = build_event_text(
+        {
+            "name": event_payload.get("name"),
+            "datetime": event_payload.get("event_datetime"),
+            "address": event_payload.get("address"),
+            "description": event_payload.get("description"),
+            "price": event_payload.get("price"),
+            "age_group": event_payload.get("age_group"),
+        },
+        i18n,
+    )
+    post_url = _build_channel_post_link_by_id(
+        event_payload.get("channel_id"),
+        event_payload.get("channel_message_id"),
+    )
+    event_id = event_payload.get("id")
+    keyboard_rows = []
+    if isinstance(event_id, int):
+        keyboard_rows.append(
+            [
+                InlineKeyboardButton(
+                    text=i18n.partner.event.join.chat.button(),
+                    callback_data=f"{EVENT_JOIN_CHAT_CALLBACK}:{event_id}",
+                )
+            ]
+        )
+    if post_url:
+        keyboard_rows.append(
+            [
+                InlineKeyboardButton(
+                    text=i18n.partner.event.view.post.button(),
+                    url=post_url,
+                )
+            ]
+        )
+    keyboard = (
+        InlineKeyboardMarkup(inline_keyboard=keyboard_rows)
+        if keyboard_rows
+        else None
+    )
+    photo_id = event_payload.get("photo_file_id")
+    if photo_id:
+        await bot.send_photo(
+            user_id,
+            photo=photo_id,
+            caption=event_text,
+            reply_markup=keyboard,
+        )
+    else:
+        await bot.send_message(
+            user_id,
+            text=event_text,
+            reply_markup=keyboard,
+        )
+
+
+def build_event_digest(
+    *,
+    i18n: TranslatorRunner,
+    events: list,
+) -> tuple[str, InlineKeyboardMarkup]:
+    items = [
+        i18n.partner.event.digest.item(
+            event_name=html.escape(event.name or ""),
+            datetime=html.escape(format_event_datetime(event.event_datetime)),
+            address=html.escape(event.address or ""),
+        )
+        for event in events
+    ]
+    text = "\n\n".join(
+        [
+            i18n.partner.event.digest.title(),
+            *items,
+            i18n.partner.event.digest.hint(),
+        ]
+    )
+    keyboard = InlineKeyboardMarkup(
+        inline_keyboard=[
+            [
+                InlineKeyboardButton(
+                    text=_truncate_button_text(event.name or f"#{event.id}"),
+                    callback_data=f"{EVENT_JOIN_CHAT_CALLBACK}:{event.id}",
+                )
+            ]
+            for event in events
+        ]
+    )
+    return text, keyboard
+
+
+def _truncate_button_text(text: str, limit: int = 60) -> str:
+    if len(text) <= limit:
+        return text
+    return text[: limit - 3] + "..."
+
+
+async def _deliver_to_active_users(
+    *,
+    session_maker: async_sessionmaker,
+    event_ids: list[int],
+    send: Callable[[int], Awaitable[None]],
+    delivery_log: DeliveryLogWriter | None,
+) -> None:
+    # Every page is read in its own short session and no transaction stays
+    # open while the messages go out, a large audience takes a long time.
+    async with session_maker() as session:
+        max_user_id = await DB(session).users.get_max_id()
+
+    log_event_ids: list[int | None] = list(event_ids) or [None]
+    after_user_id: int | None = None
+    while True:
+        async with session_maker() as session:
+            user_ids = await DB(session).users.get_active_user_ids_page(
+                role=UserRole.USER,
+                max_id=max_user_id,
+                after_user_id=after_user_id,
+                limit=RECIPIENT_CHUNK_SIZE,
+                # A resumed broadcast skips users who already got these
+                # announcements.
+                exclude_delivered_event_ids=(
+                    event_ids if delivery_log is not None else None
+                ),
+            )
+        if not user_ids:
+            return
+        after_user_id = user_ids[-1]
+
+        failures: list[tuple[int, Exception]] = []
+        for user_id in user_ids:
+            started_at = time.monotonic()
+            error: Exception | None = None
+            try:
+                await send(user_id)
+            except Exception as exc:
+                error = exc
+                failures.append((user_id, exc))
+                logger.warning(
+                    "Failed to send event announcement to user_id=%s: %s",
+                    user_id,
+                    exc,
+                )
+            if delivery_log is None:
+                continue
+            latency_ms = int((time.monotonic() - started_at) * 1000)
+            for event_id in log_event_ids:
+                await delivery_log.add(
+                    event_id=event_id,
+                    user_id=user_id,
+                    kind=DeliveryKind.ANNOUNCEMENT,
+                    status=(
+                        DeliveryStatus.DELIVERED
+                        if error is None
+                        else delivery_status_for_error(error)
+                    ),
+                    latency_ms=latency_ms,
+                    error=error,
+                )
+
+        # Unreachable users are marked once per page, in a session of their own.
+        if failures:
+            async with session_maker() as session:
+                delivery_failures = DeliveryFailureCollector(db=DB(session))
+                async with delivery_failures:
+                    for user_id, error in failures:
+                        await delivery_failures.add(user_id=user_id, error=error)
+                await session.commit()
+
+
+async def broadcast_event_announcement(
+    *,
+    bot,
+    i18n: TranslatorRunner,
+    session_maker: async_sessionmaker,
+    event_payload: dict[str, object],
+    delivery_log: DeliveryLogWriter | None = None,
+) -> None:
+    event_id = event_payload.get("id")
+
+    async def send(user_id: int) -> None:
+        await send_event_announcement_to_user(
+            bot=bot,
+            i18n=i18n,
+            user_id=user_id,
+            event_payload=event_payload,
+        )
+
+    await _deliver_to_active_users(
+        session_maker=session_maker,
+        event_ids=[event_id] if isinstance(event_id, int) else [],
+        send=send,
+        delivery_log=delivery_log,
+    )
+
+
+async def broadcast_event_digest(
+    *,
+    bot,
+    i18n: TranslatorRunner,
+    session_maker: async_sessionmaker,
+    events: list,
+    delivery_log: DeliveryLogWriter | None = None,
+) -> None:
+    # The digest is rendered once and the same message goes to every user.
+    text, keyboard = build_event_digest(i18n=i18n, events=events)
+
+    async def send(user_id: int) -> None:
+        await bot.send_message(user_id, text=text, reply_markup=keyboard)
+
+    await _deliver_to_active_users(
+        session_maker=session_maker,
+        event_ids=[event.id for event in events],
+        send=send,
+        delivery_log=delivery_log,
+    )
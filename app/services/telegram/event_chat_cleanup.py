@@ -1,14 +1,29 @@
 import asyncio
 import logging
+from dataclasses import dataclass
+from datetime import timedelta
 
 from sqlalchemy.ext.asyncio import async_sessionmaker
+from telethon.errors.rpcerrorlist import FloodWaitError
 
 from app.infrastructure.database.database.db import DB
 from app.services.telegram.private_event_chats import EventPrivateChatService
 from app.utils.datetime import now_utc
+from app.utils.workers import build_worker_id
 
 logger = logging.getLogger(__name__)
 DEFAULT_EVENT_CHAT_CLEANUP_INTERVAL_SECONDS = 300
+DEFAULT_EVENT_CHAT_CLEANUP_BATCH_SIZE = 20
+DEFAULT_EVENT_CHAT_CLEANUP_CONCURRENCY = 3
+DEFAULT_EVENT_CHAT_DELETE_TIMEOUT_SECONDS = 30
+DEFAULT_EVENT_CHAT_CLEANUP_CLAIM_TTL = timedelta(minutes=10)
+
+
+@dataclass(frozen=True)
+class EventChatCleanupResult:
+    claimed: int
+    deleted: int
+    flood_wait_seconds: int | None = None
 
 
 def _get_event_chat_id(event) -> int | None:
@@ -19,39 +34,158 @@ def _get_event_chat_id(event) -> int | None:
     return None
 
 
+async def _mark_deleted(
+    *,
+    session_maker: async_sessionmaker,
+    event_id: int,
+) -> None:
+    async with session_maker() as session:
+        await DB(session).events.mark_private_chat_deleted(event_id=event_id)
+        await session.commit()
+
+
+async def _release_claim(
+    *,
+    session_maker: async_sessionmaker,
+    event_id: int,
+    worker_id: str,
+) -> None:
+    async with session_maker() as session:
+        await DB(session).events.release_private_chat_cleanup_claim(
+            event_id=event_id,
+            worker_id=worker_id,
+        )
+        await session.commit()
+
+
+async def _reschedule(
+    *,
+    session_maker: async_sessionmaker,
+    event_id: int,
+    worker_id: str,
+    delay_seconds: int,
+) -> None:
+    async with session_maker() as session:
+        await DB(session).events.reschedule_private_chat_cleanup(
+            event_id=event_id,
+            worker_id=worker_id,
+            retry_at=now_utc() + timedelta(seconds=delay_seconds),
+        )
+        await session.commit()
+
+
 async def cleanup_due_event_chats_once(
     *,
     session_maker: async_sessionmaker,
     event_private_chat_service: EventPrivateChatService | None,
-    batch_size: int = 20,
-) -> None:
+    worker_id: str,
+    batch_size: int = DEFAULT_EVENT_CHAT_CLEANUP_BATCH_SIZE,
+    concurrency: int = DEFAULT_EVENT_CHAT_CLEANUP_CONCURRENCY,
+    delete_timeout_seconds: float = DEFAULT_EVENT_CHAT_DELETE_TIMEOUT_SECONDS,
+    claim_ttl: timedelta = DEFAULT_EVENT_CHAT_CLEANUP_CLAIM_TTL,
+) -> EventChatCleanupResult:
     if event_private_chat_service is None or not event_private_chat_service.connected:
-        return
+        return EventChatCleanupResult(claimed=0, deleted=0)
 
     async with session_maker() as session:
-        db = DB(session)
-        due_events = await db.events.list_private_chats_due_for_deletion(
-            delete_before=now_utc(),
+        current_time = now_utc()
+        due_events = await DB(session).events.claim_private_chats_due_for_deletion(
+            delete_before=current_time,
+            worker_id=worker_id,
+            claim_expired_before=current_time - claim_ttl,
             limit=batch_size,
         )
-        for event in due_events:
+        # Commit the claim right away so other workers skip these rows.
+        await session.commit()
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    flood_wait_seconds: int | None = None
+    deleted = 0
+
+    async def process(event) -> None:
+        nonlocal flood_wait_seconds, deleted
+        async with semaphore:
+            if flood_wait_seconds is not None:
+                # The account is rate limited, do not start new deletions.
+                await _reschedule(
+                    session_maker=session_maker,
+                    event_id=event.id,
+                    worker_id=worker_id,
+                    delay_seconds=flood_wait_seconds,
+                )
+                return
+
             chat_id = _get_event_chat_id(event)
             if chat_id is None:
-                await db.events.mark_private_chat_deleted(event_id=event.id)
-                continue
+                await _mark_deleted(session_maker=session_maker, event_id=event.id)
+                deleted += 1
+                return
 
-            deleted = await event_private_chat_service.delete_event_chat(chat_id=chat_id)
-            if not deleted:
+            try:
+                is_deleted = await asyncio.wait_for(
+                    event_private_chat_service.delete_event_chat(chat_id=chat_id),
+                    timeout=delete_timeout_seconds,
+                )
+            except FloodWaitError as exc:
+                flood_wait_seconds = max(flood_wait_seconds or 0, int(exc.seconds))
+                logger.warning(
+                    "Telethon flood wait while deleting chat for event_id=%s: %s sec",
+                    event.id,
+                    exc.seconds,
+                )
+                await _reschedule(
+                    session_maker=session_maker,
+                    event_id=event.id,
+                    worker_id=worker_id,
+                    delay_seconds=int(exc.seconds),
+                )
+                return
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "Deferred deletion of private chat timed out for event_id=%s chat_id=%s",
+                    event.id,
+                    chat_id,
+                )
+                await _release_claim(
+                    session_maker=session_maker,
+                    event_id=event.id,
+                    worker_id=worker_id,
+                )
+                return
+
+            if not is_deleted:
                 logger.warning(
                     "Deferred deletion of private chat failed for event_id=%s chat_id=%s",
                     event.id,
                     chat_id,
                 )
-                continue
+                await _release_claim(
+                    session_maker=session_maker,
+                    event_id=event.id,
+                    worker_id=worker_id,
+                )
+                return
 
-            await db.events.mark_private_chat_deleted(event_id=event.id)
+            await _mark_deleted(session_maker=session_maker, event_id=event.id)
+            deleted += 1
 
-        await session.commit()
+    results = await asyncio.gather(
+        *(process(event) for event in due_events),
+        return_exceptions=True,
+    )
+    for event, result in zip(due_events, results):
+        if isinstance(result, Exception):
+            logger.error(
+                "Private chat cleanup failed for event_id=%s",
+                event.id,
+                exc_info=result,
+            )
+
+    return EventChatCleanupResult(
+        claimed=len(due_events),
+        deleted=deleted,
+        flood_wait_seconds=flood_wait_seconds,
+    )
 
 
 async def run_event_chat_cleanup_loop(
@@ -59,16 +193,30 @@ async def run_event_chat_cleanup_loop(
     session_maker: async_sessionmaker,
     event_private_chat_service: EventPrivateChatService | None,
     interval_seconds: int = DEFAULT_EVENT_CHAT_CLEANUP_INTERVAL_SECONDS,
+    batch_size: int = DEFAULT_EVENT_CHAT_CLEANUP_BATCH_SIZE,
+    concurrency: int = DEFAULT_EVENT_CHAT_CLEANUP_CONCURRENCY,
+    delete_timeout_seconds: float = DEFAULT_EVENT_CHAT_DELETE_TIMEOUT_SECONDS,
 ) -> None:
+    worker_id = build_worker_id("chat-cleanup")
     while True:
+        sleep_seconds: float = interval_seconds
         try:
-            await cleanup_due_event_chats_once(
+            result = await cleanup_due_event_chats_once(
                 session_maker=session_maker,
                 event_private_chat_service=event_private_chat_service,
+                worker_id=worker_id,
+                batch_size=batch_size,
+                concurrency=concurrency,
+                delete_timeout_seconds=delete_timeout_seconds,
             )
+            if result.flood_wait_seconds is not None:
+                sleep_seconds = max(interval_seconds, result.flood_wait_seconds)
+            elif result.claimed >= batch_size and result.deleted > 0:
+                # Backlog is not drained yet, take the next batch right away.
+                sleep_seconds = 0
         except asyncio.CancelledError:
             raise
         except Exception:
             logger.exception("Event chat cleanup loop failed")
 
-        await asyncio.sleep(interval_seconds)
+        await asyncio.sleep(sleep_seconds)
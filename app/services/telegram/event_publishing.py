@@ -0,0 +1,324 @@
+import asyncio
+import logging
+from datetime import timedelta
+
+from aiogram import Bot
+from fluentogram import TranslatorHub
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.bot.enums.event_publish_stages import EventPublishStage
+from app.bot.handlers.event_chats import ensure_event_private_chat
+from app.infrastructure.database.database.db import DB
+from app.services.telegram.bot_api_metrics import ApiCaller, api_caller
+from app.services.telegram.delivery_log import DeliveryLogWriter
+from app.services.telegram.event_announcements import (
+    broadcast_event_announcement,
+    broadcast_event_digest,
+    build_event_announcement_payload,
+)
+from app.services.telegram.private_event_chats import EventPrivateChatService
+from app.services.telegram.send_scheduler import SendPriority, send_priority
+from app.utils.datetime import now_utc
+from app.utils.workers import build_worker_id
+
+logger = logging.getLogger(__name__)
+DEFAULT_EVENT_PUBLISHING_INTERVAL_SECONDS = 5
+DEFAULT_EVENT_PUBLISHING_BATCH_SIZE = 10
+DEFAULT_EVENT_PUBLISHING_MAX_ATTEMPTS = 5
+DEFAULT_EVENT_PUBLISHING_CLAIM_TTL = timedelta(minutes=30)
+EVENT_PUBLISHING_RETRY_BASE_DELAY = timedelta(seconds=30)
+EVENT_PUBLISHING_RETRY_MAX_DELAY = timedelta(minutes=30)
+DEFAULT_EVENT_DIGEST_MAX_EVENTS = 10
+
+
+class EventPublishStageError(Exception):
+    pass
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    delay = EVENT_PUBLISHING_RETRY_BASE_DELAY * (2 ** max(0, attempts - 1))
+    return min(delay, EVENT_PUBLISHING_RETRY_MAX_DELAY)
+
+
+async def _run_private_chat_stage(
+    *,
+    db: DB,
+    event_id: int,
+    event_private_chat_service: EventPrivateChatService | None,
+) -> None:
+    if event_private_chat_service is None or not event_private_chat_service.connected:
+        raise EventPublishStageError("private chat service is not connected")
+
+    event = await ensure_event_private_chat(
+        db=db,
+        event_id=event_id,
+        event_private_chat_service=event_private_chat_service,
+    )
+    if event is None:
+        return
+    if getattr(event, "private_chat_deleted_at", None) is not None:
+        return
+    # Past its delete time the chat is not created any more, nothing to retry.
+    private_chat_delete_at = getattr(event, "private_chat_delete_at", None)
+    if private_chat_delete_at is not None and private_chat_delete_at <= now_utc():
+        return
+    if not (getattr(event, "private_chat_invite_link", None) or "").strip():
+        raise EventPublishStageError("private chat was not created")
+
+
+async def _run_broadcast_stage(
+    *,
+    bot: Bot,
+    session_maker: async_sessionmaker,
+    translator_hub: TranslatorHub,
+    event_ids: list[int],
+) -> None:
+    events = []
+    async with session_maker() as session:
+        db = DB(session)
+        for event_id in event_ids:
+            event = await db.events.get_event_by_id(event_id=event_id)
+            if event is not None:
+                events.append(event)
+    if not events:
+        return
+
+    i18n = translator_hub.get_translator_by_locale("ru")
+    async with DeliveryLogWriter(session_maker=session_maker) as delivery_log:
+        with send_priority(SendPriority.BULK), api_caller(ApiCaller.BROADCAST):
+            if len(events) == 1:
+                await broadcast_event_announcement(
+                    bot=bot,
+                    i18n=i18n,
+                    session_maker=session_maker,
+                    event_payload=build_event_announcement_payload(events[0]),
+                    delivery_log=delivery_log,
+                )
+            else:
+                await broadcast_event_digest(
+                    bot=bot,
+                    i18n=i18n,
+                    session_maker=session_maker,
+                    events=events,
+                    delivery_log=delivery_log,
+                )
+
+
+async def _run_stage(
+    *,
+    jobs: list,
+    bot: Bot,
+    session_maker: async_sessionmaker,
+    translator_hub: TranslatorHub,
+    event_private_chat_service: EventPrivateChatService | None,
+) -> None:
+    # Several jobs are only passed together for a digest of broadcast stages.
+    stage = jobs[0].stage
+    if stage == EventPublishStage.PRIVATE_CHAT:
+        async with session_maker() as session:
+            await _run_private_chat_stage(
+                db=DB(session),
+                event_id=jobs[0].event_id,
+                event_private_chat_service=event_private_chat_service,
+            )
+            await session.commit()
+    elif stage == EventPublishStage.BROADCAST:
+        # Opens its own short sessions, the fan-out runs outside a transaction.
+        await _run_broadcast_stage(
+            bot=bot,
+            session_maker=session_maker,
+            translator_hub=translator_hub,
+            event_ids=[job.event_id for job in jobs],
+        )
+    else:
+        raise EventPublishStageError(f"unknown stage {stage}")
+
+
+async def _extend_claims_periodically(
+    *,
+    session_maker: async_sessionmaker,
+    jobs: list,
+    worker_id: str,
+    interval_seconds: float,
+) -> None:
+    # A broadcast to a large audience outlives the claim TTL, without this
+    # another worker would reclaim the stage and send it a second time.
+    job_ids = [job.id for job in jobs]
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            async with session_maker() as session:
+                extended = await DB(session).event_publish_stages.extend_claim(
+                    job_ids=job_ids,
+                    worker_id=worker_id,
+                )
+                await session.commit()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception(
+                "Failed to extend claims of event publish stages job_ids=%s",
+                job_ids,
+            )
+            continue
+        if extended < len(job_ids):
+            logger.warning(
+                "Event publish stages job_ids=%s lost their claim, %d of %d extended",
+                job_ids,
+                extended,
+                len(job_ids),
+            )
+
+
+async def _finish_stage(
+    *,
+    session_maker: async_sessionmaker,
+    job,
+    worker_id: str,
+    error: Exception | None,
+    max_attempts: int,
+) -> None:
+    async with session_maker() as session:
+        stages = DB(session).event_publish_stages
+        if error is None:
+            await stages.mark_done(job_id=job.id, worker_id=worker_id)
+        elif job.attempts >= max_attempts:
+            await stages.mark_failed(
+                job_id=job.id,
+                worker_id=worker_id,
+                error=str(error)[:1000],
+            )
+        else:
+            await stages.reschedule(
+                job_id=job.id,
+                worker_id=worker_id,
+                next_attempt_at=now_utc() + _retry_delay(job.attempts),
+                error=str(error)[:1000],
+            )
+        await session.commit()
+
+
+async def process_due_publish_stages_once(
+    *,
+    bot: Bot,
+    session_maker: async_sessionmaker,
+    translator_hub: TranslatorHub,
+    event_private_chat_service: EventPrivateChatService | None,
+    worker_id: str,
+    batch_size: int = DEFAULT_EVENT_PUBLISHING_BATCH_SIZE,
+    max_attempts: int = DEFAULT_EVENT_PUBLISHING_MAX_ATTEMPTS,
+    claim_ttl: timedelta = DEFAULT_EVENT_PUBLISHING_CLAIM_TTL,
+    digest_enabled: bool = False,
+    digest_max_events: int = DEFAULT_EVENT_DIGEST_MAX_EVENTS,
+) -> int:
+    async with session_maker() as session:
+        current_time = now_utc()
+        jobs = await DB(session).event_publish_stages.claim_due(
+            now=current_time,
+            worker_id=worker_id,
+            claim_expired_before=current_time - claim_ttl,
+            limit=batch_size,
+        )
+        # Commit the claim right away so other workers skip these rows.
+        await session.commit()
+    claimed = len(jobs)
+
+    job_groups = [[job] for job in jobs]
+    if digest_enabled:
+        broadcast_jobs = [job for job in jobs if job.stage == EventPublishStage.BROADCAST]
+        if broadcast_jobs and len(broadcast_jobs) < digest_max_events:
+            # Sweep broadcasts still inside their window into the same digest.
+            async with session_maker() as session:
+                broadcast_jobs += await DB(session).event_publish_stages.claim_pending_stage(
+                    stage=EventPublishStage.BROADCAST,
+                    worker_id=worker_id,
+                    claim_expired_before=now_utc() - claim_ttl,
+                    limit=digest_max_events - len(broadcast_jobs),
+                )
+                await session.commit()
+        job_groups = [
+            [job] for job in jobs if job.stage != EventPublishStage.BROADCAST
+        ]
+        if broadcast_jobs:
+            job_groups.append(broadcast_jobs)
+
+    for group in job_groups:
+        error: Exception | None = None
+        heartbeat = asyncio.create_task(
+            _extend_claims_periodically(
+                session_maker=session_maker,
+                jobs=group,
+                worker_id=worker_id,
+                interval_seconds=claim_ttl.total_seconds() / 3,
+            )
+        )
+        try:
+            await _run_stage(
+                jobs=group,
+                bot=bot,
+                session_maker=session_maker,
+                translator_hub=translator_hub,
+                event_private_chat_service=event_private_chat_service,
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            error = exc
+            logger.warning(
+                "Event publish stage %s failed for event_ids=%s: %s",
+                group[0].stage.value,
+                [job.event_id for job in group],
+                exc,
+            )
+        finally:
+            heartbeat.cancel()
+            try:
+                await heartbeat
+            except asyncio.CancelledError:
+                pass
+        for job in group:
+            await _finish_stage(
+                session_maker=session_maker,
+                job=job,
+                worker_id=worker_id,
+                error=error,
+                max_attempts=max_attempts,
+            )
+    return claimed
+
+
+async def run_event_publishing_loop(
+    *,
+    bot: Bot,
+    session_maker: async_sessionmaker,
+    translator_hub: TranslatorHub,
+    event_private_chat_service: EventPrivateChatService | None,
+    interval_seconds: int = DEFAULT_EVENT_PUBLISHING_INTERVAL_SECONDS,
+    batch_size: int = DEFAULT_EVENT_PUBLISHING_BATCH_SIZE,
+    max_attempts: int = DEFAULT_EVENT_PUBLISHING_MAX_ATTEMPTS,
+    digest_enabled: bool = False,
+    digest_max_events: int = DEFAULT_EVENT_DIGEST_MAX_EVENTS,
+) -> None:
+    worker_id = build_worker_id("publishing")
+    while True:
+        sleep_seconds: float = interval_seconds
+        try:
+            claimed = await process_due_publish_stages_once(
+                bot=bot,
+                session_maker=session_maker,
+                translator_hub=translator_hub,
+                event_private_chat_service=event_private_chat_service,
+                worker_id=worker_id,
+                batch_size=batch_size,
+                max_attempts=max_attempts,
+                digest_enabled=digest_enabled,
+                digest_max_events=digest_max_events,
+            )
+            if claimed >= batch_size:
+                sleep_seconds = 0
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Event publishing loop failed")
+
+        await asyncio.sleep(sleep_seconds)
@@ -1,6 +1,7 @@
 import asyncio
 import html
 import logging
+import time
 from datetime import timedelta
 
 from aiogram import Bot
@@ -8,14 +9,21 @@ from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 from fluentogram import TranslatorHub
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
+from app.bot.enums.delivery_log import DeliveryKind, DeliveryStatus
 from app.infrastructure.database.database.db import DB
-from app.services.telegram.delivery_status import apply_delivery_error_status
+from app.infrastructure.database.rows import DueReminderEvent
+from app.services.telegram.bot_api_metrics import ApiCaller, api_caller
+from app.services.telegram.delivery_log import DeliveryLogWriter, delivery_status_for_error
+from app.services.telegram.delivery_status import DeliveryFailureCollector
+from app.services.telegram.send_scheduler import SendPriority, send_priority
 from app.utils.datetime import format_event_datetime, now_utc
+from app.utils.workers import build_worker_id
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_EVENT_REMINDER_INTERVAL_SECONDS = 300
 DEFAULT_EVENT_REMINDER_BATCH_SIZE = 50
+DEFAULT_EVENT_REMINDER_CLAIM_TTL = timedelta(minutes=10)
 EVENT_REMINDER_LEAD_TIME = timedelta(days=1)
 
 
@@ -34,11 +42,11 @@ def _build_channel_post_link(
     return f"https://t.me/c/{channel_id_str}/{message_id}"
 
 
-def _can_show_event_chat_link(event) -> bool:
-    if getattr(event, "private_chat_deleted_at", None) is not None:
+def _can_show_event_chat_link(event: DueReminderEvent) -> bool:
+    if event.private_chat_deleted_at is not None:
         return False
 
-    delete_at = getattr(event, "private_chat_delete_at", None)
+    delete_at = event.private_chat_delete_at
     if delete_at is not None and delete_at <= now_utc():
         return False
 
@@ -84,7 +92,9 @@ async def send_due_event_reminders_once(
     bot: Bot,
     session_maker: async_sessionmaker,
     translator_hub: TranslatorHub,
+    worker_id: str,
     batch_size: int = DEFAULT_EVENT_REMINDER_BATCH_SIZE,
+    claim_ttl: timedelta = DEFAULT_EVENT_REMINDER_CLAIM_TTL,
 ) -> None:
     current_time = now_utc()
     remind_before = current_time + EVENT_REMINDER_LEAD_TIME
@@ -92,56 +102,87 @@ async def send_due_event_reminders_once(
 
     async with session_maker() as session:
         db = DB(session)
-        due_reminders = await db.event_registrations.list_due_for_reminder(
+        due_reminders = await db.event_registrations.claim_due_for_reminder(
             now=current_time,
             remind_before=remind_before,
             limit=batch_size,
+            worker_id=worker_id,
+            claim_expired_before=current_time - claim_ttl,
         )
+        # Commit the claim right away so other workers skip these rows.
+        await session.commit()
 
-        for user_id, event in due_reminders:
-            post_url = _build_channel_post_link(
-                getattr(event, "channel_id", None),
-                getattr(event, "channel_message_id", None),
-            )
-            chat_url = (
-                getattr(event, "private_chat_invite_link", None)
-                if _can_show_event_chat_link(event)
-                else None
-            )
-            keyboard = _build_reminder_keyboard(
-                i18n=i18n,
-                post_url=post_url,
-                chat_url=chat_url,
-            )
-            text = i18n.partner.event.reminder.text(
-                event_name=html.escape(event.name or ""),
-                datetime=html.escape(format_event_datetime(event.event_datetime)),
-                address=html.escape(event.address or ""),
-            )
-
-            try:
-                await bot.send_message(
-                    chat_id=user_id,
-                    text=text,
-                    reply_markup=keyboard,
+        async with (
+            DeliveryFailureCollector(db=db) as delivery_failures,
+            DeliveryLogWriter(session_maker=session_maker) as delivery_log,
+        ):
+            for event in due_reminders:
+                post_url = _build_channel_post_link(
+                    event.channel_id,
+                    event.channel_message_id,
                 )
-                await db.event_registrations.mark_reminder_sent_if_pending(
-                    event_id=event.id,
-                    user_id=user_id,
+                chat_url = (
+                    event.private_chat_invite_link
+                    if _can_show_event_chat_link(event)
+                    else None
                 )
-            except Exception as exc:
-                await apply_delivery_error_status(
-                    db=db,
-                    user_id=user_id,
-                    error=exc,
+                keyboard = _build_reminder_keyboard(
+                    i18n=i18n,
+                    post_url=post_url,
+                    chat_url=chat_url,
                 )
-                logger.warning(
-                    "Failed to send event reminder to user %s for event %s: %s",
-                    user_id,
-                    event.id,
-                    exc,
+                text = i18n.partner.event.reminder.text(
+                    event_name=html.escape(event.name or ""),
+                    datetime=html.escape(format_event_datetime(event.event_datetime)),
+                    address=html.escape(event.address or ""),
                 )
 
+                for user_id in event.user_ids:
+                    started_at = time.monotonic()
+                    try:
+                        with send_priority(SendPriority.BULK), api_caller(
+                            ApiCaller.REMINDER
+                        ):
+                            await bot.send_message(
+                                chat_id=user_id,
+                                text=text,
+                                reply_markup=keyboard,
+                            )
+                    except Exception as exc:
+                        await db.event_registrations.release_reminder_claim(
+                            event_id=event.id,
+                            user_id=user_id,
+                            worker_id=worker_id,
+                        )
+                        await delivery_failures.add(user_id=user_id, error=exc)
+                        await delivery_log.add(
+                            event_id=event.id,
+                            user_id=user_id,
+                            kind=DeliveryKind.REMINDER,
+                            status=delivery_status_for_error(exc),
+                            latency_ms=int((time.monotonic() - started_at) * 1000),
+                            error=exc,
+                        )
+                        logger.warning(
+                            "Failed to send event reminder to user %s for event %s: %s",
+                            user_id,
+                            event.id,
+                            exc,
+                        )
+                        continue
+
+                    await delivery_log.add(
+                        event_id=event.id,
+                        user_id=user_id,
+                        kind=DeliveryKind.REMINDER,
+                        status=DeliveryStatus.DELIVERED,
+                        latency_ms=int((time.monotonic() - started_at) * 1000),
+                    )
+                    await db.event_registrations.mark_reminder_sent_if_pending(
+                        event_id=event.id,
+                        user_id=user_id,
+                    )
+
         await session.commit()
 
 
@@ -152,12 +193,14 @@ async def run_event_reminders_loop(
     translator_hub: TranslatorHub,
     interval_seconds: int = DEFAULT_EVENT_REMINDER_INTERVAL_SECONDS,
 ) -> None:
+    worker_id = build_worker_id("reminders")
     while True:
         try:
             await send_due_event_reminders_once(
                 bot=bot,
                 session_maker=session_maker,
                 translator_hub=translator_hub,
+                worker_id=worker_id,
             )
         except asyncio.CancelledError:
             raise
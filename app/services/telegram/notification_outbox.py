@@ -0,0 +1,361 @@
+import asyncio
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import timedelta
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.types import InlineKeyboardMarkup
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.bot.enums.event_registrations import EventRegistrationStatus
+from app.infrastructure.database.database.db import DB
+from app.services.telegram.bot_api_metrics import ApiCaller, api_caller
+from app.services.telegram.delivery_status import DeliveryFailureCollector
+from app.services.telegram.send_scheduler import SendPriority, send_priority
+from app.utils.datetime import now_utc
+from app.utils.workers import build_worker_id
+
+logger = logging.getLogger(__name__)
+DEFAULT_NOTIFICATION_OUTBOX_INTERVAL_SECONDS = 1
+DEFAULT_NOTIFICATION_OUTBOX_BATCH_SIZE = 100
+DEFAULT_NOTIFICATION_OUTBOX_CONCURRENCY = 10
+DEFAULT_NOTIFICATION_OUTBOX_MAX_ATTEMPTS = 5
+DEFAULT_NOTIFICATION_OUTBOX_CLAIM_TTL = timedelta(minutes=5)
+NOTIFICATION_RETRY_BASE_DELAY = timedelta(seconds=10)
+NOTIFICATION_RETRY_MAX_DELAY = timedelta(minutes=15)
+
+METHOD_SEND_MESSAGE = "send_message"
+METHOD_SEND_PHOTO = "send_photo"
+METHOD_SEND_DOCUMENT = "send_document"
+
+ON_FAILURE_REVERT_PAYMENT_PROOF = "revert_payment_proof"
+
+_KIND_CALLERS = {
+    "event_dialog_message": ApiCaller.RELAY,
+    "prepay_approved": ApiCaller.APPROVAL,
+    "prepay_declined": ApiCaller.APPROVAL,
+    "prepay_organizer_notify": ApiCaller.APPROVAL,
+    "prepay_admin_missing": ApiCaller.APPROVAL,
+    "payment_proof_vault": ApiCaller.APPROVAL,
+}
+
+
+def _dump_reply_markup(reply_markup: InlineKeyboardMarkup | None) -> dict | None:
+    if reply_markup is None:
+        return None
+    return reply_markup.model_dump(mode="json", exclude_none=True)
+
+
+async def enqueue_message(
+    *,
+    db: DB,
+    chat_id: int | str,
+    kind: str,
+    text: str,
+    reply_markup: InlineKeyboardMarkup | None = None,
+    on_failure: dict | None = None,
+) -> None:
+    await db.notification_outbox.enqueue(
+        chat_id=chat_id,
+        kind=kind,
+        payload={
+            "method": METHOD_SEND_MESSAGE,
+            "text": text,
+            "reply_markup": _dump_reply_markup(reply_markup),
+            "on_failure": on_failure,
+        },
+    )
+
+
+async def enqueue_photo(
+    *,
+    db: DB,
+    chat_id: int | str,
+    kind: str,
+    photo: str,
+    caption: str | None = None,
+    reply_markup: InlineKeyboardMarkup | None = None,
+    on_failure: dict | None = None,
+) -> None:
+    await db.notification_outbox.enqueue(
+        chat_id=chat_id,
+        kind=kind,
+        payload={
+            "method": METHOD_SEND_PHOTO,
+            "photo": photo,
+            "caption": caption,
+            "reply_markup": _dump_reply_markup(reply_markup),
+            "on_failure": on_failure,
+        },
+    )
+
+
+async def enqueue_document(
+    *,
+    db: DB,
+    chat_id: int | str,
+    kind: str,
+    document: str,
+    caption: str | None = None,
+    reply_markup: InlineKeyboardMarkup | None = None,
+    on_failure: dict | None = None,
+) -> None:
+    await db.notification_outbox.enqueue(
+        chat_id=chat_id,
+        kind=kind,
+        payload={
+            "method": METHOD_SEND_DOCUMENT,
+            "document": document,
+            "caption": caption,
+            "reply_markup": _dump_reply_markup(reply_markup),
+            "on_failure": on_failure,
+        },
+    )
+
+
+def _parse_chat_id(raw_chat_id: str) -> int | str:
+    try:
+        return int(raw_chat_id)
+    except ValueError:
+        return raw_chat_id
+
+
+async def _send_payload(*, bot: Bot, chat_id: int | str, payload: dict) -> None:
+    reply_markup = None
+    if payload.get("reply_markup"):
+        reply_markup = InlineKeyboardMarkup.model_validate(payload["reply_markup"])
+
+    method = payload.get("method")
+    if method == METHOD_SEND_PHOTO:
+        await bot.send_photo(
+            chat_id,
+            photo=payload["photo"],
+            caption=payload.get("caption"),
+            reply_markup=reply_markup,
+        )
+    elif method == METHOD_SEND_DOCUMENT:
+        await bot.send_document(
+            chat_id,
+            document=payload["document"],
+            caption=payload.get("caption"),
+            reply_markup=reply_markup,
+        )
+    elif method == METHOD_SEND_MESSAGE:
+        await bot.send_message(
+            chat_id,
+            payload["text"],
+            reply_markup=reply_markup,
+        )
+    else:
+        raise ValueError(f"Unknown notification method {method!r}")
+
+
+async def _run_failure_action(*, db: DB, notification) -> None:
+    action = (notification.payload or {}).get("on_failure")
+    if not action:
+        return
+    if action.get("action") == ON_FAILURE_REVERT_PAYMENT_PROOF:
+        reverted = await db.event_registrations.update_status_if_current(
+            event_id=action["event_id"],
+            user_id=action["user_id"],
+            current_status=EventRegistrationStatus.PAID_CONFIRM_PENDING,
+            new_status=EventRegistrationStatus.PENDING_PAYMENT,
+        )
+        if reverted and action.get("notify_text"):
+            await enqueue_message(
+                db=db,
+                chat_id=action["user_id"],
+                kind="prepay_admin_missing",
+                text=action["notify_text"],
+            )
+        return
+    logger.warning(
+        "Unknown failure action for notification_id=%s: %s",
+        notification.id,
+        action,
+    )
+
+
+@dataclass
+class _DeliveryResult:
+    notification: object
+    error: Exception | None = None
+    attempted: bool = True
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    delay = NOTIFICATION_RETRY_BASE_DELAY * (2 ** max(0, attempts - 1))
+    return min(delay, NOTIFICATION_RETRY_MAX_DELAY)
+
+
+async def _record_results(
+    *,
+    session_maker: async_sessionmaker,
+    worker_id: str,
+    results: list[_DeliveryResult],
+    max_attempts: int,
+) -> None:
+    async with session_maker() as session:
+        db = DB(session)
+        await db.notification_outbox.mark_sent(
+            notification_ids=[
+                result.notification.id
+                for result in results
+                if result.attempted and result.error is None
+            ],
+            worker_id=worker_id,
+        )
+        await db.notification_outbox.release(
+            notification_ids=[
+                result.notification.id for result in results if not result.attempted
+            ],
+            worker_id=worker_id,
+        )
+        async with DeliveryFailureCollector(db=db) as delivery_failures:
+            for result in results:
+                if not result.attempted or result.error is None:
+                    continue
+                notification = result.notification
+                error = result.error
+                error_text = str(error)[:1000]
+                chat_id = _parse_chat_id(notification.chat_id)
+                is_permanent = False
+                if isinstance(chat_id, int):
+                    is_permanent = await delivery_failures.add(
+                        user_id=chat_id,
+                        error=error,
+                    )
+
+                if isinstance(error, TelegramRetryAfter):
+                    await db.notification_outbox.reschedule(
+                        notification_id=notification.id,
+                        worker_id=worker_id,
+                        next_attempt_at=now_utc() + timedelta(seconds=error.retry_after),
+                        error=error_text,
+                    )
+                elif is_permanent or notification.attempts >= max_attempts:
+                    await db.notification_outbox.mark_failed(
+                        notification_id=notification.id,
+                        worker_id=worker_id,
+                        error=error_text,
+                    )
+                    await _run_failure_action(db=db, notification=notification)
+                else:
+                    await db.notification_outbox.reschedule(
+                        notification_id=notification.id,
+                        worker_id=worker_id,
+                        next_attempt_at=now_utc() + _retry_delay(notification.attempts),
+                        error=error_text,
+                    )
+        await session.commit()
+
+
+async def dispatch_due_notifications_once(
+    *,
+    bot: Bot,
+    session_maker: async_sessionmaker,
+    worker_id: str,
+    batch_size: int = DEFAULT_NOTIFICATION_OUTBOX_BATCH_SIZE,
+    concurrency: int = DEFAULT_NOTIFICATION_OUTBOX_CONCURRENCY,
+    max_attempts: int = DEFAULT_NOTIFICATION_OUTBOX_MAX_ATTEMPTS,
+    claim_ttl: timedelta = DEFAULT_NOTIFICATION_OUTBOX_CLAIM_TTL,
+) -> int:
+    async with session_maker() as session:
+        current_time = now_utc()
+        notifications = await DB(session).notification_outbox.claim_due(
+            now=current_time,
+            worker_id=worker_id,
+            claim_expired_before=current_time - claim_ttl,
+            limit=batch_size,
+        )
+        # Commit the claim right away so other workers skip these rows.
+        await session.commit()
+    if not notifications:
+        return 0
+
+    by_chat: dict[str, list] = defaultdict(list)
+    for notification in notifications:
+        by_chat[notification.chat_id].append(notification)
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    results: list[_DeliveryResult] = []
+
+    async def deliver_chat(chat_notifications: list) -> None:
+        # One chat is served sequentially to keep message order. After a
+        # failure the rest of the chat is put back unsent, claim_due holds it
+        # until the failed message has gone out or failed for good.
+        async with semaphore:
+            for index, notification in enumerate(chat_notifications):
+                caller = _KIND_CALLERS.get(notification.kind, ApiCaller.NOTIFICATION)
+                try:
+                    with api_caller(caller):
+                        await _send_payload(
+                            bot=bot,
+                            chat_id=_parse_chat_id(notification.chat_id),
+                            payload=notification.payload or {},
+                        )
+                except Exception as exc:
+                    logger.warning(
+                        "Failed to send notification_id=%s kind=%s to chat_id=%s: %s",
+                        notification.id,
+                        notification.kind,
+                        notification.chat_id,
+                        exc,
+                    )
+                    results.append(_DeliveryResult(notification=notification, error=exc))
+                    results.extend(
+                        _DeliveryResult(notification=pending, attempted=False)
+                        for pending in chat_notifications[index + 1 :]
+                    )
+                    return
+                else:
+                    results.append(_DeliveryResult(notification=notification))
+
+    # Rate limits and RetryAfter are handled by the bot-wide send scheduler.
+    with send_priority(SendPriority.NOTIFICATION):
+        await asyncio.gather(
+            *(
+                deliver_chat(chat_notifications)
+                for chat_notifications in by_chat.values()
+            )
+        )
+    await _record_results(
+        session_maker=session_maker,
+        worker_id=worker_id,
+        results=results,
+        max_attempts=max_attempts,
+    )
+    return len(notifications)
+
+
+async def run_notification_outbox_loop(
+    *,
+    bot: Bot,
+    session_maker: async_sessionmaker,
+    interval_seconds: float = DEFAULT_NOTIFICATION_OUTBOX_INTERVAL_SECONDS,
+    batch_size: int = DEFAULT_NOTIFICATION_OUTBOX_BATCH_SIZE,
+    concurrency: int = DEFAULT_NOTIFICATION_OUTBOX_CONCURRENCY,
+    max_attempts: int = DEFAULT_NOTIFICATION_OUTBOX_MAX_ATTEMPTS,
+) -> None:
+    worker_id = build_worker_id("outbox")
+    while True:
+        sleep_seconds: float = interval_seconds
+        try:
+            claimed = await dispatch_due_notifications_once(
+                bot=bot,
+                session_maker=session_maker,
+                worker_id=worker_id,
+                batch_size=batch_size,
+                concurrency=concurrency,
+                max_attempts=max_attempts,
+            )
+            if claimed >= batch_size:
+                sleep_seconds = 0
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Notification outbox loop failed")
+
+        await asyncio.sleep(sleep_seconds)
@@ -0,0 +1,41 @@
+import asyncio
+import logging
+
+from telethon.errors.rpcerrorlist import FloodWaitError
+
+from app.services.telegram.private_event_chats import EventPrivateChatService
+
+logger = logging.getLogger(__name__)
+DEFAULT_PRIVATE_CHAT_POOL_REFILL_INTERVAL_SECONDS = 600
+
+
+async def run_private_chat_pool_loop(
+    *,
+    event_private_chat_service: EventPrivateChatService,
+    interval_seconds: int = DEFAULT_PRIVATE_CHAT_POOL_REFILL_INTERVAL_SECONDS,
+) -> None:
+    refill_requested = event_private_chat_service.pool_refill_requested
+    while True:
+        refill_requested.clear()
+        try:
+            created = await event_private_chat_service.refill_pool()
+            if created:
+                logger.info("Private chat pool refilled with %d chats", created)
+        except FloodWaitError as exc:
+            logger.warning(
+                "Telethon flood wait while refilling private chat pool: %s sec",
+                exc.seconds,
+            )
+            # Ignore refill requests until the flood wait is over.
+            await asyncio.sleep(max(interval_seconds, exc.seconds))
+            continue
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Private chat pool loop failed")
+
+        # Wake up early when a pooled chat was handed out to an event.
+        try:
+            await asyncio.wait_for(refill_requested.wait(), timeout=interval_seconds)
+        except asyncio.TimeoutError:
+            pass
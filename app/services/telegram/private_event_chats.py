@@ -1,7 +1,10 @@
+import asyncio
 import logging
 from dataclasses import dataclass
 
-from telethon import TelegramClient
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from telethon import TelegramClient, utils
 from telethon.errors import RPCError
 from telethon.errors.rpcerrorlist import ChannelInvalidError, ChannelPrivateError, FloodWaitError
 from telethon.sessions import StringSession
@@ -9,13 +12,25 @@ from telethon.tl.functions.channels import (
     CreateChannelRequest,
     DeleteChannelRequest,
     EditAdminRequest,
+    EditTitleRequest,
     InviteToChannelRequest,
 )
 from telethon.tl.functions.messages import ExportChatInviteRequest
 from telethon.tl.types import ChatAdminRights
 
+from app.infrastructure.database.database.db import DB
+from app.services.telegram.entity_cache import (
+    TelethonEntityCache,
+    channel_key,
+    user_key,
+    username_key,
+)
+
 logger = logging.getLogger(__name__)
 
+POOL_CHAT_TITLE = "Чат мероприятия"
+POOL_CHAT_ABOUT = "Чат мероприятия клуба"
+
 
 @dataclass(frozen=True)
 class CreatedEventChat:
@@ -23,6 +38,13 @@ class CreatedEventChat:
     invite_link: str
 
 
+def _build_chat_title(*, event_id: int, event_name: str) -> str:
+    title = (event_name or "").strip() or f"Event #{event_id}"
+    if len(title) > 120:
+        title = title[:117] + "..."
+    return title
+
+
 def _to_bot_chat_id(channel_id: int) -> int:
     return int(f"-100{channel_id}")
 
@@ -55,11 +77,18 @@ class EventPrivateChatService:
         api_id: int,
         api_hash: str,
         session: str,
+        entity_cache: TelethonEntityCache | None = None,
+        session_maker: async_sessionmaker | None = None,
+        pool_size: int = 0,
     ) -> None:
         self._api_id = api_id
         self._api_hash = api_hash
         self._session = session
         self._client: TelegramClient | None = None
+        self._entity_cache = entity_cache or TelethonEntityCache()
+        self._session_maker = session_maker
+        self._pool_size = max(0, pool_size)
+        self.pool_refill_requested = asyncio.Event()
 
     @property
     def enabled(self) -> bool:
@@ -69,6 +98,10 @@ class EventPrivateChatService:
     def connected(self) -> bool:
         return self._client is not None
 
+    @property
+    def pool_enabled(self) -> bool:
+        return self._session_maker is not None and self._pool_size > 0
+
     async def connect(self) -> bool:
         if not self.enabled:
             logger.warning(
@@ -115,63 +148,47 @@ class EventPrivateChatService:
             logger.warning("Telethon private chat service is not connected")
             return None
 
+        organizer_entity = await self._resolve_organizer_entity(
+            client=client,
+            organizer_user_id=organizer_user_id,
+            organizer_username=organizer_username,
+        )
+        if organizer_entity is None:
+            logger.warning(
+                "Failed to resolve organizer entity for event %s and organizer %s",
+                event_id,
+                organizer_user_id,
+            )
+            return None
+
+        title = _build_chat_title(event_id=event_id, event_name=event_name)
+        if self.pool_enabled:
+            self.pool_refill_requested.set()
+            pooled_chat = await self._assign_pooled_chat(
+                client=client,
+                event_id=event_id,
+                title=title,
+                organizer_entity=organizer_entity,
+            )
+            if pooled_chat is not None:
+                return pooled_chat
+
         created_channel = None
+        channel_entity = None
         try:
-            title = (event_name or "").strip() or f"Event #{event_id}"
-            if len(title) > 120:
-                title = title[:117] + "..."
-
-            result = await client(
-                CreateChannelRequest(
-                    title=title,
-                    about=f"Чат мероприятия «{title}»",
-                    megagroup=True,
-                )
+            created_channel, channel_entity = await self._create_megagroup(
+                client=client,
+                title=title,
+                about=f"Чат мероприятия «{title}»",
             )
-            if not result.chats:
+            if created_channel is None:
                 logger.warning("CreateChannelRequest returned empty chats for event %s", event_id)
                 return None
-            created_channel = result.chats[0]
-            channel_entity = await client.get_input_entity(created_channel)
 
-            organizer_entity = await self._resolve_organizer_entity(
+            await self._invite_organizer(
                 client=client,
-                organizer_user_id=organizer_user_id,
-                organizer_username=organizer_username,
-            )
-            if organizer_entity is None:
-                logger.warning(
-                    "Failed to resolve organizer entity for event %s and organizer %s",
-                    event_id,
-                    organizer_user_id,
-                )
-                await self._safe_delete_channel(client=client, channel=channel_entity)
-                return None
-
-            await client(
-                InviteToChannelRequest(
-                    channel=channel_entity,
-                    users=[organizer_entity],
-                )
-            )
-            await client(
-                EditAdminRequest(
-                    channel=channel_entity,
-                    user_id=organizer_entity,
-                    admin_rights=ChatAdminRights(
-                        change_info=True,
-                        delete_messages=True,
-                        ban_users=True,
-                        invite_users=True,
-                        pin_messages=True,
-                        manage_call=True,
-                        manage_topics=True,
-                        post_stories=True,
-                        edit_stories=True,
-                        delete_stories=True,
-                    ),
-                    rank="Организатор",
-                )
+                channel_entity=channel_entity,
+                organizer_entity=organizer_entity,
             )
             invite = await client(ExportChatInviteRequest(peer=channel_entity))
             invite_link = getattr(invite, "link", None)
@@ -183,7 +200,11 @@ class EventPrivateChatService:
                     chat_id,
                     bool(invite_link),
                 )
-                await self._safe_delete_channel(client=client, channel=channel_entity)
+                await self._discard_created_channel(
+                    client=client,
+                    created_channel=created_channel,
+                    channel_entity=channel_entity,
+                )
                 return None
             return CreatedEventChat(
                 chat_id=_to_bot_chat_id(chat_id),
@@ -195,12 +216,11 @@ class EventPrivateChatService:
                 event_id,
                 exc.seconds,
             )
-            if created_channel is not None:
-                try:
-                    channel_entity = await client.get_input_entity(created_channel)
-                    await self._safe_delete_channel(client=client, channel=channel_entity)
-                except Exception:
-                    pass
+            await self._discard_created_channel(
+                client=client,
+                created_channel=created_channel,
+                channel_entity=channel_entity,
+            )
             return None
         except RPCError as exc:
             logger.warning(
@@ -208,12 +228,11 @@ class EventPrivateChatService:
                 event_id,
                 exc,
             )
-            if created_channel is not None:
-                try:
-                    channel_entity = await client.get_input_entity(created_channel)
-                    await self._safe_delete_channel(client=client, channel=channel_entity)
-                except Exception:
-                    pass
+            await self._discard_created_channel(
+                client=client,
+                created_channel=created_channel,
+                channel_entity=channel_entity,
+            )
             return None
         except Exception as exc:
             logger.warning(
@@ -221,28 +240,232 @@ class EventPrivateChatService:
                 event_id,
                 exc,
             )
-            if created_channel is not None:
-                try:
-                    channel_entity = await client.get_input_entity(created_channel)
-                    await self._safe_delete_channel(client=client, channel=channel_entity)
-                except Exception:
-                    pass
+            await self._discard_created_channel(
+                client=client,
+                created_channel=created_channel,
+                channel_entity=channel_entity,
+            )
             return None
 
-    async def delete_event_chat(self, *, chat_id: int) -> bool:
+    async def refill_pool(self) -> int:
         client = self._client
-        if client is None:
-            return False
+        if client is None or not self.pool_enabled:
+            return 0
+
+        # A session-level lock on a connection kept out of the pool, so a second
+        # refiller cannot count the same shortfall and create chats twice. Its
+        # transactions are committed at once: no transaction stays open while
+        # Telegram creates the chats, which takes minutes with flood waits.
+        engine = self._session_maker.kw["bind"]
+        async with engine.connect() as connection:
+            async with self._session_maker(bind=connection) as lock_session:
+                lock_db = DB(lock_session)
+                if not await lock_db.private_chat_pool.try_lock_refill():
+                    logger.info("Private chat pool refill is already running")
+                    return 0
+                await lock_session.commit()
+                try:
+                    return await self._refill_pool_locked(client=client)
+                finally:
+                    await lock_db.private_chat_pool.unlock_refill()
+                    await lock_session.commit()
+
+    async def _refill_pool_locked(self, *, client: TelegramClient) -> int:
+        async with self._session_maker() as session:
+            available = await DB(session).private_chat_pool.count_available()
+
+        created = 0
+        for _ in range(self._pool_size - available):
+            pooled_chat = await self._create_pool_chat(client=client)
+            if pooled_chat is None:
+                break
+            async with self._session_maker() as session:
+                await DB(session).private_chat_pool.add(
+                    chat_id=pooled_chat.chat_id,
+                    invite_link=pooled_chat.invite_link,
+                )
+                await session.commit()
+            created += 1
+        return created
+
+    async def _create_pool_chat(
+        self,
+        *,
+        client: TelegramClient,
+    ) -> CreatedEventChat | None:
+        created_channel = None
+        channel_entity = None
+        try:
+            created_channel, channel_entity = await self._create_megagroup(
+                client=client,
+                title=POOL_CHAT_TITLE,
+                about=POOL_CHAT_ABOUT,
+            )
+            if created_channel is None:
+                return None
+            invite = await client(ExportChatInviteRequest(peer=channel_entity))
+            invite_link = getattr(invite, "link", None)
+            if not invite_link:
+                await self._discard_created_channel(
+                    client=client,
+                    created_channel=created_channel,
+                    channel_entity=channel_entity,
+                )
+                return None
+            return CreatedEventChat(
+                chat_id=_to_bot_chat_id(created_channel.id),
+                invite_link=invite_link,
+            )
+        except FloodWaitError:
+            await self._discard_created_channel(
+                client=client,
+                created_channel=created_channel,
+                channel_entity=channel_entity,
+            )
+            raise
+        except Exception as exc:
+            logger.warning("Failed to create pooled private chat: %s", exc)
+            await self._discard_created_channel(
+                client=client,
+                created_channel=created_channel,
+                channel_entity=channel_entity,
+            )
+            return None
+
+    async def _assign_pooled_chat(
+        self,
+        *,
+        client: TelegramClient,
+        event_id: int,
+        title: str,
+        organizer_entity,
+    ) -> CreatedEventChat | None:
+        try:
+            async with self._session_maker() as session:
+                pooled = await DB(session).private_chat_pool.take_available()
+                await session.commit()
+        except Exception as exc:
+            logger.warning("Failed to take pooled private chat for event %s: %s", event_id, exc)
+            return None
+        if pooled is None:
+            logger.info("Private chat pool is empty, creating chat for event %s", event_id)
+            return None
+
+        channel_entity = None
+        try:
+            channel_entity = await self._resolve_channel(client=client, chat_id=pooled.chat_id)
+            await client(EditTitleRequest(channel=channel_entity, title=title))
+            await self._invite_organizer(
+                client=client,
+                channel_entity=channel_entity,
+                organizer_entity=organizer_entity,
+            )
+        except Exception as exc:
+            logger.warning(
+                "Failed to assign pooled private chat %s to event %s: %s",
+                pooled.chat_id,
+                event_id,
+                exc,
+            )
+            if channel_entity is not None:
+                await self._safe_delete_channel(client=client, channel=channel_entity)
+                await self._entity_cache.forget(channel_entity)
+            return None
+
+        logger.info(
+            "Pooled private chat %s assigned to event %s",
+            pooled.chat_id,
+            event_id,
+        )
+        return CreatedEventChat(
+            chat_id=pooled.chat_id,
+            invite_link=pooled.invite_link,
+        )
+
+    async def _create_megagroup(
+        self,
+        *,
+        client: TelegramClient,
+        title: str,
+        about: str,
+    ):
+        result = await client(
+            CreateChannelRequest(
+                title=title,
+                about=about,
+                megagroup=True,
+            )
+        )
+        if not result.chats:
+            return None, None
+        created_channel = result.chats[0]
+        channel_entity = utils.get_input_peer(created_channel)
+        await self._entity_cache.put(
+            [channel_key(created_channel.id)],
+            channel_entity,
+        )
+        return created_channel, channel_entity
+
+    async def _invite_organizer(
+        self,
+        *,
+        client: TelegramClient,
+        channel_entity,
+        organizer_entity,
+    ) -> None:
+        await client(
+            InviteToChannelRequest(
+                channel=channel_entity,
+                users=[organizer_entity],
+            )
+        )
+        await client(
+            EditAdminRequest(
+                channel=channel_entity,
+                user_id=organizer_entity,
+                admin_rights=ChatAdminRights(
+                    change_info=True,
+                    delete_messages=True,
+                    ban_users=True,
+                    invite_users=True,
+                    pin_messages=True,
+                    manage_call=True,
+                    manage_topics=True,
+                    post_stories=True,
+                    edit_stories=True,
+                    delete_stories=True,
+                ),
+                rank="Организатор",
+            )
+        )
+
+    async def _resolve_channel(self, *, client: TelegramClient, chat_id: int):
         peer_id: int | str = chat_id
         chat_id_str = str(chat_id)
         if chat_id_str.startswith("-100"):
             peer_id = int(chat_id_str[4:])
+        if isinstance(peer_id, int):
+            cached = await self._entity_cache.get(channel_key(peer_id))
+            if cached is not None:
+                return cached
+        return await client.get_input_entity(peer_id)
+
+    async def delete_event_chat(self, *, chat_id: int) -> bool:
+        client = self._client
+        if client is None:
+            return False
+        channel = None
         try:
-            channel = await client.get_input_entity(peer_id)
+            channel = await self._resolve_channel(client=client, chat_id=chat_id)
             await client(DeleteChannelRequest(channel=channel))
+            await self._entity_cache.forget(channel)
             return True
+        except FloodWaitError:
+            raise
         except (ChannelInvalidError, ChannelPrivateError):
             logger.info("Event chat %s is already unavailable", chat_id)
+            if channel is not None:
+                await self._entity_cache.forget(channel)
             return True
         except Exception as exc:
             logger.warning("Failed to delete event chat %s: %s", chat_id, exc)
@@ -255,17 +478,50 @@ class EventPrivateChatService:
         organizer_user_id: int,
         organizer_username: str | None,
     ):
+        cached = await self._entity_cache.get(user_key(organizer_user_id))
+        if cached is not None:
+            return cached
+
         username = _normalize_username(organizer_username)
         if username:
+            cached = await self._entity_cache.get(username_key(username))
+            if cached is not None and getattr(cached, "user_id", None) == organizer_user_id:
+                return cached
             try:
-                return await client.get_input_entity(username)
+                entity = await client.get_input_entity(username)
             except Exception:
                 logger.warning("Failed to resolve organizer by username %s", username)
+            else:
+                keys = [username_key(username)]
+                if getattr(entity, "user_id", None) == organizer_user_id:
+                    keys.append(user_key(organizer_user_id))
+                await self._entity_cache.put(keys, entity)
+                return entity
+
         try:
-            return await client.get_input_entity(organizer_user_id)
+            entity = await client.get_input_entity(organizer_user_id)
         except Exception:
             logger.warning("Failed to resolve organizer by user_id %s", organizer_user_id)
             return None
+        await self._entity_cache.put([user_key(organizer_user_id)], entity)
+        return entity
+
+    async def _discard_created_channel(
+        self,
+        *,
+        client: TelegramClient,
+        created_channel,
+        channel_entity,
+    ) -> None:
+        if created_channel is None:
+            return
+        try:
+            if channel_entity is None:
+                channel_entity = utils.get_input_peer(created_channel)
+            await self._safe_delete_channel(client=client, channel=channel_entity)
+            await self._entity_cache.forget(channel_entity)
+        except Exception:
+            pass
 
     async def _safe_delete_channel(
         self,
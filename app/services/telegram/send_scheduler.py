@@ -0,0 +1,302 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import (
+    CopyMessage,
+    CopyMessages,
+    ForwardMessage,
+    ForwardMessages,
+    Response,
+    SendAnimation,
+    SendAudio,
+    SendContact,
+    SendDice,
+    SendDocument,
+    SendLocation,
+    SendMediaGroup,
+    SendMessage,
+    SendPhoto,
+    SendPoll,
+    SendSticker,
+    SendVenue,
+    SendVideo,
+    SendVideoNote,
+    SendVoice,
+    TelegramMethod,
+)
+from aiogram.methods.base import TelegramType
+
+from app.infrastructure.metrics.metrics import (
+    SEND_SCHEDULER_ACTIVE_CHATS,
+    SEND_SCHEDULER_MAX_CHAT_QUEUE_DEPTH,
+    SEND_SCHEDULER_RETRY_AFTER,
+    SEND_SCHEDULER_SENT,
+    SEND_SCHEDULER_WAITING,
+)
+
+logger = logging.getLogger(__name__)
+DEFAULT_SEND_SCHEDULER_MESSAGES_PER_SECOND = 30
+DEFAULT_SEND_SCHEDULER_PRIVATE_CHAT_INTERVAL_SECONDS = 1.0
+DEFAULT_SEND_SCHEDULER_GROUP_CHAT_INTERVAL_SECONDS = 3.0
+DEFAULT_SEND_SCHEDULER_MAX_RETRIES = 3
+_LANE_PRUNE_EVERY = 1000
+
+_SCHEDULED_METHODS = (
+    CopyMessage,
+    CopyMessages,
+    ForwardMessage,
+    ForwardMessages,
+    SendAnimation,
+    SendAudio,
+    SendContact,
+    SendDice,
+    SendDocument,
+    SendLocation,
+    SendMediaGroup,
+    SendMessage,
+    SendPhoto,
+    SendPoll,
+    SendSticker,
+    SendVenue,
+    SendVideo,
+    SendVideoNote,
+    SendVoice,
+)
+
+
+class SendPriority(IntEnum):
+    INTERACTIVE = 0
+    NOTIFICATION = 1
+    BULK = 2
+
+
+_current_priority: ContextVar[SendPriority] = ContextVar(
+    "send_priority",
+    default=SendPriority.INTERACTIVE,
+)
+
+
+@contextmanager
+def send_priority(priority: SendPriority):
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+@dataclass(frozen=True)
+class SendSchedulerStats:
+    waiting_by_priority: dict[str, int]
+    active_chats: int
+    max_chat_queue_depth: int
+    sent: int
+    retry_after: int
+
+
+class _PriorityTokenBucket:
+    def __init__(self, rate_per_second: float) -> None:
+        self._rate = rate_per_second
+        self._capacity = max(1.0, rate_per_second)
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._pump_task: asyncio.Task | None = None
+
+    def waiting_by_priority(self) -> dict[SendPriority, int]:
+        counts = {priority: 0 for priority in SendPriority}
+        for priority, _, waiter in self._waiters:
+            if not waiter.done():
+                counts[SendPriority(priority)] += 1
+        return counts
+
+    def _refill(self) -> None:
+        current = time.monotonic()
+        self._tokens = min(
+            self._capacity,
+            self._tokens + (current - self._updated_at) * self._rate,
+        )
+        self._updated_at = current
+
+    async def acquire(self, priority: SendPriority) -> None:
+        if self._rate <= 0:
+            return
+        self._refill()
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._sequence), waiter))
+        if self._pump_task is None or self._pump_task.done():
+            self._pump_task = asyncio.create_task(self._pump())
+        await waiter
+
+    async def _pump(self) -> None:
+        # Hands out tokens to the most urgent waiter first, FIFO within a class.
+        while self._waiters:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                continue
+            _, _, waiter = heapq.heappop(self._waiters)
+            if waiter.done():
+                continue
+            self._tokens -= 1
+            waiter.set_result(None)
+
+
+@dataclass
+class _ChatLane:
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    waiting: int = 0
+    next_send_at: float = 0.0
+
+
+class SendScheduler(BaseRequestMiddleware):
+    def __init__(
+        self,
+        *,
+        messages_per_second: float = DEFAULT_SEND_SCHEDULER_MESSAGES_PER_SECOND,
+        private_chat_interval_seconds: float = (
+            DEFAULT_SEND_SCHEDULER_PRIVATE_CHAT_INTERVAL_SECONDS
+        ),
+        group_chat_interval_seconds: float = (
+            DEFAULT_SEND_SCHEDULER_GROUP_CHAT_INTERVAL_SECONDS
+        ),
+        max_retries: int = DEFAULT_SEND_SCHEDULER_MAX_RETRIES,
+    ) -> None:
+        self._bucket = _PriorityTokenBucket(messages_per_second)
+        self._private_chat_interval = private_chat_interval_seconds
+        self._group_chat_interval = group_chat_interval_seconds
+        self._max_retries = max(0, max_retries)
+        self._lanes: dict[int | str, _ChatLane] = {}
+        self._released = 0
+        self._sent = 0
+        self._retry_after = 0
+
+    def stats(self) -> SendSchedulerStats:
+        return SendSchedulerStats(
+            waiting_by_priority={
+                priority.name.lower(): count
+                for priority, count in self._bucket.waiting_by_priority().items()
+            },
+            active_chats=sum(1 for lane in self._lanes.values() if lane.waiting),
+            max_chat_queue_depth=max(
+                (lane.waiting for lane in self._lanes.values()),
+                default=0,
+            ),
+            sent=self._sent,
+            retry_after=self._retry_after,
+        )
+
+    def _chat_interval(self, chat_id: int | str) -> float:
+        if isinstance(chat_id, int) and chat_id > 0:
+            return self._private_chat_interval
+        return self._group_chat_interval
+
+    def _prune_lanes(self) -> None:
+        current = time.monotonic()
+        self._lanes = {
+            chat_id: lane
+            for chat_id, lane in self._lanes.items()
+            if lane.waiting or lane.next_send_at > current
+        }
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        chat_id = getattr(method, "chat_id", None)
+        if not isinstance(method, _SCHEDULED_METHODS) or chat_id is None:
+            return await make_request(bot, method)
+
+        priority = _current_priority.get()
+        lane = self._lanes.get(chat_id)
+        if lane is None:
+            lane = self._lanes[chat_id] = _ChatLane()
+        lane.waiting += 1
+        try:
+            # The lane lock is FIFO, so messages to one chat keep their order.
+            async with lane.lock:
+                return await self._send(
+                    make_request=make_request,
+                    bot=bot,
+                    method=method,
+                    chat_id=chat_id,
+                    lane=lane,
+                    priority=priority,
+                )
+        finally:
+            lane.waiting -= 1
+            self._released += 1
+            if self._released % _LANE_PRUNE_EVERY == 0:
+                self._prune_lanes()
+
+    async def _send(
+        self,
+        *,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+        chat_id: int | str,
+        lane: _ChatLane,
+        priority: SendPriority,
+    ) -> Response[TelegramType]:
+        attempt = 0
+        while True:
+            delay = lane.next_send_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await self._bucket.acquire(priority)
+            lane.next_send_at = time.monotonic() + self._chat_interval(chat_id)
+            try:
+                response = await make_request(bot, method)
+            except TelegramRetryAfter as exc:
+                self._retry_after += 1
+                SEND_SCHEDULER_RETRY_AFTER.labels(priority=priority.name.lower()).inc()
+                if attempt >= self._max_retries:
+                    raise
+                attempt += 1
+                logger.warning(
+                    "Telegram asked to retry %s to chat_id=%s after %s sec",
+                    type(method).__name__,
+                    chat_id,
+                    exc.retry_after,
+                )
+                lane.next_send_at = time.monotonic() + exc.retry_after
+                continue
+            self._sent += 1
+            SEND_SCHEDULER_SENT.labels(priority=priority.name.lower()).inc()
+            return response
+
+
+def register_send_scheduler_metrics(scheduler: SendScheduler) -> None:
+    # The gauges are read from the scheduler when Prometheus scrapes them.
+    for priority in SendPriority:
+        name = priority.name.lower()
+        SEND_SCHEDULER_WAITING.labels(priority=name).set_function(
+            lambda name=name: scheduler.stats().waiting_by_priority[name]
+        )
+    SEND_SCHEDULER_ACTIVE_CHATS.set_function(
+        lambda: scheduler.stats().active_chats
+    )
+    SEND_SCHEDULER_MAX_CHAT_QUEUE_DEPTH.set_function(
+        lambda: scheduler.stats().max_chat_queue_depth
+    )
@@ -0,0 +1,12 @@
+import os
+import socket
+import uuid
+
+WORKER_ID_MAX_LENGTH = 64
+
+
+def build_worker_id(prefix: str) -> str:
+    worker_id = f"{prefix}:{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+    if len(worker_id) <= WORKER_ID_MAX_LENGTH:
+        return worker_id
+    return worker_id[-WORKER_ID_MAX_LENGTH:]
@@ -48,6 +48,12 @@ help-command = Доступные команды:
                /start - Перезапустить бота
                /help - Посмотреть эту справку
 
+profile-usage = Использование: /profile cpu|memory [секунд, от 1 до { $max_seconds }]
+profile-started = Профилирование { $kind } запущено на { $seconds } сек., файл придёт по завершении.
+profile-busy = Профилирование уже идёт, дождитесь результата.
+profile-done = Профиль { $kind } готов.
+profile-failed = Не удалось снять профиль, подробности в логах.
+
 about-author = Об авторе
 
 about-author-link = https://t.me/toBeAnMLspecialist/935
@@ -207,7 +213,7 @@ partner-event-prepay-confirm-no = Нет
 partner-event-prepay-receipt-prompt = Отправьте чек об оплате (фото или документ).
 partner-event-prepay-receipt-invalid = Пожалуйста, отправьте чек в формате фото или документа.
 partner-event-prepay-receipt-required = Для подтверждения оплаты нужен отправленный чек.
-partner-event-prepay-sent = Спасибо! Ожидаем подтверждение оплаты от организатора.
+partner-event-prepay-sent = Спасибо! Чек передан организатору, ожидаем подтверждение оплаты. Если доставить его не получится, мы сообщим.
 partner-event-prepay-contact-button = Уточнить статус оплаты
 partner-event-prepay-contact-partner-button = Написать организатору
 partner-event-prepay-contact-partner-prompt = Напишите сообщение организатору.
@@ -221,7 +227,7 @@ partner-event-dialog-prompt-participant = Отправьте текстовое
 partner-event-dialog-text-only = Сейчас можно отправлять только текстовые сообщения.
 partner-event-dialog-validation-empty = Сообщение не должно быть пустым.
 partner-event-dialog-send-failed = Не удалось доставить сообщение. Попробуйте позже.
-partner-event-dialog-sent = Сообщение отправлено.
+partner-event-dialog-queued = Сообщение поставлено в очередь на отправку.
 partner-event-dialog-inaccessible = Диалог недоступен.
 partner-event-dialog-compose-organizer = <b>Сообщение организатору</b>
     Мероприятие: «{ $event_name }»
@@ -281,6 +287,12 @@ partner-event-reminder-text =
     Напоминаем, что вы зарегистрированы на мероприятие «{ $event_name }».
     Когда: { $datetime }
     Место: { $address }
+partner-event-digest-title = Новые мероприятия клуба:
+partner-event-digest-item =
+    • <b>{ $event_name }</b>
+    Когда: { $datetime }
+    Место: { $address }
+partner-event-digest-hint = Чтобы зарегистрироваться, нажмите на кнопку с названием мероприятия.
 partner-event-view-post-button = Смотреть пост
 partner-event-view-topic-button = Смотреть топик
 partner-event-view-chat-button = Смотреть чат
@@ -0,0 +1,325 @@
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+import ormsgpack
+from aiogram.fsm.storage.base import BaseStorage, StorageKey
+from aiogram.fsm.storage.memory import MemoryStorage
+from redis.asyncio import Redis
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.infrastructure.storage.nats_connect import connect_to_nats
+from app.infrastructure.storage.storage.nats_key_builder import NatsKeyBuilder
+from app.infrastructure.storage.storage.nats_storage import NatsStorage
+from app.infrastructure.storage.storage.redis_storage import RedisStorage
+
+# get_state, set_state, get_data and set_data of each FSM storage backend, with
+# the keys and payloads aiogram-dialog really produces: the dialog stack, a
+# dialog context and the context of the event creation form, which carries the
+# longest dialog_data in the bot. The dialog_update phase is what one update of
+# an open dialog costs: the state, the stack and the context are read, then the
+# context and the stack are written back. The state_update phase is a plain FSM
+# handler: the state, then the data of the same key, which Redis fetches in one
+# round trip.
+#
+# Memory needs no server. NATS writes to its own benchmark buckets, which are
+# deleted afterwards, and Redis to keys under the benchmark prefix, which are
+# deleted too.
+
+BOT_ID = 7_000_000_001
+USER_ID_BASE = 1_000_000_000
+KEY_PREFIX = "bench_fsm"
+STATES_BUCKET = "fsm_states_bench"
+DATA_BUCKET = "fsm_data_bench"
+BACKENDS = ("memory", "nats", "redis")
+PAYLOADS = ("stack", "context", "form")
+STATE = "EventCreateSG:description"
+
+_Operation = Callable[[BaseStorage, int], Awaitable[object]]
+
+
+def _stack_payload(user_id: int) -> dict:
+    return {
+        "_id": f"stack{user_id}",
+        "intents": ["Hb2Xq0a", "Kf81Zs3"],
+        "last_message_id": 48213,
+        "last_reply_keyboard": False,
+        "last_media_id": None,
+        "last_media_unique_id": None,
+        "last_income_media_group_id": None,
+    }
+
+
+def _context_payload(user_id: int) -> dict:
+    return {
+        "_intent_id": "Kf81Zs3",
+        "_stack_id": f"stack{user_id}",
+        "state": "StartSG:user_events",
+        "start_data": {"event_id": 1542},
+        "dialog_data": {"user_events_page": 2, "selected_user_event_id": 1542},
+        "widget_data": {},
+        "access_settings": {"user_ids": [user_id], "custom": None},
+    }
+
+
+def _form_payload(user_id: int) -> dict:
+    payload = _context_payload(user_id)
+    payload["state"] = STATE
+    payload["start_data"] = None
+    payload["dialog_data"] = {
+        "name": "Вечер настольных игр в антикафе",
+        "photo_file_id": "AgACAgIAAxkBAAIBY2Zx" + "Q" * 60,
+        "datetime": "2026-11-21T19:00:00+03:00",
+        "address": "Москва, улица Большая Дмитровка, 32, строение 1",
+        "description": "Играем в новинки и классику, правила объясняем. " * 12,
+        "price": "1500",
+        "commission_percent": 10,
+        "age_group": "25_35",
+        "publish_target": "both",
+        "edit_mode": True,
+    }
+    payload["widget_data"] = {"age_group_select": "25_35", "target_radio": "both"}
+    return payload
+
+
+_PAYLOAD_FACTORIES = {
+    "stack": _stack_payload,
+    "context": _context_payload,
+    "form": _form_payload,
+}
+
+
+def _state_key(user_id: int) -> StorageKey:
+    return StorageKey(bot_id=BOT_ID, chat_id=user_id, user_id=user_id)
+
+
+def _dialog_key(user_id: int, payload: str) -> StorageKey:
+    # The destinies aiogram-dialog uses for stacks and contexts.
+    if payload == "stack":
+        destiny = f"aiogd:stack:stack{user_id}"
+    else:
+        destiny = f"aiogd:context:{payload}{user_id}"
+    return StorageKey(
+        bot_id=BOT_ID,
+        chat_id=user_id,
+        user_id=user_id,
+        destiny=destiny,
+    )
+
+
+def _set_state(storage: BaseStorage, user_id: int):
+    return storage.set_state(_state_key(user_id), STATE)
+
+
+def _get_state(storage: BaseStorage, user_id: int):
+    return storage.get_state(_state_key(user_id))
+
+
+def _set_data(payload: str) -> _Operation:
+    factory = _PAYLOAD_FACTORIES[payload]
+
+    def operation(storage: BaseStorage, user_id: int):
+        return storage.set_data(_dialog_key(user_id, payload), factory(user_id))
+
+    return operation
+
+
+def _get_data(payload: str) -> _Operation:
+    def operation(storage: BaseStorage, user_id: int):
+        return storage.get_data(_dialog_key(user_id, payload))
+
+    return operation
+
+
+async def _dialog_update(storage: BaseStorage, user_id: int) -> None:
+    stack_key = _dialog_key(user_id, "stack")
+    context_key = _dialog_key(user_id, "form")
+    await storage.get_state(_state_key(user_id))
+    stack = await storage.get_data(stack_key)
+    context = await storage.get_data(context_key)
+    await storage.set_data(context_key, context)
+    await storage.set_data(stack_key, stack)
+
+
+async def _state_update(storage: BaseStorage, user_id: int) -> None:
+    await storage.get_state(_state_key(user_id))
+    await storage.get_data(_state_key(user_id))
+
+
+def _phases() -> list[tuple[str, _Operation]]:
+    # Writes go first, so the reads get back what the set phases wrote.
+    phases = [("set_state", _set_state), ("get_state", _get_state)]
+    for payload in PAYLOADS:
+        phases.append((f"set_data:{payload}", _set_data(payload)))
+    for payload in PAYLOADS:
+        phases.append((f"get_data:{payload}", _get_data(payload)))
+    phases.append(("state_update", _state_update))
+    phases.append(("dialog_update", _dialog_update))
+    return phases
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    ordered = sorted(values)
+    index = round(percent / 100 * (len(ordered) - 1))
+    return ordered[index]
+
+
+async def _run_phase(
+    storage: BaseStorage,
+    operation: _Operation,
+    *,
+    operations: int,
+    concurrency: int,
+    users: int,
+    seed: int,
+) -> dict:
+    latencies: list[float] = []
+    per_worker = max(1, operations // concurrency)
+
+    async def worker(index: int) -> None:
+        rng = random.Random(seed + index)
+        for _ in range(per_worker):
+            user_id = USER_ID_BASE + rng.randrange(users)
+            started_at = time.perf_counter()
+            await operation(storage, user_id)
+            latencies.append((time.perf_counter() - started_at) * 1000)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker(index) for index in range(concurrency)))
+    wall_seconds = time.perf_counter() - started_at
+    return {
+        "operations": len(latencies),
+        "ops_per_second": len(latencies) / wall_seconds,
+        "p50_ms": _percentile(latencies, 50),
+        "p95_ms": _percentile(latencies, 95),
+        "p99_ms": _percentile(latencies, 99),
+        "max_ms": max(latencies),
+    }
+
+
+async def _prefill(storage: BaseStorage, *, users: int) -> None:
+    # Every user gets its state and payloads before the timed phases start,
+    # so reads of users the set phases did not reach still hit a key.
+    for start in range(0, users, 500):
+        writes = []
+        for index in range(start, min(users, start + 500)):
+            user_id = USER_ID_BASE + index
+            writes.append(_set_state(storage, user_id))
+            writes.append(
+                storage.set_data(_state_key(user_id), {"payment_proof_event_id": 1542})
+            )
+            writes.extend(_set_data(payload)(storage, user_id) for payload in PAYLOADS)
+        await asyncio.gather(*writes)
+
+
+async def _create_storage(backend: str, args) -> BaseStorage:
+    key_builder = NatsKeyBuilder(prefix=KEY_PREFIX, with_destiny=True, separator="_")
+    if backend == "memory":
+        return MemoryStorage()
+    if backend == "nats":
+        nc, js = await connect_to_nats(servers=args.nats_servers)
+        return await NatsStorage(
+            nc=nc,
+            js=js,
+            key_builder=key_builder,
+            fsm_states_bucket=STATES_BUCKET,
+            fsm_data_bucket=DATA_BUCKET,
+        ).create_storage()
+    return RedisStorage(redis=Redis.from_url(args.redis_url), key_builder=key_builder)
+
+
+async def _cleanup(storage: BaseStorage) -> None:
+    if isinstance(storage, NatsStorage):
+        for bucket in (STATES_BUCKET, DATA_BUCKET):
+            await storage.js.delete_key_value(bucket)
+    elif isinstance(storage, RedisStorage):
+        keys = [key async for key in storage.redis.scan_iter(f"{KEY_PREFIX}_*")]
+        for start in range(0, len(keys), 1000):
+            await storage.redis.delete(*keys[start : start + 1000])
+    await storage.close()
+
+
+async def _bench_backend(backend: str, args) -> dict:
+    storage = await _create_storage(backend, args)
+    results = {}
+    try:
+        await _prefill(storage, users=args.users)
+        for name, operation in _phases():
+            results[name] = await _run_phase(
+                storage,
+                operation,
+                operations=args.operations,
+                concurrency=args.concurrency,
+                users=args.users,
+                seed=args.seed,
+            )
+            print(
+                f"{backend:<8}{name:<20}{results[name]['operations']:>8}"
+                f"{results[name]['ops_per_second']:>11.0f}"
+                f"{results[name]['p50_ms']:>9.3f}{results[name]['p95_ms']:>9.3f}"
+                f"{results[name]['p99_ms']:>9.3f}{results[name]['max_ms']:>9.3f}"
+            )
+    finally:
+        await _cleanup(storage)
+    return results
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--nats-servers",
+        nargs="*",
+        default=[],
+        help="NATS servers, the NATS backend is skipped when omitted",
+    )
+    parser.add_argument(
+        "--redis-url",
+        help="redis://host:port/db, the Redis backend is skipped when omitted",
+    )
+    parser.add_argument("--backends", nargs="*", choices=BACKENDS, default=BACKENDS)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--operations", type=int, default=20_000, help="Per phase")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--output", type=Path, help="Write the results as JSON")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+
+    backends = [
+        backend
+        for backend in args.backends
+        if backend == "memory"
+        or (backend == "nats" and args.nats_servers)
+        or (backend == "redis" and args.redis_url)
+    ]
+    sizes = ", ".join(
+        f"{payload} {len(ormsgpack.packb(factory(USER_ID_BASE)))} B"
+        for payload, factory in _PAYLOAD_FACTORIES.items()
+    )
+    print(
+        f"users={args.users}, operations={args.operations}, "
+        f"concurrency={args.concurrency}, msgpack payloads: {sizes}"
+    )
+    print(
+        f"{'backend':<8}{'phase':<20}{'ops':>8}{'ops/s':>11}{'p50 ms':>9}"
+        f"{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}"
+    )
+    results = {}
+    for backend in backends:
+        results[backend] = await _bench_backend(backend, args)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,148 @@
+import argparse
+import gc
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.bot.enums.roles import UserRole
+from app.infrastructure.database.models.base import BaseModel
+from app.infrastructure.database.models.events import EventsModel
+from app.infrastructure.database.models.users import UsersModel
+from app.infrastructure.database.rows import EventSummary, UserSummary
+
+# Compares ORM hydration against the slotted read rows on an in-memory
+# SQLite database, so only row building is measured, not the network.
+
+
+def _seed(session: Session, rows: int) -> None:
+    now = datetime.now(timezone.utc)
+    session.execute(
+        insert(UsersModel),
+        [
+            {
+                "user_id": 100_000 + index,
+                "username": f"user{index}",
+                "created": now,
+                "role": UserRole.USER,
+                "is_alive": True,
+                "is_blocked": False,
+            }
+            for index in range(rows)
+        ],
+    )
+    session.execute(
+        insert(EventsModel),
+        [
+            {
+                "organizer_user_id": 100_000 + index % 50,
+                "name": f"Event {index}",
+                "event_datetime": now + timedelta(hours=index),
+                "address": "Somewhere street, 1",
+                "description": "Long event description. " * 40,
+                "price": "1000",
+                "commission_percent": 10,
+                "fingerprint": f"fp-{index}",
+                "publish_target": "both",
+                "created": now,
+            }
+            for index in range(rows)
+        ],
+    )
+    session.commit()
+
+
+def _load_orm_users(session: Session) -> list:
+    return list(session.execute(select(UsersModel)).scalars())
+
+
+def _load_user_summaries(session: Session) -> list:
+    stmt = select(
+        UsersModel.user_id,
+        UsersModel.username,
+        UsersModel.role,
+        UsersModel.is_alive,
+        UsersModel.is_blocked,
+    )
+    return [UserSummary(*row) for row in session.execute(stmt)]
+
+
+def _load_orm_events(session: Session) -> list:
+    return list(session.execute(select(EventsModel)).scalars())
+
+
+def _load_event_summaries(session: Session) -> list:
+    stmt = select(
+        EventsModel.id,
+        EventsModel.organizer_user_id,
+        EventsModel.name,
+        EventsModel.event_datetime,
+    )
+    return [EventSummary(*row) for row in session.execute(stmt)]
+
+
+def _measure(engine, loader, *, rows: int, repeat: int) -> tuple[float, float]:
+    timings = []
+    for _ in range(repeat):
+        with Session(engine) as session:
+            gc.collect()
+            started_at = time.perf_counter()
+            loader(session)
+            timings.append(time.perf_counter() - started_at)
+
+    # Memory is taken with the session still open, the identity map
+    # keeps ORM instances alive the same way it does in a handler.
+    with Session(engine) as session:
+        gc.collect()
+        tracemalloc.start()
+        loaded = loader(session)
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del loaded
+
+    return statistics.median(timings) / rows * 1_000_000, current / rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    BaseModel.metadata.create_all(
+        engine,
+        tables=[UsersModel.__table__, EventsModel.__table__],
+    )
+    with Session(engine) as session:
+        _seed(session, args.rows)
+
+    cases = [
+        ("users: UsersModel", _load_orm_users),
+        ("users: UserSummary", _load_user_summaries),
+        ("events: EventsModel", _load_orm_events),
+        ("events: EventSummary", _load_event_summaries),
+    ]
+    print(f"rows={args.rows}, repeat={args.repeat}")
+    print(f"{'case':<24}{'us/row':>10}{'bytes/row':>12}")
+    for name, loader in cases:
+        per_row_us, per_row_bytes = _measure(
+            engine,
+            loader,
+            rows=args.rows,
+            repeat=args.repeat,
+        )
+        print(f"{name:<24}{per_row_us:>10.2f}{per_row_bytes:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
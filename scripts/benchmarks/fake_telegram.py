@@ -0,0 +1,208 @@
+import asyncio
+import itertools
+import json
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+
+from aiogram import Bot
+from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import TelegramAPIServer
+from aiogram.enums import ParseMode
+from aiohttp import web
+
+# A stand-in for the Telegram Bot API, good enough for the benchmarks: every
+# method succeeds with a plausible result, unless latency, RetryAfter or
+# blocked-user errors are injected. Keyboards sent to each chat are kept so a
+# benchmark can press the buttons the bot really rendered.
+
+BOT_USER_ID = 7_000_000_001
+BOT_TOKEN = f"{BOT_USER_ID}:fake-telegram-benchmark-token"
+
+_MESSAGE_METHODS = {
+    "sendmessage",
+    "sendphoto",
+    "senddocument",
+    "sendvideo",
+    "sendanimation",
+    "editmessagetext",
+    "editmessagecaption",
+    "editmessagemedia",
+    "editmessagereplymarkup",
+}
+
+
+@dataclass
+class FakeTelegramConfig:
+    latency_ms: float = 0.0
+    retry_after_rate: float = 0.0
+    retry_after_seconds: int = 1
+    blocked_rate: float = 0.0
+    blocked_chat_ids: set[int] = field(default_factory=set)
+    seed: int = 0
+
+
+@dataclass
+class SentKeyboard:
+    message_id: int
+    reply_markup: dict
+
+
+class FakeTelegram:
+    def __init__(self, config: FakeTelegramConfig | None = None) -> None:
+        self.config = config or FakeTelegramConfig()
+        self.calls: Counter = Counter()
+        self.delivered: Counter = Counter()
+        self.retry_after: Counter = Counter()
+        self.blocked: Counter = Counter()
+        self.keyboards: dict[int, SentKeyboard] = {}
+        self._random = random.Random(self.config.seed)
+        self._message_ids = itertools.count(1)
+        self._runner: web.AppRunner | None = None
+        self.base_url = ""
+
+    async def start(self, *, host: str = "127.0.0.1", port: int = 0) -> None:
+        app = web.Application()
+        app.router.add_post("/bot{token}/{method}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host=host, port=port)
+        await site.start()
+        bound_port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://{host}:{bound_port}"
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def create_bot(self) -> Bot:
+        session = AiohttpSession(api=TelegramAPIServer.from_base(self.base_url))
+        return Bot(
+            token=BOT_TOKEN,
+            session=session,
+            default=DefaultBotProperties(parse_mode=ParseMode.HTML),
+        )
+
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    def reset_counters(self) -> None:
+        for counter in (self.calls, self.delivered, self.retry_after, self.blocked):
+            counter.clear()
+
+    async def _read_params(self, request: web.Request) -> dict:
+        if request.content_type == "application/json":
+            return await request.json()
+        params = {}
+        for key, value in (await request.post()).items():
+            params[key] = value if isinstance(value, str) else "<file>"
+        return params
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        method = request.match_info["method"].lower()
+        params = await self._read_params(request)
+        self.calls[method] += 1
+        if self.config.latency_ms:
+            await asyncio.sleep(self.config.latency_ms / 1000)
+
+        chat_id = _parse_chat_id(params.get("chat_id"))
+        if chat_id is not None and method not in {"getchat", "getchatmember"}:
+            if (
+                chat_id in self.config.blocked_chat_ids
+                or self._random.random() < self.config.blocked_rate
+            ):
+                self.blocked[method] += 1
+                return _error(403, "Forbidden: bot was blocked by the user")
+            if self._random.random() < self.config.retry_after_rate:
+                self.retry_after[method] += 1
+                seconds = self.config.retry_after_seconds
+                return _error(
+                    429,
+                    f"Too Many Requests: retry after {seconds}",
+                    parameters={"retry_after": seconds},
+                )
+
+        self.delivered[method] += 1
+        return web.json_response({"ok": True, "result": self._result(method, params)})
+
+    def _result(self, method: str, params: dict):
+        if method == "getme":
+            return _bot_user()
+        if method in {"copymessage", "forwardmessage"}:
+            return {"message_id": next(self._message_ids)}
+        if method in _MESSAGE_METHODS:
+            return self._message(method, params)
+        if method == "sendmediagroup":
+            return [self._message("sendphoto", params)]
+        return True
+
+    def _message(self, method: str, params: dict) -> dict:
+        chat_id = _parse_chat_id(params.get("chat_id")) or 0
+        message_id = _parse_chat_id(params.get("message_id"))
+        if message_id is None or not method.startswith("edit"):
+            message_id = next(self._message_ids)
+        message = {
+            "message_id": message_id,
+            "date": int(time.time()),
+            "chat": {"id": chat_id, "type": "private" if chat_id > 0 else "supergroup"},
+            "from": _bot_user(),
+        }
+        if "text" in params:
+            message["text"] = params["text"]
+        if "caption" in params:
+            message["caption"] = params["caption"]
+        if method == "sendphoto":
+            message["photo"] = [
+                {
+                    "file_id": f"photo-{message_id}",
+                    "file_unique_id": f"photo-{message_id}",
+                    "width": 640,
+                    "height": 480,
+                }
+            ]
+        elif method == "senddocument":
+            message["document"] = {
+                "file_id": f"document-{message_id}",
+                "file_unique_id": f"document-{message_id}",
+            }
+
+        reply_markup = params.get("reply_markup")
+        if isinstance(reply_markup, str):
+            reply_markup = json.loads(reply_markup)
+        if reply_markup and "inline_keyboard" in reply_markup:
+            message["reply_markup"] = reply_markup
+            self.keyboards[chat_id] = SentKeyboard(
+                message_id=message_id,
+                reply_markup=reply_markup,
+            )
+        return message
+
+
+def _parse_chat_id(value) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _bot_user() -> dict:
+    return {
+        "id": BOT_USER_ID,
+        "is_bot": True,
+        "first_name": "Benchmark bot",
+        "username": "benchmark_bot",
+    }
+
+
+def _error(
+    code: int,
+    description: str,
+    *,
+    parameters: dict | None = None,
+) -> web.Response:
+    body = {"ok": False, "error_code": code, "description": description}
+    if parameters:
+        body["parameters"] = parameters
+    return web.json_response(body, status=code)
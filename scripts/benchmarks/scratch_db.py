@@ -0,0 +1,35 @@
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.infrastructure.database.connect_to_pg import get_pg_pool
+from app.infrastructure.database.models.base import BaseModel
+from config.config import settings
+
+# Shared by the benchmarks that need a real database. The scratch database is
+# expected to be migrated with `alembic upgrade head`: the models lack some of
+# the constraints the repositories rely on, such as ON CONFLICT targets.
+
+
+async def connect_scratch_db(
+    postgres_url: str,
+    *,
+    pool_size: int,
+) -> tuple[AsyncEngine, async_sessionmaker]:
+    url = make_url(postgres_url)
+    return await get_pg_pool(
+        db_name=url.database,
+        host=url.host,
+        port=url.port or 5432,
+        user=url.username,
+        password=url.password,
+        pool_size=pool_size,
+        max_overflow=0,
+        prepare_threshold=settings.postgres.prepare_threshold,
+        prepared_max=settings.postgres.prepared_max,
+    )
+
+
+async def reset_database(session: AsyncSession) -> None:
+    tables = ", ".join(table.name for table in BaseModel.metadata.sorted_tables)
+    await session.execute(text(f"TRUNCATE {tables} RESTART IDENTITY CASCADE"))